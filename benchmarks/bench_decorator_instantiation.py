@@ -0,0 +1,81 @@
+"""Per-instantiation cost of a decorated config class.
+
+Run: python benchmarks/bench_decorator_instantiation.py
+Prints one JSON object per case to stdout.
+"""
+
+import json
+import sys
+import tempfile
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+
+from dature import LoadMetadata, load
+
+NUMBER = 2_000
+REPEATS = 5
+
+
+@dataclass
+class Database:
+    host: str
+    port: int
+    user: str
+    password: str
+
+
+@dataclass
+class Cache:
+    url: str
+    ttl: int
+
+
+def _per_call_us(stmt: object) -> float:
+    timings = timeit.repeat(stmt, number=NUMBER, repeat=REPEATS)  # type: ignore[call-overload]
+    return min(timings) / NUMBER * 1_000_000
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        config_file = Path(tmp) / "config.json"
+        config_file.write_text(
+            json.dumps(
+                {
+                    "name": "service",
+                    "debug": False,
+                    "workers": 8,
+                    "db": {"host": "localhost", "port": 5432, "user": "app", "password": "secret"},
+                    "cache": {"url": "redis://localhost", "ttl": 60},
+                    "tags": ["a", "b", "c"],
+                },
+            ),
+        )
+
+        @load(LoadMetadata(file_=str(config_file)))
+        @dataclass
+        class Config:
+            name: str
+            debug: bool
+            workers: int
+            db: Database
+            cache: Cache
+            tags: list[str]
+
+        Config()  # type: ignore[call-arg]
+
+        cases = {
+            "no_args": Config,
+            "one_override": lambda: Config(workers=4),  # type: ignore[call-arg]
+        }
+        for case, stmt in cases.items():
+            result = {
+                "benchmark": "decorator_instantiation",
+                "case": case,
+                "microseconds_per_call": round(_per_call_us(stmt), 3),
+            }
+            sys.stdout.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Env-var expansion over a 100k-string config.
+
+Run: python benchmarks/bench_env_expand.py
+Prints one JSON object per case to stdout.
+"""
+
+import json
+import os
+import sys
+import time
+
+from dature.expansion.env_expand import expand_env_vars
+from dature.types import JSONValue
+
+STRING_COUNT = 100_000
+SECTION_SIZE = 1_000
+REPEATS = 5
+
+os.environ["BENCH_HOST"] = "localhost"
+os.environ["BENCH_PORT"] = "8080"
+
+
+def _build_config(marker_ratio: float) -> JSONValue:
+    marker_every = int(1 / marker_ratio) if marker_ratio else 0
+    sections: dict[str, JSONValue] = {}
+    for section_idx in range(STRING_COUNT // SECTION_SIZE):
+        section: dict[str, JSONValue] = {}
+        for key_idx in range(SECTION_SIZE):
+            n = section_idx * SECTION_SIZE + key_idx
+            if marker_every and n % marker_every == 0:
+                section[f"key_{key_idx}"] = f"http://$BENCH_HOST:${{BENCH_PORT}}/api/{n % 50}"
+            else:
+                section[f"key_{key_idx}"] = f"plain value number {n}"
+        sections[f"section_{section_idx}"] = section
+    return sections
+
+
+def _best_of(data: JSONValue) -> float:
+    timings: list[float] = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        expand_env_vars(data, mode="default")
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    for case, marker_ratio in (("no_markers", 0.0), ("10pct_markers", 0.1), ("all_markers", 1.0)):
+        data = _build_config(marker_ratio)
+        seconds = _best_of(data)
+        result = {
+            "benchmark": "env_expand",
+            "case": case,
+            "strings": STRING_COUNT,
+            "seconds": round(seconds, 6),
+            "strings_per_second": round(STRING_COUNT / seconds),
+        }
+        sys.stdout.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
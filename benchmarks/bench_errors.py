@@ -0,0 +1,86 @@
+"""Cost of reporting a config in which every field is invalid, for every loader.
+
+Run: python benchmarks/bench_errors.py
+Prints one JSON object per case to stdout.
+
+"handle_ms" covers the failing conversion, error extraction and source location
+resolution in ``handle_load_errors``; "format_ms" is ``str()`` of the raised error.
+"capped" uses the default ``error_display.max_located_errors``, "located" locates every error.
+"""
+
+import json
+import sys
+import tempfile
+import time
+from contextlib import suppress
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from adaptix.load_error import AggregateLoadError, LoadError
+from synthetic import Format, Shape, formats, invalid
+
+from dature.config import config, configure
+from dature.errors.exceptions import DatureConfigError
+from dature.errors.formatter import handle_load_errors
+from dature.errors.location import ErrorContext, clear_location_cache
+from dature.loading.context import build_error_ctx
+from dature.sources_loader.base import BaseLoader
+from dature.types import JSONValue
+
+REPEATS = 3
+ERROR_COUNTS = (1, 10, 100, 1_000, 10_000)
+
+
+def _fail(loader: BaseLoader, ctx: ErrorContext, target: type[Any], raw: JSONValue) -> tuple[float, float]:
+    # Parsed file content is cached; drop it so every repeat parses the file again
+    clear_location_cache()
+    started = time.perf_counter()
+    try:
+        handle_load_errors(func=lambda: loader.transform_to_dataclass(raw, target), ctx=ctx)
+    except DatureConfigError as exc:
+        handled = time.perf_counter()
+        str(exc)
+        return handled - started, time.perf_counter() - handled
+    msg = "the synthetic config was expected to fail"
+    raise AssertionError(msg)
+
+
+def _run_case(fmt: Format, path: Path | None, shape: Shape, mode: str) -> dict[str, Any]:
+    target = fmt.target(shape)
+    loader = fmt.make_loader()
+    raw = loader.load_raw(path if path is not None else Path())
+    # The first failure builds the retort; keep it out of the timings
+    with suppress(AggregateLoadError, LoadError):
+        loader.transform_to_dataclass(raw, target)
+
+    ctx = build_error_ctx(fmt.metadata(path), target.__name__)
+    timings = [_fail(loader, ctx, target, raw) for _ in range(REPEATS)]
+    return {
+        "benchmark": "errors",
+        "loader": fmt.name,
+        "errors": shape.leaves,
+        "mode": mode,
+        "handle_ms": round(min(handle for handle, _ in timings) * 1000, 3),
+        "format_ms": round(min(formatting for _, formatting in timings) * 1000, 3),
+    }
+
+
+def main() -> None:
+    default_display = config.error_display
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for fmt in formats():
+            for count in ERROR_COUNTS:
+                shape = replace(invalid(count), name=f"invalid_{count}")
+                path = fmt.write(shape, directory)
+                with fmt.environ(shape):
+                    for mode, max_located in (("capped", default_display.max_located_errors), ("located", count)):
+                        configure(error_display=replace(default_display, max_located_errors=max_located))
+                        result = _run_case(fmt, path, shape, mode)
+                        sys.stdout.write(json.dumps(result) + "\n")
+    configure(error_display=default_display)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Parse, pre-processing and conversion throughput of every loader on synthetic configs.
+
+Run: python benchmarks/bench_loaders.py
+Prints one JSON object per case to stdout.
+
+Shapes come from synthetic.py: "wide" (one level of many scalars), "deep" (a long chain of
+nested sections) and "list_heavy" (long lists and lists of records). Loaders whose optional
+dependency is not installed are skipped.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from synthetic import SHAPES, Format, Shape, formats, source_bytes
+
+from dature.load_stats import load_stats_scope
+from dature.sources_loader.base import BaseLoader
+
+REPEATS = 5
+
+
+def _measure(loader: BaseLoader, path: Path, target: type[Any]) -> dict[str, float]:
+    best: dict[str, float] = {}
+    for _ in range(REPEATS):
+        with load_stats_scope(target.__name__) as stats:
+            loader.transform_to_dataclass(loader.load_raw(path), target)
+        for phase in ("load", "pre_processing", "conversion"):
+            seconds = stats.phase_seconds(phase)
+            best[phase] = min(best.get(phase, seconds), seconds)
+    return best
+
+
+def _run_case(fmt: Format, path: Path | None, shape: Shape) -> dict[str, Any]:
+    loader = fmt.make_loader()
+    target = fmt.target(shape)
+    source = path if path is not None else Path()
+    # The first conversion builds the retort; keep it out of the timings
+    loader.transform_to_dataclass(loader.load_raw(source), target)
+    best = _measure(loader, source, target)
+
+    size = source_bytes(path, shape)
+    return {
+        "benchmark": "loaders",
+        "loader": fmt.name,
+        "shape": shape.name,
+        "leaves": shape.leaves,
+        "bytes": size,
+        "load_ms": round(best["load"] * 1000, 3),
+        "pre_processing_ms": round(best["pre_processing"] * 1000, 3),
+        "conversion_ms": round(best["conversion"] * 1000, 3),
+        "parse_mb_per_s": round(size / best["load"] / 1_000_000, 3) if best["load"] else None,
+        "leaves_per_s": round(shape.leaves / sum(best.values())),
+    }
+
+
+def main() -> None:
+    shapes = [make_shape() for make_shape in SHAPES]
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for fmt in formats():
+            for shape in shapes:
+                path = fmt.write(shape, directory)
+                with fmt.environ(shape):
+                    result = _run_case(fmt, path, shape)
+                sys.stdout.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
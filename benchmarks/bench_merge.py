@@ -0,0 +1,189 @@
+"""Scaling of multi-source loading: merge strategies, conflict detection and field origins.
+
+Run: python benchmarks/bench_merge.py
+Prints one JSON object per case to stdout.
+
+Each sweep varies one dimension (sources, keys per level, nesting depth or list length)
+around a baseline and keeps the others fixed, so the growth of every stage is visible
+on its own. "peak_kib" is the tracemalloc peak of a single call. "_load_and_merge" gets
+loaders prepared once, as in decorator mode, so retort construction stays out of the numbers.
+"""
+
+import json
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, make_dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from dature import F, FieldGroup, FieldMergeStrategy, LoadMetadata, MergeMetadata, MergeRule, MergeStrategy
+from dature.load_report import compute_field_origins
+from dature.loading.multi import _load_and_merge, _MergePatchContext
+from dature.loading.source_loading import load_sources
+from dature.merging.deep_merge import raise_on_conflict
+from dature.types import JSONValue
+
+REPEATS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class Scale:
+    sources: int = 10
+    keys: int = 20
+    depth: int = 2
+    list_length: int = 10
+
+
+BASELINE = Scale()
+SWEEPS: dict[str, tuple[int, ...]] = {
+    "sources": (2, 10, 50, 200),
+    "keys": (5, 20, 100, 500),
+    "depth": (1, 2, 8, 32),
+    "list_length": (10, 100, 1_000, 10_000),
+}
+
+
+def _schema(scale: Scale) -> type[Any]:
+    child: type[Any] | None = None
+    for level in reversed(range(scale.depth)):
+        specs: list[Any] = [(f"key_{k}", int) for k in range(scale.keys)]
+        specs.append(("items", list[int]))
+        if child is not None:
+            specs.append(("nested", child))
+        child = make_dataclass(f"Level{level}", specs)
+    assert child is not None  # noqa: S101
+    return child
+
+
+def _document(scale: Scale, level: int, value: int) -> dict[str, JSONValue]:
+    document: dict[str, JSONValue] = {f"key_{k}": value + k for k in range(scale.keys)}
+    document["items"] = list(range(value, value + scale.list_length))
+    if level + 1 < scale.depth:
+        document["nested"] = _document(scale, level + 1, value)
+    return document
+
+
+def _write_sources(scale: Scale, directory: Path, *, identical: bool) -> tuple[LoadMetadata, ...]:
+    # Identical documents keep RAISE_ON_CONFLICT on its success path, which walks every key
+    sources: list[LoadMetadata] = []
+    for index in range(scale.sources):
+        path = directory / f"source_{index}.json"
+        path.write_text(json.dumps(_document(scale, 0, 0 if identical else index)))
+        sources.append(LoadMetadata(file_=str(path)))
+    return tuple(sources)
+
+
+def _longest(values: list[JSONValue]) -> JSONValue:
+    return max(values, key=lambda value: len(value) if isinstance(value, list) else 0)
+
+
+def _variants(schema: type[Any], sources: tuple[LoadMetadata, ...]) -> dict[str, MergeMetadata]:
+    base = MergeMetadata(sources=sources)
+    variants = {f"strategy={strategy.value}": replace(base, strategy=strategy) for strategy in MergeStrategy}
+    variants.update(
+        {
+            f"field_merge={strategy.value}": replace(base, field_merges=(MergeRule(F[schema].items, strategy),))
+            for strategy in FieldMergeStrategy
+        },
+    )
+    variants["field_merge=callable"] = replace(base, field_merges=(MergeRule(F[schema].items, _longest),))
+    variants["field_groups"] = replace(base, field_groups=(FieldGroup(F[schema].key_0, F[schema].items),))
+    return variants
+
+
+def _measure(stmt: Callable[[], object]) -> tuple[float, int]:
+    timer = timeit.Timer(stmt)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(number=number, repeat=REPEATS)) / number
+
+    tracemalloc.start()
+    try:
+        stmt()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def _emit(stage: str, case: str, dimension: str, scale: Scale, stmt: Callable[[], object]) -> None:
+    seconds, peak = _measure(stmt)
+    result = {
+        "benchmark": "merge",
+        "stage": stage,
+        "case": case,
+        "dimension": dimension,
+        "sources": scale.sources,
+        "keys": scale.keys,
+        "depth": scale.depth,
+        "list_length": scale.list_length,
+        "ms": round(seconds * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+    sys.stdout.write(json.dumps(result) + "\n")
+
+
+def _run_scale(dimension: str, scale: Scale, directory: Path) -> None:
+    schema = _schema(scale)
+    varying = _write_sources(scale, directory / "varying", identical=False)
+    identical = _write_sources(scale, directory / "identical", identical=True)
+
+    for case, merge_meta in _variants(schema, varying).items():
+        if merge_meta.strategy == MergeStrategy.RAISE_ON_CONFLICT:
+            merge_meta = replace(merge_meta, sources=identical)  # noqa: PLW2901
+        loaders = _MergePatchContext._prepare_loaders(merge_meta=merge_meta, cls=schema)  # noqa: SLF001
+        _emit(
+            "load_and_merge",
+            case,
+            dimension,
+            scale,
+            lambda merge_meta=merge_meta, loaders=loaders: _load_and_merge(
+                merge_meta=merge_meta,
+                dataclass_=schema,
+                loaders=loaders,
+            ),
+        )
+
+    loaded = load_sources(
+        merge_meta=MergeMetadata(sources=identical),
+        dataclass_name=schema.__name__,
+        dataclass_=schema,
+    )
+    _emit(
+        "raise_on_conflict",
+        "no_conflicts",
+        dimension,
+        scale,
+        lambda: raise_on_conflict(loaded.raw_dicts, loaded.source_ctxs, schema.__name__),
+    )
+
+    raw_dicts = load_sources(
+        merge_meta=MergeMetadata(sources=varying),
+        dataclass_name=schema.__name__,
+        dataclass_=schema,
+    ).raw_dicts
+    for strategy in (MergeStrategy.LAST_WINS, MergeStrategy.FIRST_WINS):
+        _emit(
+            "compute_field_origins",
+            f"strategy={strategy.value}",
+            dimension,
+            scale,
+            lambda strategy=strategy: compute_field_origins(raw_dicts=raw_dicts, strategy=strategy),
+        )
+
+
+def main() -> None:
+    for dimension, values in SWEEPS.items():
+        for value in values:
+            scale = replace(BASELINE, **{dimension: value})
+            with tempfile.TemporaryDirectory() as tmp:
+                directory = Path(tmp)
+                (directory / "varying").mkdir()
+                (directory / "identical").mkdir()
+                _run_scale(dimension, scale, directory)
+
+
+if __name__ == "__main__":
+    main()
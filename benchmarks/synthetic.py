@@ -0,0 +1,318 @@
+"""Synthetic dataclass schemas and matching documents for the loader benchmarks.
+
+Every shape is built as a pair: a dataclass type and a plain dict document that loads
+into it. Writers render the document in each supported format, and ``formats()`` pairs
+them with the loader classes that read them back.
+"""
+
+import json
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, make_dataclass
+from pathlib import Path
+from typing import Any
+
+from dature import LoadMetadata
+from dature.sources_loader.base import BaseLoader
+from dature.sources_loader.docker_secrets import DockerSecretsLoader
+from dature.sources_loader.env_ import EnvFileLoader, EnvLoader
+from dature.sources_loader.ini_ import IniLoader
+from dature.sources_loader.json_ import JsonLoader
+
+type Document = dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class Shape:
+    name: str
+    schema: type[Any]
+    document: Document
+    leaves: int
+
+
+def _scalar_fields(prefix: str, count: int, seed: int) -> tuple[list[tuple[str, type]], Document]:
+    kinds: tuple[tuple[type, Callable[[int], Any]], ...] = (
+        (str, lambda n: f"value-{n}"),
+        (int, lambda n: n * 7),
+        (float, lambda n: n + 0.5),
+        (bool, lambda n: n % 2 == 0),
+    )
+    specs: list[tuple[str, type]] = []
+    values: Document = {}
+    for i in range(count):
+        kind, make_value = kinds[i % len(kinds)]
+        name = f"{prefix}_{i}"
+        specs.append((name, kind))
+        values[name] = make_value(seed + i)
+    return specs, values
+
+
+def wide(field_count: int = 500) -> Shape:
+    """One flat level of mixed scalar fields."""
+    specs, document = _scalar_fields("field", field_count, 0)
+    return Shape("wide", make_dataclass("Wide", specs), document, field_count)
+
+
+def deep(depth: int = 30, fields_per_level: int = 5) -> Shape:
+    """A chain of nested sections with a few scalars at every level."""
+    specs: list[Any]
+    specs, document = _scalar_fields("field", fields_per_level, (depth - 1) * fields_per_level)
+    child_type = make_dataclass(f"Level{depth - 1}", specs)
+    for level in reversed(range(depth - 1)):
+        specs, parent = _scalar_fields("field", fields_per_level, level * fields_per_level)
+        specs.append(("child", child_type))
+        parent["child"] = document
+        child_type = make_dataclass(f"Level{level}", specs)
+        document = parent
+    return Shape("deep", child_type, document, depth * fields_per_level)
+
+
+def list_heavy(list_count: int = 20, list_length: int = 100, record_count: int = 200) -> Shape:
+    """Long lists of ints and a list of small records."""
+    record_specs, _ = _scalar_fields("attr", 4, 0)
+    record_type = make_dataclass("Record", record_specs)
+
+    specs: list[Any] = [(f"numbers_{i}", list[int], field(default_factory=list)) for i in range(list_count)]
+    specs.append(("records", list[record_type], field(default_factory=list)))  # type: ignore[valid-type]
+    document: Document = {f"numbers_{i}": list(range(i, i + list_length)) for i in range(list_count)}
+    document["records"] = [_scalar_fields("attr", 4, n)[1] for n in range(record_count)]
+    return Shape(
+        "list_heavy",
+        make_dataclass("ListHeavy", specs),
+        document,
+        list_count * list_length + record_count * 4,
+    )
+
+
+def invalid(field_count: int) -> Shape:
+    """Int fields that all hold non-numeric strings, so every field fails conversion."""
+    specs = [(f"field_{i}", int) for i in range(field_count)]
+    document: Document = {f"field_{i}": f"bad-{i}" for i in range(field_count)}
+    return Shape("invalid", make_dataclass("Invalid", specs), document, field_count)
+
+
+SHAPES: tuple[Callable[[], Shape], ...] = (wide, deep, list_heavy)
+
+
+# --- writers ---------------------------------------------------------------------------------
+
+
+def _yaml_scalar(value: Any) -> str:  # noqa: ANN401
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return json.dumps(value)
+    return repr(value)
+
+
+def _yaml_lines(data: Any, indent: int) -> list[str]:  # noqa: ANN401
+    pad = " " * indent
+    lines: list[str] = []
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if isinstance(value, (dict, list)) and value:
+                lines.append(f"{pad}{key}:")
+                lines.extend(_yaml_lines(value, indent + 2))
+            else:
+                lines.append(f"{pad}{key}: {_yaml_scalar(value) if value != [] else '[]'}")
+        return lines
+
+    for item in data:
+        if isinstance(item, dict):
+            item_lines = _yaml_lines(item, indent + 2)
+            lines.append(f"{pad}- {item_lines[0].lstrip()}")
+            lines.extend(item_lines[1:])
+        else:
+            lines.append(f"{pad}- {_yaml_scalar(item)}")
+    return lines
+
+
+def to_yaml(document: Document) -> str:
+    return "\n".join(_yaml_lines(document, 0)) + "\n"
+
+
+def _toml_value(value: Any) -> str:  # noqa: ANN401
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return json.dumps(value)
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{key} = {_toml_value(item)}" for key, item in value.items()) + "}"
+    if isinstance(value, list):
+        return "[" + ", ".join(_toml_value(item) for item in value) + "]"
+    return repr(value)
+
+
+def _toml_table(data: Document, path: str, lines: list[str]) -> None:
+    tables = {key: value for key, value in data.items() if isinstance(value, dict)}
+    for key, value in data.items():
+        if key not in tables:
+            lines.append(f"{key} = {_toml_value(value)}")
+    for key, value in tables.items():
+        child_path = f"{path}.{key}" if path else key
+        lines.append(f"\n[{child_path}]")
+        _toml_table(value, child_path, lines)
+
+
+def to_toml(document: Document) -> str:
+    lines: list[str] = []
+    _toml_table(document, "", lines)
+    return "\n".join(lines) + "\n"
+
+
+def _flat_value(value: Any) -> str:  # noqa: ANN401
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return str(value)
+
+
+def flatten(document: Document, separator: str, prefix: str = "") -> dict[str, str]:
+    """Leaf values as strings keyed by their joined path, the way env-style sources see them."""
+    flat: dict[str, str] = {}
+    for key, value in document.items():
+        name = f"{prefix}{separator}{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, separator, name))
+        else:
+            flat[name] = _flat_value(value)
+    return flat
+
+
+def _ini_sections(data: Document, section: str, lines: list[str]) -> None:
+    lines.append(f"[{section}]")
+    nested = {key: value for key, value in data.items() if isinstance(value, dict)}
+    lines.extend(f"{key} = {_flat_value(value)}" for key, value in data.items() if key not in nested)
+    lines.append("")
+    for key, value in nested.items():
+        _ini_sections(value, f"{section}.{key}", lines)
+
+
+def to_ini(document: Document, section: str) -> str:
+    lines: list[str] = []
+    _ini_sections(document, section, lines)
+    return "\n".join(lines)
+
+
+def to_env_file(document: Document, prefix: str) -> str:
+    return "".join(f"{prefix}{key.upper()}={value}\n" for key, value in flatten(document, "__").items())
+
+
+def write_docker_secrets(document: Document, directory: Path) -> None:
+    directory.mkdir()
+    for key, value in flatten(document, "__").items():
+        (directory / key).write_text(value)
+
+
+# --- formats ---------------------------------------------------------------------------------
+
+ENV_PREFIX = "BENCH_"
+INI_SECTION = "app"
+
+
+@dataclass(frozen=True, slots=True)
+class Format:
+    """A loader class and how to write a shape so that it reads the shape back."""
+
+    name: str
+    loader: type[BaseLoader]
+    write: Callable[[Shape, Path], Path | None]
+    prefix: str | None = None
+
+    def make_loader(self) -> BaseLoader:
+        return self.loader(prefix=self.prefix)
+
+    def metadata(self, path: Path | None) -> LoadMetadata:
+        return LoadMetadata(file_=str(path) if path is not None else None, loader=self.loader, prefix=self.prefix)
+
+    def target(self, shape: Shape) -> type[Any]:
+        # INI has no top-level scalars: the document lives in one root section
+        if self.loader is IniLoader:
+            root: type[Any] = make_dataclass(f"{shape.schema.__name__}Root", [(INI_SECTION, shape.schema)])
+            return root
+        return shape.schema
+
+    @contextmanager
+    def environ(self, shape: Shape) -> Iterator[None]:
+        """Export the shape as environment variables for the env loader; a no-op for the others."""
+        variables = env_variables(shape) if self.loader is EnvLoader else {}
+        os.environ.update(variables)
+        try:
+            yield
+        finally:
+            for key in variables:
+                del os.environ[key]
+
+
+def env_variables(shape: Shape) -> dict[str, str]:
+    return {f"{ENV_PREFIX}{key.upper()}": value for key, value in flatten(shape.document, "__").items()}
+
+
+def source_bytes(path: Path | None, shape: Shape) -> int:
+    """Size of what the loader reads: the file, the secrets directory or the exported variables."""
+    if path is None:
+        return sum(len(key) + len(value) for key, value in env_variables(shape).items())
+    if path.is_dir():
+        return sum(child.stat().st_size for child in path.iterdir())
+    return path.stat().st_size
+
+
+def _text_writer(suffix: str, render: Callable[[Document], str]) -> Callable[[Shape, Path], Path]:
+    def write(shape: Shape, directory: Path) -> Path:
+        path = directory / f"{shape.name}{suffix}"
+        path.write_text(render(shape.document))
+        return path
+
+    return write
+
+
+def _write_docker_secrets(shape: Shape, directory: Path) -> Path:
+    path = directory / f"{shape.name}_secrets"
+    write_docker_secrets(shape.document, path)
+    return path
+
+
+def _optional_formats() -> list[Format]:
+    found: list[Format] = []
+    try:
+        from dature.sources_loader.json5_ import Json5Loader  # noqa: PLC0415
+    except ImportError:
+        pass
+    else:
+        found.append(
+            Format("json5", Json5Loader, _text_writer(".json5", lambda document: json.dumps(document, indent=2))),
+        )
+    try:
+        from dature.sources_loader.yaml_ import Yaml11Loader, Yaml12Loader  # noqa: PLC0415
+    except ImportError:
+        pass
+    else:
+        write_yaml = _text_writer(".yaml", to_yaml)
+        found.extend([Format("yaml1.1", Yaml11Loader, write_yaml), Format("yaml1.2", Yaml12Loader, write_yaml)])
+    try:
+        from dature.sources_loader.toml_ import Toml10Loader, Toml11Loader  # noqa: PLC0415
+    except ImportError:
+        pass
+    else:
+        write_toml = _text_writer(".toml", to_toml)
+        found.extend([Format("toml1.0", Toml10Loader, write_toml), Format("toml1.1", Toml11Loader, write_toml)])
+    return found
+
+
+def formats() -> list[Format]:
+    """Every loader whose dependencies are installed."""
+    return [
+        Format("json", JsonLoader, _text_writer(".json", lambda document: json.dumps(document, indent=2))),
+        *_optional_formats(),
+        Format("ini", IniLoader, _text_writer(".ini", lambda document: to_ini(document, INI_SECTION))),
+        Format("env", EnvLoader, lambda _shape, _directory: None, prefix=ENV_PREFIX),
+        Format(
+            "envfile",
+            EnvFileLoader,
+            _text_writer(".env", lambda document: to_env_file(document, ENV_PREFIX)),
+            prefix=ENV_PREFIX,
+        ),
+        Format("docker_secrets", DockerSecretsLoader, _write_docker_secrets),
+    ]
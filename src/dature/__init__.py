@@ -1,8 +1,14 @@
-from dature.config import configure
-from dature.field_path import F
-from dature.load_report import get_load_report
-from dature.main import load
-from dature.metadata import FieldGroup, FieldMergeStrategy, LoadMetadata, MergeMetadata, MergeRule, MergeStrategy
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dature.config import configure
+    from dature.field_path import F
+    from dature.load_report import get_load_report
+    from dature.load_stats import get_load_stats
+    from dature.main import load, load_many, preload, warmup
+    from dature.metadata import FieldGroup, FieldMergeStrategy, LoadMetadata, MergeMetadata, MergeRule, MergeStrategy
+    from dature.profiling import profile
 
 __all__ = [
     "F",
@@ -14,5 +20,44 @@ __all__ = [
     "MergeStrategy",
     "configure",
     "get_load_report",
+    "get_load_stats",
     "load",
+    "load_many",
+    "preload",
+    "profile",
+    "warmup",
 ]
+
+# Loading machinery (adaptix, loaders, masking) is imported on first access, so that
+# `from dature import LoadMetadata` stays cheap
+_LAZY_ATTRS: dict[str, str] = {
+    "F": "dature.field_path",
+    "FieldGroup": "dature.metadata",
+    "FieldMergeStrategy": "dature.metadata",
+    "LoadMetadata": "dature.metadata",
+    "MergeMetadata": "dature.metadata",
+    "MergeRule": "dature.metadata",
+    "MergeStrategy": "dature.metadata",
+    "configure": "dature.config",
+    "get_load_report": "dature.load_report",
+    "get_load_stats": "dature.load_stats",
+    "load": "dature.main",
+    "load_many": "dature.main",
+    "preload": "dature.main",
+    "profile": "dature.profiling",
+    "warmup": "dature.main",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,9 +1,18 @@
-from dataclasses import dataclass
-from typing import Annotated
+import json
+import os
+from dataclasses import dataclass, fields, replace
+from functools import cache
+from typing import TYPE_CHECKING, Annotated, Any, get_args, get_origin, get_type_hints
 
 from dature.validators.number import Ge
 from dature.validators.string import MaxLength, MinLength
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from dature.hooks import LoadHook
+    from dature.protocols import ValidatorProtocol
+
 
 @dataclass(frozen=True, slots=True)
 class MaskingConfig:
@@ -32,12 +41,14 @@ class MaskingConfig:
 class ErrorDisplayConfig:
     max_visible_lines: Annotated[int, Ge(value=1)] = 3
     max_line_length: Annotated[int, Ge(value=1)] = 80
+    max_located_errors: Annotated[int, Ge(value=0)] = 100
 
 
 @dataclass(frozen=True, slots=True)
 class LoadingConfig:
     cache: bool = True
     debug: bool = False
+    lazy: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -47,11 +58,111 @@ class DatureConfig:
     loading: LoadingConfig = LoadingConfig()
 
 
+_ENV_PREFIX = "DATURE_"
+_ENV_SPLIT = "__"
+_TRUE_STRINGS = frozenset(("true", "yes", "on"))
+_FALSE_STRINGS = frozenset(("false", "no", "off"))
+
+
+@dataclass(frozen=True, slots=True)
+class _EnvField:
+    group: str
+    name: str
+    kind: Any
+    validators: "tuple[ValidatorProtocol, ...]"
+
+
+@cache
+def _env_fields() -> dict[str, _EnvField]:
+    result: dict[str, _EnvField] = {}
+    for group_name, group_type in get_type_hints(DatureConfig).items():
+        hints = get_type_hints(group_type, include_extras=True)
+        for field in fields(group_type):
+            hint = hints[field.name]
+            validators: tuple[Any, ...] = ()
+            if get_origin(hint) is Annotated:
+                hint, *metadata = get_args(hint)
+                validators = tuple(metadata)
+            env_name = f"{_ENV_PREFIX}{group_name.upper()}{_ENV_SPLIT}{field.name.upper()}"
+            result[env_name] = _EnvField(
+                group=group_name,
+                name=field.name,
+                kind=get_origin(hint) or hint,
+                validators=validators,
+            )
+    return result
+
+
+# Only unambiguous values parse here; anything else raises ValueError and goes through the full loader
+def _parse_env_value(kind: Any, raw: str) -> Any:  # noqa: ANN401
+    if "$" in raw or "%" in raw:
+        raise ValueError(raw)
+
+    if kind is str:
+        try:
+            json.loads(raw)
+        except ValueError:
+            return raw
+        raise ValueError(raw)
+
+    if kind is bool:
+        lowered = raw.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+        raise ValueError(raw)
+
+    if kind is int:
+        return int(raw)
+
+    if kind is tuple:
+        parsed = json.loads(raw)
+        if isinstance(parsed, list) and all(isinstance(item, str) for item in parsed):
+            return tuple(parsed)
+
+    raise ValueError(raw)
+
+
+# Reads the known DATURE_* variables directly; None means the full loader is needed
+def _bootstrap_config() -> DatureConfig | None:
+    env_fields = _env_fields()
+    # The full loader also matches other spellings, such as DATURE_loading__debug
+    if any(name.startswith(_ENV_PREFIX) and name not in env_fields for name in os.environ):
+        return None
+
+    overrides: dict[str, dict[str, Any]] = {}
+    for env_name, env_field in env_fields.items():
+        raw = os.environ.get(env_name)
+        if raw is None:
+            continue
+        try:
+            value = _parse_env_value(env_field.kind, raw)
+        except ValueError:
+            return None
+        if not all(validator.get_validator_func()(value) for validator in env_field.validators):
+            return None
+        overrides.setdefault(env_field.group, {})[env_field.name] = value
+
+    if not overrides:
+        return DatureConfig()
+
+    groups = {
+        group_name: replace(getattr(DatureConfig(), group_name), **group_overrides)
+        for group_name, group_overrides in overrides.items()
+    }
+    return DatureConfig(**groups)
+
+
 def _load_config() -> DatureConfig:
+    bootstrapped = _bootstrap_config()
+    if bootstrapped is not None:
+        return bootstrapped
+
     from dature.main import load  # noqa: PLC0415
     from dature.metadata import LoadMetadata  # noqa: PLC0415
 
-    return load(LoadMetadata(prefix="DATURE_"), DatureConfig)
+    return load(LoadMetadata(prefix=_ENV_PREFIX), DatureConfig)
 
 
 class _ConfigProxy:
@@ -96,7 +207,13 @@ def configure(
     masking: MaskingConfig | None = None,
     error_display: ErrorDisplayConfig | None = None,
     loading: LoadingConfig | None = None,
+    hooks: "Iterable[LoadHook] | None" = None,
 ) -> None:
+    if hooks is not None:
+        from dature.hooks import set_hooks  # noqa: PLC0415
+
+        set_hooks(hooks)
+
     current = config.ensure_loaded()
     if masking is None:
         masking = current.masking
@@ -0,0 +1,218 @@
+import contextlib
+import hashlib
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from dature.loading.multi import merge_load_validated
+from dature.metadata import LoadMetadata, MergeMetadata
+from dature.protocols import DataclassInstance
+from dature.sources_loader.socket_ import SUBSCRIBE_REQUEST, Snapshot, encode_data, encode_snapshot
+from dature.types import JSONValue
+
+_VERSION_LENGTH = 16
+# How long close() may wait for serve_forever to notice the shutdown
+_POLL_INTERVAL = 0.1
+# A subscriber that does not take a push within this many seconds is dropped
+_SEND_TIMEOUT = 5.0
+
+
+def _make_snapshot(data: JSONValue) -> Snapshot:
+    version = hashlib.sha256(encode_data(data)).hexdigest()[:_VERSION_LENGTH]
+    return Snapshot(version=version, data=data)
+
+
+def _remove_stale_socket(path: Path) -> None:
+    # A socket file left by a crashed server refuses connections; a live one must not be taken over
+    if not path.exists():
+        return
+    if not stat.S_ISSOCK(path.stat().st_mode):
+        msg = f"{path} exists and is not a socket"
+        raise FileExistsError(msg)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except ConnectionRefusedError:
+            path.unlink()
+            return
+    msg = f"Another config server is listening on {path}"
+    raise FileExistsError(msg)
+
+
+# One push thread per client, so a slow client only delays itself
+class _Subscriber:
+    def __init__(self, connection: socket.socket) -> None:
+        self.connection = connection
+        # Only sends time out; the handler keeps blocking on reads until the client disconnects
+        seconds, fraction = divmod(_SEND_TIMEOUT, 1)
+        timeval = struct.pack("@ll", int(seconds), int(fraction * 1_000_000))
+        connection.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, timeval)
+        self._condition = threading.Condition()
+        self._pending: bytes | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="dature-config-push", daemon=True)
+        self._thread.start()
+
+    def push(self, message: bytes) -> None:
+        with self._condition:
+            # Every snapshot holds the whole data, so a client that lags behind only needs the newest
+            self._pending = message
+            self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        with contextlib.suppress(OSError):
+            self.connection.shutdown(socket.SHUT_RDWR)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._closed or self._pending is None:
+                    return
+                message, self._pending = self._pending, None
+            try:
+                self.connection.sendall(message)
+            except OSError:
+                # Timed out or gone: the shutdown ends the handler's read, which removes the subscriber
+                self.close()
+                return
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "_UnixServer"
+
+    def handle(self) -> None:
+        request = self.rfile.readline()
+        config_server = self.server.config_server
+        if request != SUBSCRIBE_REQUEST:
+            self.wfile.write(encode_snapshot(config_server.snapshot))
+            return
+
+        subscriber = config_server._add_subscriber(self.connection)  # noqa: SLF001
+        try:
+            # Subscribers only listen; the read returns when the client disconnects or is dropped
+            while self.rfile.readline():
+                pass
+        finally:
+            config_server._remove_subscriber(subscriber)  # noqa: SLF001
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, config_server: "ConfigServer[Any]") -> None:
+        self.config_server = config_server
+        super().__init__(str(socket_path), _RequestHandler)
+
+
+class ConfigServer[T: DataclassInstance]:
+    def __init__(
+        self,
+        metadata: LoadMetadata | MergeMetadata | tuple[LoadMetadata, ...],
+        dataclass_: type[T],
+        *,
+        socket_path: str | Path,
+    ) -> None:
+        if isinstance(metadata, LoadMetadata):
+            metadata = (metadata,)
+        if isinstance(metadata, tuple):
+            metadata = MergeMetadata(sources=metadata)
+        self._merge_meta = metadata
+        self._dataclass = dataclass_
+        self.socket_path = Path(socket_path)
+        self._lock = threading.Lock()
+        self._subscribers: list[_Subscriber] = []
+        self._snapshot = _make_snapshot(self._load())
+        self._server: _UnixServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def _load(self) -> JSONValue:
+        return merge_load_validated(self._merge_meta, self._dataclass, debug=False).merged_raw
+
+    @property
+    def snapshot(self) -> Snapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    def start(self) -> None:
+        _remove_stale_socket(self.socket_path)
+        # The merged data may hold secrets: only the owner may connect. The socket is bound in a
+        # private 0700 directory and moved into place once it is 0600, so it is never reachable earlier
+        with tempfile.TemporaryDirectory(prefix=".dature-", dir=self.socket_path.parent) as private_dir:
+            private_path = Path(private_dir) / "s"
+            self._server = _UnixServer(private_path, self)
+            private_path.chmod(0o600)
+            private_path.replace(self.socket_path)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            args=(_POLL_INTERVAL,),
+            name=f"dature-config-server-{self.socket_path.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    # A failed load raises and keeps serving the previous snapshot
+    def reload(self) -> bool:
+        snapshot = _make_snapshot(self._load())
+        message = encode_snapshot(snapshot)
+        with self._lock:
+            if snapshot.version == self._snapshot.version:
+                return False
+            self._snapshot = snapshot
+            # Queueing under the lock keeps concurrent reloads from reaching clients out of order;
+            # the sends happen in each subscriber's thread
+            for subscriber in self._subscribers:
+                subscriber.push(message)
+        return True
+
+    def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            subscriber.close()
+        self._server.server_close()
+        self.socket_path.unlink(missing_ok=True)
+        self._server = None
+        self._thread = None
+
+    def _add_subscriber(self, connection: socket.socket) -> _Subscriber:
+        subscriber = _Subscriber(connection)
+        # Queueing under the lock keeps a concurrent reload from pushing before the first snapshot
+        with self._lock:
+            subscriber.push(encode_snapshot(self._snapshot))
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def _remove_subscriber(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+        subscriber.close()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -61,7 +61,7 @@ def _format_location(loc: SourceLocation) -> list[str]:
             lines.extend(_format_content_lines(loc.line_content))
         return lines
 
-    if loc.source_type == "docker_secrets":
+    if loc.source_type in ("docker_secrets", "kubernetes_secrets"):
         lines.append(f"   └── SECRET FILE '{loc.file_path}'")
         return lines
 
@@ -155,6 +155,17 @@ class MissingEnvVarError(DatureError):
         )
 
 
+# Stands in for the errors past error_display.max_located_errors, which are only counted
+class OmittedErrorsError(DatureError):
+    def __init__(self, *, count: int) -> None:
+        self.count = count
+        super().__init__(f"... and {count} more errors")
+
+
+def _error_count(errors: Sequence[BaseException]) -> int:
+    return sum(exc.count if isinstance(exc, OmittedErrorsError) else 1 for exc in errors)
+
+
 class DatureConfigError(ExceptionGroup[DatureError]):
     dataclass_name: str
 
@@ -165,7 +176,7 @@ class DatureConfigError(ExceptionGroup[DatureError]):
     ) -> Self:
         obj = super().__new__(
             cls,
-            f"{dataclass_name} loading errors ({len(errors)})",
+            f"{dataclass_name} loading errors ({_error_count(errors)})",
             errors,
         )
         obj.dataclass_name = dataclass_name
@@ -183,7 +194,7 @@ class DatureConfigError(ExceptionGroup[DatureError]):
 
     def __str__(self) -> str:
         lines: list[str] = []
-        lines.append(f"{self.dataclass_name} loading errors ({len(self.exceptions)})")
+        lines.append(f"{self.dataclass_name} loading errors ({_error_count(self.exceptions)})")
         lines.append("")
 
         for exc in self.exceptions:
@@ -15,12 +15,14 @@ from adaptix.load_error import (
 )
 from adaptix.struct_trail import get_trail
 
+from dature.config import config
 from dature.errors.exceptions import (
     DatureConfigError,
     DatureError,
     EnvVarExpandError,
     FieldLoadError,
     MissingEnvVarError,
+    OmittedErrorsError,
 )
 from dature.errors.location import ErrorContext, read_file_content, resolve_source_location
 from dature.masking.masking import mask_value
@@ -118,17 +120,19 @@ def handle_load_errors[T](
     except (AggregateLoadError, LoadError) as exc:
         file_content = read_file_content(ctx.file_path)
         field_errors = extract_field_errors(exc, secret_paths=ctx.secret_paths)
-        enriched: list[FieldLoadError] = []
-        for fe in field_errors:
-            location = resolve_source_location(fe.field_path, ctx, file_content)
-            enriched.append(
-                FieldLoadError(
-                    field_path=fe.field_path,
-                    message=fe.message,
-                    input_value=fe.input_value,
-                    location=location,
-                ),
+        # Past the cap errors are only counted, so a badly broken config still fails fast
+        max_located = config.error_display.max_located_errors
+        enriched: list[DatureError] = [
+            FieldLoadError(
+                field_path=fe.field_path,
+                message=fe.message,
+                input_value=fe.input_value,
+                location=resolve_source_location(fe.field_path, ctx, file_content),
             )
+            for fe in field_errors[:max_located]
+        ]
+        if len(field_errors) > max_located:
+            enriched.append(OmittedErrorsError(count=len(field_errors) - max_located))
         raise DatureConfigError(ctx.dataclass_name, enriched) from exc
 
 
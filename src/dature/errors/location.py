@@ -1,3 +1,7 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
@@ -28,6 +32,114 @@ def read_file_content(file_path: Path | None) -> str | None:
     return None
 
 
+class _RecentIndexes[K, V]:
+    # Keyed by a digest of the file content, so the keys never hold the content itself
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._indexes: OrderedDict[K, V] = OrderedDict()
+
+    def get_or_build(self, key: K, build: Callable[[], V]) -> V:
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+
+        index = build()
+        with self._lock:
+            self._indexes[key] = index
+            if len(self._indexes) > self.maxsize:
+                self._indexes.popitem(last=False)
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+class _LastDigest:
+    # Every error of one load passes the same content string, so it is hashed once per load
+    entry: tuple[str, bytes] | None = None
+
+
+def _content_digest(file_content: str) -> bytes:
+    entry = _LastDigest.entry
+    if entry is not None and entry[0] is file_content:
+        return entry[1]
+    digest = hashlib.blake2b(file_content.encode(errors="surrogatepass"), digest_size=16).digest()
+    _LastDigest.entry = (file_content, digest)
+    return digest
+
+
+# Finders index the whole file up front; every error of one load shares that parse
+_recent_path_finders: _RecentIndexes[tuple[type[PathFinder], bytes], PathFinder] = _RecentIndexes(8)
+_recent_content_lines: _RecentIndexes[bytes, tuple[str, ...]] = _RecentIndexes(8)
+_recent_env_line_indexes: _RecentIndexes[bytes, dict[str, tuple[int, str]]] = _RecentIndexes(8)
+
+# Indexes built by warm_location_cache live outside the small LRU caches above, one content
+# version per source file: warming a file again replaces the indexes of its previous version
+_warmed_digests: dict[Path, bytes] = {}
+_warmed_path_finders: dict[tuple[type[PathFinder], bytes], PathFinder] = {}
+_warmed_content_lines: dict[bytes, tuple[str, ...]] = {}
+_warmed_env_line_indexes: dict[bytes, dict[str, tuple[int, str]]] = {}
+
+
+def _path_finder(path_finder_class: type[PathFinder], file_content: str) -> PathFinder:
+    key = (path_finder_class, _content_digest(file_content))
+    finder = _warmed_path_finders.get(key)
+    if finder is None:
+        return _recent_path_finders.get_or_build(key, lambda: path_finder_class(file_content))
+    return finder
+
+
+def _content_lines(file_content: str) -> tuple[str, ...]:
+    digest = _content_digest(file_content)
+    lines = _warmed_content_lines.get(digest)
+    if lines is None:
+        return _recent_content_lines.get_or_build(digest, lambda: tuple(file_content.splitlines()))
+    return lines
+
+
+def _drop_warmed(digest: bytes) -> None:
+    _warmed_content_lines.pop(digest, None)
+    _warmed_env_line_indexes.pop(digest, None)
+    for key in [key for key in _warmed_path_finders if key[1] == digest]:
+        del _warmed_path_finders[key]
+
+
+def warm_location_cache(ctx: ErrorContext) -> None:
+    if ctx.file_path is None or (ctx.loader_type != "envfile" and ctx.path_finder_class is None):
+        return
+    file_content = read_file_content(ctx.file_path)
+    if not file_content:
+        return
+
+    digest = _content_digest(file_content)
+    source = ctx.file_path.absolute()
+    previous = _warmed_digests.get(source)
+    _warmed_digests[source] = digest
+    if previous is not None and previous != digest and previous not in _warmed_digests.values():
+        _drop_warmed(previous)
+
+    if ctx.path_finder_class is None:
+        _warmed_env_line_indexes[digest] = _build_env_line_index(file_content)
+        return
+    _warmed_path_finders[(ctx.path_finder_class, digest)] = ctx.path_finder_class(file_content)
+    _warmed_content_lines[digest] = tuple(file_content.splitlines())
+
+
+def clear_location_cache() -> None:
+    _LastDigest.entry = None
+    _recent_path_finders.clear()
+    _recent_content_lines.clear()
+    _recent_env_line_indexes.clear()
+    _warmed_digests.clear()
+    _warmed_path_finders.clear()
+    _warmed_content_lines.clear()
+    _warmed_env_line_indexes.clear()
+
+
 def _build_env_var_name(
     field_path: list[str],
     prefix: str | None,
@@ -46,7 +158,16 @@ def _build_search_path(field_path: list[str], prefix: str | None) -> list[str]:
     return prefix_parts + field_path
 
 
-def _find_env_line(content: str, var_name: str) -> SourceLocation:
+def _env_line_index(content: str) -> dict[str, tuple[int, str]]:
+    digest = _content_digest(content)
+    index = _warmed_env_line_indexes.get(digest)
+    if index is None:
+        return _recent_env_line_indexes.get_or_build(digest, lambda: _build_env_line_index(content))
+    return index
+
+
+def _build_env_line_index(content: str) -> dict[str, tuple[int, str]]:
+    index: dict[str, tuple[int, str]] = {}
     for i, line in enumerate(content.splitlines(), 1):
         stripped = line.strip()
         if not stripped or stripped.startswith("#"):
@@ -54,14 +175,21 @@ def _find_env_line(content: str, var_name: str) -> SourceLocation:
         if "=" not in stripped:
             continue
         key = stripped.split("=", 1)[0].strip()
-        if key == var_name:
-            return SourceLocation(
-                source_type="envfile",
-                file_path=None,
-                line_range=LineRange(start=i, end=i),
-                line_content=[stripped],
-                env_var_name=var_name,
-            )
+        index.setdefault(key, (i, stripped))
+    return index
+
+
+def _find_env_line(content: str, var_name: str) -> SourceLocation:
+    found = _env_line_index(content).get(var_name)
+    if found is not None:
+        line_number, stripped = found
+        return SourceLocation(
+            source_type="envfile",
+            file_path=None,
+            line_range=LineRange(start=line_number, end=line_number),
+            line_content=[stripped],
+            env_var_name=var_name,
+        )
     return SourceLocation(
         source_type="envfile",
         file_path=None,
@@ -104,16 +232,16 @@ def _resolve_file_location(
         return _empty_file_location(loader_type, file_path)
 
     search_path = _build_search_path(field_path, prefix)
-    finder = path_finder_class(file_content)
+    finder = _path_finder(path_finder_class, file_content)
     line_range = finder.find_line_range(search_path)
     if line_range is None:
         return _empty_file_location(loader_type, file_path)
 
-    lines = file_content.splitlines()
+    lines = _content_lines(file_content)
     content_lines: list[str] | None = None
     if 0 < line_range.start <= len(lines):
         end = min(line_range.end, len(lines))
-        raw = lines[line_range.start - 1 : end]
+        raw = list(lines[line_range.start - 1 : end])
         content_lines = _strip_common_indent(raw)
 
     return SourceLocation(
@@ -137,7 +265,7 @@ def _secret_overlaps_lines(
     prefix: str | None,
     path_finder_class: type[PathFinder],
 ) -> bool:
-    finder = path_finder_class(file_content)
+    finder = _path_finder(path_finder_class, file_content)
     for secret_path in secret_paths:
         search_path = _build_search_path(secret_path.split("."), prefix)
         secret_range = finder.find_line_range(search_path)
@@ -185,13 +313,13 @@ def resolve_source_location(
             env_var_name=env_var_name,
         )
 
-    if ctx.loader_type == "docker_secrets":
+    if ctx.loader_type in ("docker_secrets", "kubernetes_secrets"):
         secret_name = ctx.split_symbols.join(field_path)
         if ctx.prefix is not None:
             secret_name = ctx.prefix + secret_name
         secret_file = ctx.file_path / secret_name if ctx.file_path is not None else None
         return SourceLocation(
-            source_type="docker_secrets",
+            source_type=ctx.loader_type,
             file_path=secret_file,
             line_range=None,
             line_content=None,
@@ -1,7 +1,10 @@
-import os
 import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 
 from dature.errors.exceptions import EnvVarExpandError, MissingEnvVarError
+from dature.expansion.env_snapshot import current_env_snapshot
 from dature.types import ExpandEnvVarsMode, JSONValue
 
 # $VAR, ${VAR}, ${VAR:-default}, %VAR%, $$, %%
@@ -13,138 +16,150 @@ _VAR_RE = re.compile(
     r"|%([A-Za-z_][A-Za-z0-9_]*)%",  # %VAR%
 )
 
+_FALLBACK_SEPARATOR = ":-"
+_TEMPLATE_CACHE_SIZE = 4096
 
-def _resolve_brace_default(content: str, full: str) -> str:
-    separator = ":-"
-    idx = content.find(separator)
-    if idx != -1:
-        var_name = content[:idx]
-        fallback = content[idx + len(separator) :]
-        value = os.environ.get(var_name)
-        if value is not None:
-            return value
-        return _expand_string_default(fallback)
 
-    value = os.environ.get(content)
-    if value is not None:
-        return value
-    return full
+@dataclass(frozen=True, slots=True)
+class _VarRef:
+    name: str
+    full: str
+    position: int
+    fallback: str | None = None
+
 
+type _Template = tuple[str | _VarRef, ...]
 
-def _resolve_simple_default(var_name: str, full: str) -> str:
-    value = os.environ.get(var_name)
-    if value is not None:
-        return value
-    return full
 
+def _has_markers(text: str) -> bool:
+    return "$" in text or "%" in text
 
-class _EnvExpander:
-    def __init__(self, *, mode: ExpandEnvVarsMode, source_text: str) -> None:
-        self._mode = mode
-        self._source_text = source_text
-        self._errors: list[MissingEnvVarError] = []
 
-    @property
-    def errors(self) -> list[MissingEnvVarError]:
-        return self._errors
+@lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _compile_template(text: str) -> _Template:
+    segments: list[str | _VarRef] = []
+    literal: list[str] = []
+    last_end = 0
 
-    def __call__(self, match: re.Match[str]) -> str:
+    for match in _VAR_RE.finditer(text):
+        literal.append(text[last_end : match.start()])
+        last_end = match.end()
         full = match.group(0)
 
         if full == "$$":
-            return "$"
+            literal.append("$")
+            continue
         if full == "%%":
-            return "%"
+            literal.append("%")
+            continue
+
+        if literal:
+            segments.append("".join(literal))
+            literal = []
 
         brace_content = match.group(1)
-        dollar_name = match.group(2)
-        percent_name = match.group(3)
-
-        if brace_content is not None:
-            return self._resolve_brace(brace_content, match.start())
-        if dollar_name is not None:
-            return self._resolve_var(dollar_name, match.start())
-        return self._resolve_var(percent_name, match.start())
-
-    def _resolve_brace(self, content: str, position: int) -> str:
-        separator = ":-"
-        idx = content.find(separator)
-        if idx != -1:
-            var_name = content[:idx]
-            fallback = content[idx + len(separator) :]
-            value = os.environ.get(var_name)
-            if value is not None:
-                return value
-            return expand_string(fallback, mode=self._mode)
-
-        return self._resolve_var(content, position)
-
-    def _resolve_var(self, var_name: str, position: int) -> str:
-        value = os.environ.get(var_name)
-        if value is not None:
-            return value
+        if brace_content is None:
+            var_name = match.group(2) or match.group(3)
+            segments.append(_VarRef(name=var_name, full=full, position=match.start()))
+            continue
+
+        idx = brace_content.find(_FALLBACK_SEPARATOR)
+        if idx == -1:
+            segments.append(_VarRef(name=brace_content, full=full, position=match.start()))
+        else:
+            segments.append(
+                _VarRef(
+                    name=brace_content[:idx],
+                    full=full,
+                    position=match.start(),
+                    fallback=brace_content[idx + len(_FALLBACK_SEPARATOR) :],
+                ),
+            )
 
-        if self._mode == "strict":
-            self._errors.append(
+    literal.append(text[last_end:])
+    tail = "".join(literal)
+    if tail:
+        segments.append(tail)
+    return tuple(segments)
+
+
+def _render_template(
+    template: _Template,
+    *,
+    source_text: str,
+    mode: ExpandEnvVarsMode,
+    environ: Mapping[str, str],
+) -> str:
+    parts: list[str] = []
+    errors: list[MissingEnvVarError] = []
+
+    for segment in template:
+        if isinstance(segment, str):
+            parts.append(segment)
+            continue
+
+        value = environ.get(segment.name)
+        if value is not None:
+            parts.append(value)
+        elif segment.fallback is not None:
+            parts.append(expand_string(segment.fallback, mode=mode, environ=environ))
+        elif mode == "default":
+            parts.append(segment.full)
+        elif mode == "strict":
+            errors.append(
                 MissingEnvVarError(
-                    var_name=var_name,
-                    position=position,
-                    source_text=self._source_text,
+                    var_name=segment.name,
+                    position=segment.position,
+                    source_text=source_text,
                 ),
             )
 
-        return ""
+    if errors:
+        raise EnvVarExpandError(errors)
 
+    return "".join(parts)
 
-def expand_string(text: str, *, mode: ExpandEnvVarsMode) -> str:
-    if mode == "disabled":
-        return text
-
-    if mode == "default":
-        return _expand_string_default(text)
-
-    expander = _EnvExpander(mode=mode, source_text=text)
-    result = _VAR_RE.sub(expander, text)
 
-    if expander.errors:
-        raise EnvVarExpandError(expander.errors)
+def expand_string(
+    text: str,
+    *,
+    mode: ExpandEnvVarsMode,
+    environ: Mapping[str, str] | None = None,
+) -> str:
+    if mode == "disabled" or not _has_markers(text):
+        return text
 
-    return result
+    if environ is None:
+        environ = current_env_snapshot()
 
+    return _render_template(_compile_template(text), source_text=text, mode=mode, environ=environ)
 
-def _expand_string_default(text: str) -> str:
-    def _replace(match: re.Match[str]) -> str:
-        full = match.group(0)
 
-        if full == "$$":
-            return "$"
-        if full == "%%":
-            return "%"
-
-        brace_content = match.group(1)
-        if brace_content is not None:
-            return _resolve_brace_default(brace_content, full)
+def _expand_value(data: JSONValue, *, mode: ExpandEnvVarsMode, environ: Mapping[str, str]) -> JSONValue:
+    if isinstance(data, str):
+        if not _has_markers(data):
+            return data
+        return _render_template(_compile_template(data), source_text=data, mode=mode, environ=environ)
 
-        var_name = match.group(2) or match.group(3)
-        if var_name is not None:
-            return _resolve_simple_default(var_name, full)
+    if isinstance(data, dict):
+        return {key: _expand_value(value, mode=mode, environ=environ) for key, value in data.items()}
 
-        return full
+    if isinstance(data, list):
+        return [_expand_value(item, mode=mode, environ=environ) for item in data]
 
-    return _VAR_RE.sub(_replace, text)
+    return data
 
 
-def expand_env_vars(data: JSONValue, *, mode: ExpandEnvVarsMode) -> JSONValue:
+def expand_env_vars(
+    data: JSONValue,
+    *,
+    mode: ExpandEnvVarsMode,
+    environ: Mapping[str, str] | None = None,
+) -> JSONValue:
     if mode == "disabled":
         return data
 
-    if isinstance(data, str):
-        return expand_string(data, mode=mode)
-
-    if isinstance(data, dict):
-        return {key: expand_env_vars(value, mode=mode) for key, value in data.items()}
+    if environ is None:
+        environ = current_env_snapshot()
 
-    if isinstance(data, list):
-        return [expand_env_vars(item, mode=mode) for item in data]
-
-    return data
+    return _expand_value(data, mode=mode, environ=environ)
@@ -0,0 +1,81 @@
+import os
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class EnvSnapshot(Mapping[str, str]):
+    __slots__ = ("_data", "_prefix_cache", "_sorted_keys")
+
+    def __init__(self, environ: Mapping[str, str]) -> None:
+        self._data: dict[str, str] = dict(environ)
+        self._sorted_keys: list[str] | None = None
+        self._prefix_cache: dict[str, tuple[tuple[str, str], ...]] = {}
+
+    @classmethod
+    def capture(cls) -> "EnvSnapshot":
+        return cls(os.environ)
+
+    def __getitem__(self, key: str) -> str:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: str | None = None) -> str | None:  # type: ignore[override]
+        return self._data.get(key, default)
+
+    def with_prefix(self, prefix: str | None) -> tuple[tuple[str, str], ...]:
+        if not prefix:
+            return tuple(self._data.items())
+
+        cached = self._prefix_cache.get(prefix)
+        if cached is not None:
+            return cached
+
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self._data)
+
+        items: list[tuple[str, str]] = []
+        for idx in range(bisect_left(self._sorted_keys, prefix), len(self._sorted_keys)):
+            key = self._sorted_keys[idx]
+            if not key.startswith(prefix):
+                break
+            items.append((key, self._data[key]))
+
+        result = tuple(items)
+        self._prefix_cache[prefix] = result
+        return result
+
+
+_active_snapshot: ContextVar[EnvSnapshot | None] = ContextVar("dature_env_snapshot", default=None)
+
+
+# Nested scopes reuse the outer snapshot
+@contextmanager
+def env_snapshot_scope() -> Iterator[EnvSnapshot]:
+    active = _active_snapshot.get()
+    if active is not None:
+        yield active
+        return
+
+    snapshot = EnvSnapshot.capture()
+    token = _active_snapshot.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _active_snapshot.reset(token)
+
+
+def current_env_snapshot() -> EnvSnapshot:
+    active = _active_snapshot.get()
+    if active is not None:
+        return active
+    return EnvSnapshot.capture()
@@ -0,0 +1,154 @@
+import itertools
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from types import TracebackType
+from typing import Any, Literal
+
+from dature.types import LoadPhase
+
+logger = logging.getLogger("dature")
+
+# "config" wraps one whole load or decorated instantiation; "merge_step" and "field_groups"
+# are nested in "merge" and only reach hooks, not LoadStats
+type TracePhase = LoadPhase | Literal["config", "merge_step", "field_groups"]
+
+
+# The end event repeats span_id and adds seconds and error
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PhaseEvent:
+    phase: TracePhase
+    span_id: int
+    dataclass_name: str | None
+    source_index: int | None
+    attributes: dict[str, Any]
+    seconds: float | None = None
+    error: BaseException | None = None
+
+
+class LoadHook:
+    def on_start(self, event: PhaseEvent) -> None:  # noqa: ARG002
+        return None
+
+    def on_end(self, event: PhaseEvent) -> None:  # noqa: ARG002
+        return None
+
+
+class _HookRegistry:
+    hooks: tuple[LoadHook, ...] = ()
+
+
+_span_ids = itertools.count(1)
+
+
+def set_hooks(hooks: Iterable[LoadHook]) -> None:
+    _HookRegistry.hooks = tuple(hooks)
+
+
+def registered_hooks() -> tuple[LoadHook, ...]:
+    return _HookRegistry.hooks
+
+
+# Hooks that only see the loads run in the current context, on top of the configured ones
+_scoped_hooks: ContextVar[tuple[LoadHook, ...]] = ContextVar("dature_scoped_hooks", default=())
+
+
+@contextmanager
+def hooks_scope(*hooks: LoadHook) -> Iterator[None]:
+    token = _scoped_hooks.set((*_scoped_hooks.get(), *hooks))
+    try:
+        yield
+    finally:
+        _scoped_hooks.reset(token)
+
+
+def active_hooks() -> tuple[LoadHook, ...]:
+    scoped = _scoped_hooks.get()
+    if not scoped:
+        return _HookRegistry.hooks
+    return (*_HookRegistry.hooks, *scoped)
+
+
+def emit_start(
+    phase: TracePhase,
+    *,
+    dataclass_name: str | None,
+    source_index: int | None,
+    attributes: dict[str, Any],
+) -> PhaseEvent:
+    event = PhaseEvent(
+        phase=phase,
+        span_id=next(_span_ids),
+        dataclass_name=dataclass_name,
+        source_index=source_index,
+        attributes=attributes,
+    )
+    for hook in active_hooks():
+        try:
+            hook.on_start(event)
+        except Exception:
+            logger.exception("Load hook %r failed on start of %s", hook, phase)
+    return event
+
+
+def emit_end(
+    start: PhaseEvent,
+    *,
+    seconds: float,
+    error: BaseException | None,
+    attributes: dict[str, Any] | None = None,
+) -> None:
+    event = replace(
+        start,
+        attributes={**start.attributes, **attributes} if attributes else start.attributes,
+        seconds=seconds,
+        error=error,
+    )
+    for hook in active_hooks():
+        try:
+            hook.on_end(event)
+        except Exception:
+            logger.exception("Load hook %r failed on end of %s", hook, start.phase)
+
+
+class _HookSpan:
+    __slots__ = ("_attributes", "_dataclass_name", "_event", "_phase", "_started")
+
+    def __init__(self, phase: TracePhase, dataclass_name: str | None, attributes: dict[str, Any]) -> None:
+        self._phase = phase
+        self._dataclass_name = dataclass_name
+        self._attributes = attributes
+
+    def __enter__(self) -> None:
+        self._event = emit_start(
+            self._phase,
+            dataclass_name=self._dataclass_name,
+            source_index=None,
+            attributes=self._attributes,
+        )
+        self._started = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        emit_end(self._event, seconds=time.perf_counter() - self._started, error=exc)
+
+
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+# For blocks not timed in LoadStats; a shared no-op when no hook is registered
+def trace_span(phase: TracePhase, *, dataclass_name: str | None, **attributes: Any) -> AbstractContextManager[None]:  # noqa: ANN401
+    if not active_hooks():
+        return _NO_SPAN
+    return _HookSpan(phase, dataclass_name, attributes)
+
+
+def config_span(dataclass_name: str, *, cache_hit: bool) -> AbstractContextManager[None]:
+    return trace_span("config", dataclass_name=dataclass_name, cache_hit=cache_hit)
@@ -1,8 +1,13 @@
 import logging
+import sys
 import warnings
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
+from dature.load_stats import LoadStats, current_load_stats
 from dature.metadata import MergeStrategy
 from dature.types import JSONValue
 
@@ -28,53 +33,215 @@ class FieldOrigin:
     source_loader_type: str
 
 
-@dataclass(frozen=True, slots=True, kw_only=True)
-class LoadReport:
+# Sorted by key; the source file and loader type are read from the report's source entries
+class FieldOriginTable:
+    __slots__ = ("_positions", "keys", "source_indices", "values")
+
+    keys: tuple[str, ...]
+    source_indices: array[int]
+    values: tuple[JSONValue, ...]
+    _positions: dict[str, int] | None
+
+    def __init__(
+        self,
+        *,
+        keys: tuple[str, ...],
+        source_indices: array[int],
+        values: tuple[JSONValue, ...],
+    ) -> None:
+        self.keys = keys
+        self.source_indices = source_indices
+        self.values = values
+        self._positions = None
+
+    @classmethod
+    def from_origins(cls, origins: Iterable[FieldOrigin]) -> "FieldOriginTable":
+        ordered = sorted(origins, key=lambda origin: origin.key)
+        return cls(
+            keys=tuple(sys.intern(origin.key) for origin in ordered),
+            source_indices=array("I", (origin.source_index for origin in ordered)),
+            values=tuple(origin.value for origin in ordered),
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def position(self, key: str) -> int | None:
+        if self._positions is None:
+            self._positions = {name: i for i, name in enumerate(self.keys)}
+        return self._positions.get(key)
+
+    def prefix_positions(self, prefix: str) -> list[int]:
+        if not prefix:
+            return list(range(len(self.keys)))
+
+        positions: list[int] = []
+        exact = self.position(prefix)
+        if exact is not None:
+            positions.append(exact)
+        # "/" sorts right after ".", so this range holds exactly the keys starting with "prefix."
+        start = bisect_left(self.keys, f"{prefix}.")
+        stop = bisect_left(self.keys, f"{prefix}/", lo=start)
+        positions.extend(range(start, stop))
+        return positions
+
+    def materialize(
+        self,
+        sources: tuple[SourceEntry, ...],
+        positions: Iterable[int] | None = None,
+    ) -> tuple[FieldOrigin, ...]:
+        if positions is None:
+            positions = range(len(self.keys))
+
+        origins: list[FieldOrigin] = []
+        for i in positions:
+            source_index = self.source_indices[i]
+            source = sources[source_index]
+            origins.append(
+                FieldOrigin(
+                    key=self.keys[i],
+                    value=self.values[i],
+                    source_index=source_index,
+                    source_file=source.file_path,
+                    source_loader_type=source.loader_type,
+                ),
+            )
+        return tuple(origins)
+
+
+class _UnmaskedData:
+    # Kept outside the dataclass fields, so asdict, replace and copies never hand out plaintext
+    __slots__ = ("_field_origins", "_merged_data", "_sources")
+
+    _sources: tuple[SourceEntry, ...]
+    _field_origins: FieldOriginTable
+    _merged_data: JSONValue
+
+
+# Masks secret values each time they are read; stats is not compared
+@dataclass(frozen=True, slots=True, init=False, eq=False, repr=False)
+class LoadReport(_UnmaskedData):
     dataclass_name: str
     strategy: MergeStrategy | None
-    sources: tuple[SourceEntry, ...]
-    field_origins: tuple[FieldOrigin, ...]
-    merged_data: JSONValue
+    secret_paths: frozenset[str]
+    stats: LoadStats | None
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        dataclass_name: str,
+        strategy: MergeStrategy | None,
+        sources: tuple[SourceEntry, ...],
+        field_origins: FieldOriginTable | tuple[FieldOrigin, ...],
+        merged_data: JSONValue,
+        secret_paths: frozenset[str] = frozenset(),
+        stats: LoadStats | None = None,
+    ) -> None:
+        if stats is None:
+            stats = current_load_stats()
+        if not isinstance(field_origins, FieldOriginTable):
+            field_origins = FieldOriginTable.from_origins(field_origins)
+        object.__setattr__(self, "dataclass_name", dataclass_name)
+        object.__setattr__(self, "strategy", strategy)
+        object.__setattr__(self, "secret_paths", secret_paths)
+        object.__setattr__(self, "stats", stats)
+        object.__setattr__(self, "_sources", sources)
+        object.__setattr__(self, "_field_origins", field_origins)
+        object.__setattr__(self, "_merged_data", merged_data)
+
+    @property
+    def sources(self) -> tuple[SourceEntry, ...]:
+        if not self.secret_paths:
+            return self._sources
+        from dature.masking.masking import mask_source_entries  # noqa: PLC0415
+
+        return mask_source_entries(self._sources, secret_paths=self.secret_paths)
+
+    def _origins_at(self, positions: Iterable[int] | None = None) -> tuple[FieldOrigin, ...]:
+        origins = self._field_origins.materialize(self._sources, positions)
+        if not self.secret_paths:
+            return origins
+        from dature.masking.masking import mask_field_origins  # noqa: PLC0415
+
+        return mask_field_origins(origins, secret_paths=self.secret_paths)
+
+    @property
+    def field_origins(self) -> tuple[FieldOrigin, ...]:
+        return self._origins_at()
+
+    def origin_of(self, path: str) -> FieldOrigin | None:
+        position = self._field_origins.position(path)
+        if position is None:
+            return None
+        return self._origins_at((position,))[0]
+
+    def origins_under(self, prefix: str) -> tuple[FieldOrigin, ...]:
+        return self._origins_at(self._field_origins.prefix_positions(prefix))
+
+    @property
+    def merged_data(self) -> JSONValue:
+        if not self.secret_paths:
+            return self._merged_data
+        from dature.masking.masking import mask_json_value  # noqa: PLC0415
+
+        return mask_json_value(self._merged_data, secret_paths=self.secret_paths)
+
+    def _masked_fields(self) -> tuple[object, ...]:
+        return (self.dataclass_name, self.strategy, self.sources, self.field_origins, self.merged_data)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LoadReport):
+            return NotImplemented
+        return self._masked_fields() == other._masked_fields()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"LoadReport(dataclass_name={self.dataclass_name!r}, strategy={self.strategy!r}, "
+            f"sources={self.sources!r}, field_origins={self.field_origins!r}, merged_data={self.merged_data!r})"
+        )
+
+    def __getstate__(self) -> tuple[object, ...]:
+        # Pickles and copies carry the masked views only
+        return (self.dataclass_name, self.strategy, self.sources, self.field_origins, self.merged_data, self.stats)
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        dataclass_name, strategy, sources, field_origins, merged_data, stats = state
+        LoadReport.__init__(
+            self,
+            dataclass_name=dataclass_name,
+            strategy=strategy,
+            sources=sources,
+            field_origins=field_origins,
+            merged_data=merged_data,
+            stats=stats,
+        )
 
 
 def compute_field_origins(
     *,
     raw_dicts: list[JSONValue],
-    source_entries: tuple[SourceEntry, ...],
     strategy: MergeStrategy,
-) -> tuple[FieldOrigin, ...]:
-    first_source: dict[str, int] = {}
-    last_source: dict[str, int] = {}
+) -> FieldOriginTable:
+    first_wins = strategy == MergeStrategy.FIRST_WINS
+    winner_of: dict[str, int] = {}
     last_value: dict[str, JSONValue] = {}
 
     for i, raw in enumerate(raw_dicts):
         if not isinstance(raw, dict):
             continue
         for key, value in _flatten_dict(raw, prefix=""):
-            if key not in first_source:
-                first_source[key] = i
-            last_source[key] = i
+            if not first_wins or key not in winner_of:
+                winner_of[key] = i
             last_value[key] = value
 
-    origins: list[FieldOrigin] = []
-    for key in sorted(last_source):
-        if strategy == MergeStrategy.FIRST_WINS:
-            winner_idx = first_source[key]
-        else:
-            winner_idx = last_source[key]
-
-        winner = source_entries[winner_idx]
-        origins.append(
-            FieldOrigin(
-                key=key,
-                value=last_value[key],
-                source_index=winner_idx,
-                source_file=winner.file_path,
-                source_loader_type=winner.loader_type,
-            ),
-        )
-
-    return tuple(origins)
+    keys = sorted(last_value)
+    return FieldOriginTable(
+        keys=tuple(sys.intern(key) for key in keys),
+        source_indices=array("I", (winner_of[key] for key in keys)),
+        values=tuple(last_value[key] for key in keys),
+    )
 
 
 def _flatten_dict(
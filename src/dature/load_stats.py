@@ -0,0 +1,196 @@
+import stat
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from dature.hooks import PhaseEvent, active_hooks, emit_end, emit_start
+from dature.types import JSONValue, LoadPhase
+
+_STATS_ATTR = "__dature_load_stats__"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PhaseTiming:
+    phase: LoadPhase
+    seconds: float
+    source_index: int | None = None
+    bytes_read: int | None = None
+    keys: int | None = None
+
+
+# Collected on every load, independently of debug
+class LoadStats:
+    __slots__ = ("_finished", "_phases", "_source_index", "_started", "dataclass_name")
+
+    def __init__(self, dataclass_name: str) -> None:
+        self.dataclass_name = dataclass_name
+        self._phases: list[PhaseTiming] = []
+        self._source_index: int | None = None
+        self._started = time.perf_counter()
+        self._finished: float | None = None
+
+    @property
+    def phases(self) -> tuple[PhaseTiming, ...]:
+        return tuple(self._phases)
+
+    @property
+    def total_seconds(self) -> float:
+        finished = self._finished if self._finished is not None else time.perf_counter()
+        return finished - self._started
+
+    def phase_seconds(self, phase: LoadPhase) -> float:
+        return sum(timing.seconds for timing in self._phases if timing.phase == phase)
+
+    def source_phases(self, source_index: int) -> tuple[PhaseTiming, ...]:
+        return tuple(timing for timing in self._phases if timing.source_index == source_index)
+
+    def record(
+        self,
+        phase: LoadPhase,
+        started: float,
+        *,
+        bytes_read: int | None = None,
+        keys: int | None = None,
+    ) -> None:
+        self._phases.append(
+            PhaseTiming(
+                phase=phase,
+                seconds=time.perf_counter() - started,
+                source_index=self._source_index,
+                bytes_read=bytes_read,
+                keys=keys,
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"LoadStats(dataclass_name={self.dataclass_name!r}, total_seconds={self.total_seconds:.6f}, "
+            f"phases={self.phases!r})"
+        )
+
+
+_active_stats: ContextVar[LoadStats | None] = ContextVar("dature_load_stats", default=None)
+
+
+# Nested scopes record into the outer one
+@contextmanager
+def load_stats_scope(dataclass_name: str) -> Iterator[LoadStats]:
+    active = _active_stats.get()
+    if active is not None:
+        yield active
+        return
+
+    stats = LoadStats(dataclass_name)
+    token = _active_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        stats._finished = time.perf_counter()  # noqa: SLF001
+        _active_stats.reset(token)
+
+
+@contextmanager
+def stats_source(source_index: int) -> Iterator[None]:
+    stats = _active_stats.get()
+    if stats is None:
+        yield
+        return
+
+    previous = stats._source_index  # noqa: SLF001
+    stats._source_index = source_index  # noqa: SLF001
+    try:
+        yield
+    finally:
+        stats._source_index = previous  # noqa: SLF001
+
+
+def current_load_stats() -> LoadStats | None:
+    return _active_stats.get()
+
+
+# Fill bytes_read and keys only when observed is true, nothing reads them otherwise
+class PhaseTimer:
+    __slots__ = ("_attributes", "_event", "_phase", "_started", "_stats", "bytes_read", "keys")
+
+    def __init__(self, phase: LoadPhase, **attributes: Any) -> None:  # noqa: ANN401
+        self._phase = phase
+        self._attributes = attributes
+        self._stats: LoadStats | None = None
+        self._event: PhaseEvent | None = None
+        self._started = 0.0
+        self.bytes_read: int | None = None
+        self.keys: int | None = None
+
+    @property
+    def observed(self) -> bool:
+        return self._stats is not None or self._event is not None
+
+    def __enter__(self) -> Self:
+        stats = self._stats = _active_stats.get()
+        if active_hooks():
+            self._event = emit_start(
+                self._phase,
+                dataclass_name=stats.dataclass_name if stats is not None else None,
+                source_index=stats._source_index if stats is not None else None,  # noqa: SLF001
+                attributes=self._attributes,
+            )
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._stats is not None:
+            self._stats.record(self._phase, self._started, bytes_read=self.bytes_read, keys=self.keys)
+        if self._event is not None:
+            emit_end(
+                self._event,
+                seconds=time.perf_counter() - self._started,
+                error=exc,
+                attributes={"bytes_read": self.bytes_read, "keys": self.keys},
+            )
+
+
+def count_keys(data: JSONValue) -> int | None:
+    if isinstance(data, dict):
+        return len(data)
+    return None
+
+
+def source_bytes(path: Path) -> int | None:
+    try:
+        file_stat = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+    return file_stat.st_size
+
+
+def get_load_stats(target: Any) -> LoadStats | None:  # noqa: ANN401
+    stats = getattr(target, _STATS_ATTR, None)
+    if isinstance(stats, LoadStats):
+        return stats
+    return None
+
+
+def attach_load_stats(target: Any, stats: LoadStats | None) -> None:  # noqa: ANN401
+    if stats is None:
+        return
+    try:
+        if isinstance(target, type):
+            setattr(target, _STATS_ATTR, stats)
+        else:
+            # Frozen dataclasses reject plain setattr
+            object.__setattr__(target, _STATS_ATTR, stats)
+    except AttributeError:
+        # slots=True dataclasses have no room for extra attributes
+        return
@@ -1,20 +1,27 @@
+import functools
 import logging
-from collections.abc import Callable
-from dataclasses import Field, asdict
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import Field, asdict, dataclass
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol, cast, runtime_checkable
 
 from adaptix import Retort
+from adaptix.load_error import AggregateLoadError, LoadError
 
 from dature.errors.formatter import handle_load_errors
 from dature.errors.location import ErrorContext
 from dature.field_path import FieldPath
+from dature.load_stats import PhaseTimer, count_keys
 from dature.loading.resolver import resolve_loader_class
 from dature.merging.predicate import extract_field_path
 from dature.metadata import LoadMetadata
 from dature.protocols import DataclassInstance, LoaderProtocol
-from dature.skip_field_provider import FilterResult, filter_invalid_fields
+from dature.skip_field_provider import FilterResult, filter_failed_fields, filter_invalid_fields
 from dature.types import JSONValue
+from dature.validators.override import OverrideValidator
 
 logger = logging.getLogger("dature")
 
@@ -64,29 +71,82 @@ def apply_skip_invalid(
 
     allowed_fields = get_allowed_fields(skip_value=skip_if_invalid, dataclass_=dataclass_)
 
-    if probe_retort is None:
-        probe_retort = loader_instance.create_probe_retort()
+    with PhaseTimer("skip_invalid") as timer:
+        timer.keys = count_keys(raw)
+        if probe_retort is None:
+            probe_retort = loader_instance.create_probe_retort()
 
-    result = filter_invalid_fields(raw, probe_retort, dataclass_, allowed_fields)
+        result = filter_invalid_fields(raw, probe_retort, dataclass_, allowed_fields)
+    _log_skipped_paths(result, log_prefix)
+    return result
+
+
+def _log_skipped_paths(result: FilterResult, log_prefix: str) -> None:
     for path in result.skipped_paths:
         logger.warning(
             "%s Skipped invalid field '%s'",
             log_prefix,
             path,
         )
-    return result
 
 
-def merge_fields(
-    loaded_data: DataclassInstance,
+@dataclass(frozen=True, slots=True)
+class OptimisticLoadResult[T]:
+    filter_result: FilterResult
+    loaded: T | None
+
+
+# Tries the normal conversion first and filters by error trails only when it fails
+def load_skipping_invalid[T](
+    *,
+    raw: JSONValue,
+    skip_if_invalid: bool | tuple[FieldPath, ...] | None,
+    loader_instance: LoaderProtocol,
+    dataclass_: type[T],
+    log_prefix: str,
+) -> OptimisticLoadResult[T]:
+    if not skip_if_invalid:
+        return OptimisticLoadResult(filter_result=FilterResult(cleaned_dict=raw, skipped_paths=[]), loaded=None)
+
+    try:
+        loaded = loader_instance.transform_to_dataclass(raw, dataclass_)
+    except (AggregateLoadError, LoadError) as exc:
+        with PhaseTimer("skip_invalid") as timer:
+            timer.keys = count_keys(raw)
+            allowed_fields = get_allowed_fields(
+                skip_value=skip_if_invalid,
+                dataclass_=cast("type[DataclassInstance]", dataclass_),
+            )
+            result = filter_failed_fields(raw, exc, allowed_fields)
+        _log_skipped_paths(result, log_prefix)
+        return OptimisticLoadResult(filter_result=result, loaded=None)
+
+    return OptimisticLoadResult(filter_result=FilterResult(cleaned_dict=raw, skipped_paths=[]), loaded=loaded)
+
+
+def field_values(loaded_data: DataclassInstance, field_list: tuple[Field[Any], ...]) -> dict[str, Any]:
+    return {field.name: getattr(loaded_data, field.name) for field in field_list}
+
+
+def explicit_field_names(
     field_list: tuple[Field[Any], ...],
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
-) -> dict[str, Any]:
+) -> set[str]:
     explicit_fields = set(kwargs.keys())
     for i, _ in enumerate(args):
         if i < len(field_list):
             explicit_fields.add(field_list[i].name)
+    return explicit_fields
+
+
+def merge_fields(
+    loaded_data: DataclassInstance,
+    field_list: tuple[Field[Any], ...],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    explicit_fields = explicit_field_names(field_list, args, kwargs)
 
     complete_kwargs = dict(kwargs)
     for field in field_list:
@@ -96,6 +156,18 @@ def merge_fields(
     return complete_kwargs
 
 
+# Serializes lazy preparation, so concurrent first instantiations build the retorts once
+prepare_lock = threading.RLock()
+
+
+# adaptix reads the signature of __init__ to build retorts
+def with_original_signature(
+    new_init: Callable[..., None],
+    original_init: Callable[..., None],
+) -> Callable[..., None]:
+    return functools.wraps(original_init)(new_init)
+
+
 def ensure_retort(loader_instance: LoaderProtocol, cls: type[DataclassInstance]) -> None:
     """Creates a replacement response to __init__ so that Adaptix sees the original signature."""
     if cls not in loader_instance.retorts:
@@ -105,32 +177,128 @@ def ensure_retort(loader_instance: LoaderProtocol, cls: type[DataclassInstance])
 
 @runtime_checkable
 class PatchContext(Protocol):
-    loading: bool
-    validating: bool
+    cache: bool
+    field_list: tuple[Field[Any], ...]
+    validated_values: dict[str, Any] | None
+    original_init: Callable[..., None]
     original_post_init: Callable[..., None] | None
     validation_loader: Callable[[JSONValue], DataclassInstance]
+    override_validator: OverrideValidator
     error_ctx: ErrorContext
+    prepared: bool
+
+    def prepare(self) -> None: ...
+
+    def source_error_contexts(self) -> tuple[ErrorContext, ...]: ...
+
+
+_CONTEXT_ATTR = "__dature_patch_context__"
+
+
+def attach_patch_context(cls: type[DataclassInstance], ctx: PatchContext) -> None:
+    setattr(cls, _CONTEXT_ATTR, ctx)
+
+
+def get_patch_context(cls: type[DataclassInstance]) -> PatchContext | None:
+    return cast("PatchContext | None", cls.__dict__.get(_CONTEXT_ATTR))
+
+
+@dataclass(frozen=True, slots=True)
+class _InitCall:
+    instance: DataclassInstance
+    trusted: bool = False
+    override_fields: frozenset[str] | None = None
+
+
+# Per call, never on the shared patch context
+_init_call: ContextVar[_InitCall | None] = ContextVar("dature_init_call", default=None)
+
+# Classes a retort is building in this call; those constructions skip the patched __init__ and validation
+_internal_construction: ContextVar[frozenset[PatchContext]] = ContextVar(
+    "dature_internal_construction",
+    default=frozenset(),
+)
+
+
+@contextmanager
+def internal_construction(ctx: PatchContext) -> Iterator[None]:
+    token = _internal_construction.set(_internal_construction.get() | {ctx})
+    try:
+        yield
+    finally:
+        _internal_construction.reset(token)
+
+
+def in_internal_construction(ctx: PatchContext) -> bool:
+    return ctx in _internal_construction.get()
+
+
+def init_from_loaded(
+    ctx: PatchContext,
+    instance: DataclassInstance,
+    loaded_data: DataclassInstance,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    *,
+    attach_report: Callable[[DataclassInstance], None] | None = None,
+) -> None:
+    overridden = bool(args or kwargs)
+    trusted = False
+    override_fields: frozenset[str] | None = None
+    if not overridden and ctx.validated_values is not None:
+        # Fast path: cached data already passed validation once, nothing can have changed
+        complete_kwargs = ctx.validated_values
+        trusted = True
+    else:
+        complete_kwargs = merge_fields(loaded_data, ctx.field_list, args, kwargs)
+        if overridden and ctx.validated_values is not None:
+            # Everything not passed explicitly comes from data that already passed validation
+            override_fields = frozenset(explicit_field_names(ctx.field_list, args, kwargs))
+
+    token = _init_call.set(_InitCall(instance=instance, trusted=trusted, override_fields=override_fields))
+    try:
+        ctx.original_init(instance, *args, **complete_kwargs)
+
+        if attach_report is not None:
+            attach_report(instance)
+
+        if ctx.original_post_init is None:
+            instance.__post_init__()  # type: ignore[attr-defined]
+    finally:
+        _init_call.reset(token)
+
+    if ctx.cache and not overridden and ctx.validated_values is None:
+        ctx.validated_values = field_values(loaded_data, ctx.field_list)
 
 
 def make_validating_post_init(ctx: PatchContext) -> Callable[..., None]:
     def new_post_init(self: DataclassInstance) -> None:
-        if ctx.loading:
-            return
-
-        if ctx.validating:
+        if in_internal_construction(ctx):
             return
 
         if ctx.original_post_init is not None:
             ctx.original_post_init(self)
 
-        ctx.validating = True
-        try:
-            obj_dict = asdict(self)
-            handle_load_errors(
-                func=lambda: ctx.validation_loader(obj_dict),
-                ctx=ctx.error_ctx,
-            )
-        finally:
-            ctx.validating = False
+        call = _init_call.get()
+        if call is None or call.instance is not self:
+            call = _InitCall(instance=self)
+
+        # Instantiation from already validated cached data without overrides
+        if call.trusted:
+            return
+
+        override_fields = call.override_fields
+        with internal_construction(ctx), PhaseTimer("validation"):
+            if override_fields is not None:
+                handle_load_errors(
+                    func=lambda: ctx.override_validator.validate(self, override_fields),
+                    ctx=ctx.error_ctx,
+                )
+            else:
+                obj_dict = asdict(self)
+                handle_load_errors(
+                    func=lambda: ctx.validation_loader(obj_dict),
+                    ctx=ctx.error_ctx,
+                )
 
     return new_post_init
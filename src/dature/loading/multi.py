@@ -7,29 +7,39 @@ from typing import Any
 from dature.config import config
 from dature.errors.exceptions import DatureConfigError
 from dature.errors.formatter import enrich_skipped_errors, handle_load_errors
+from dature.errors.location import ErrorContext
+from dature.expansion.env_snapshot import env_snapshot_scope
+from dature.hooks import config_span, trace_span
 from dature.load_report import (
-    FieldOrigin,
+    FieldOriginTable,
     LoadReport,
     SourceEntry,
     attach_load_report,
     compute_field_origins,
     get_load_report,
 )
-from dature.loading.context import build_error_ctx, ensure_retort, make_validating_post_init, merge_fields
+from dature.load_stats import LoadStats, PhaseTimer, attach_load_stats, count_keys, load_stats_scope
+from dature.loading.context import (
+    attach_patch_context,
+    build_error_ctx,
+    ensure_retort,
+    in_internal_construction,
+    init_from_loaded,
+    internal_construction,
+    make_validating_post_init,
+    prepare_lock,
+    with_original_signature,
+)
 from dature.loading.resolver import resolve_loader
 from dature.loading.source_loading import load_sources, resolve_expand_env_vars
 from dature.masking.detection import build_secret_paths
-from dature.masking.masking import (
-    mask_field_origins,
-    mask_json_value,
-    mask_source_entries,
-    mask_value,
-)
+from dature.masking.masking import mask_json_value, mask_value
 from dature.merging.deep_merge import deep_merge, deep_merge_last_wins, raise_on_conflict
 from dature.merging.field_group import FieldGroupContext, validate_field_groups
 from dature.merging.predicate import ResolvedFieldGroup, build_field_group_paths, build_field_merge_map
 from dature.metadata import FieldMergeStrategy, MergeMetadata, MergeStrategy
 from dature.protocols import DataclassInstance, LoaderProtocol
+from dature.sources_loader.parse_cache import parse_cache_scope
 from dature.types import FieldMergeCallable, JSONValue
 
 logger = logging.getLogger("dature")
@@ -86,10 +96,11 @@ def _log_merge_step(  # noqa: PLR0913
 def _log_field_origins(
     *,
     dataclass_name: str,
-    field_origins: tuple[FieldOrigin, ...],
+    field_origins: FieldOriginTable,
+    source_entries: tuple[SourceEntry, ...],
     secret_paths: frozenset[str] = frozenset(),
 ) -> None:
-    for origin in field_origins:
+    for origin in field_origins.materialize(source_entries):
         if origin.key in secret_paths:
             masked = mask_value(str(origin.value))
             logger.debug(
@@ -111,26 +122,45 @@ def _log_field_origins(
             )
 
 
+def _trace_field_origins(
+    *,
+    debug: bool,
+    dataclass_name: str,
+    raw_dicts: list[JSONValue],
+    strategy: MergeStrategy,
+    source_entries: tuple[SourceEntry, ...],
+    secret_paths: frozenset[str],
+) -> FieldOriginTable | None:
+    # Field origins are only needed for the report and the debug log; skip flattening otherwise
+    if not debug and not logger.isEnabledFor(logging.DEBUG):
+        return None
+
+    field_origins = compute_field_origins(raw_dicts=raw_dicts, strategy=strategy)
+    _log_field_origins(
+        dataclass_name=dataclass_name,
+        field_origins=field_origins,
+        source_entries=source_entries,
+        secret_paths=secret_paths,
+    )
+    return field_origins
+
+
 def _build_merge_report(
     *,
     dataclass_name: str,
     strategy: MergeStrategy,
     source_entries: tuple[SourceEntry, ...],
-    field_origins: tuple[FieldOrigin, ...],
+    field_origins: FieldOriginTable,
     merged_data: JSONValue,
     secret_paths: frozenset[str] = frozenset(),
 ) -> LoadReport:
-    if secret_paths:
-        source_entries = mask_source_entries(source_entries, secret_paths=secret_paths)
-        field_origins = mask_field_origins(field_origins, secret_paths=secret_paths)
-        merged_data = mask_json_value(merged_data, secret_paths=secret_paths)
-
     return LoadReport(
         dataclass_name=dataclass_name,
         strategy=strategy,
         sources=source_entries,
         field_origins=field_origins,
         merged_data=merged_data,
+        secret_paths=secret_paths,
     )
 
 
@@ -156,22 +186,23 @@ def _validate_all_field_groups(
 ) -> None:
     merged: JSONValue = {}
     field_origins: dict[str, int] = {}
-    ctx = FieldGroupContext(
-        source_reprs=source_reprs,
-        field_origins=field_origins,
-        dataclass_name=dataclass_name,
-    )
-    for step_idx, raw in enumerate(raw_dicts):
-        validate_field_groups(
-            base=merged,
-            source=raw,
-            field_group_paths=field_group_paths,
-            source_index=step_idx,
-            ctx=ctx,
+    with trace_span("field_groups", dataclass_name=dataclass_name, groups=len(field_group_paths)):
+        ctx = FieldGroupContext(
+            source_reprs=source_reprs,
+            field_origins=field_origins,
+            dataclass_name=dataclass_name,
         )
-        for leaf_path in _collect_leaf_paths(raw):
-            field_origins[leaf_path] = step_idx
-        merged = deep_merge_last_wins(merged, raw, field_merge_map=None)
+        for step_idx, raw in enumerate(raw_dicts):
+            validate_field_groups(
+                base=merged,
+                source=raw,
+                field_group_paths=field_group_paths,
+                source_index=step_idx,
+                ctx=ctx,
+            )
+            for leaf_path in _collect_leaf_paths(raw):
+                field_origins[leaf_path] = step_idx
+            merged = deep_merge_last_wins(merged, raw, field_merge_map=None)
 
 
 def _collect_field_values(
@@ -226,10 +257,11 @@ def _merge_raw_dicts(
     for step_idx, raw in enumerate(raw_dicts):
         before = merged
 
-        if strategy == MergeStrategy.RAISE_ON_CONFLICT:
-            merged = deep_merge_last_wins(merged, raw, field_merge_map=field_merge_map)
-        else:
-            merged = deep_merge(merged, raw, strategy=strategy, field_merge_map=field_merge_map)
+        with trace_span("merge_step", dataclass_name=dataclass_name, step=step_idx):
+            if strategy == MergeStrategy.RAISE_ON_CONFLICT:
+                merged = deep_merge_last_wins(merged, raw, field_merge_map=field_merge_map)
+            else:
+                merged = deep_merge(merged, raw, strategy=strategy, field_merge_map=field_merge_map)
 
         _log_merge_step(
             dataclass_name=dataclass_name,
@@ -265,52 +297,56 @@ def _load_and_merge[T: DataclassInstance](  # noqa: C901
     dataclass_: type[T],
     loaders: tuple[LoaderProtocol, ...] | None = None,
     debug: bool = False,
+    ensure_conversion_retort: Callable[[LoaderProtocol], None] | None = None,
 ) -> _MergedData[T]:
     secret_paths: frozenset[str] = frozenset()
     if _resolve_merge_mask_secrets(merge_meta):
         extra_patterns = _collect_extra_secret_patterns(merge_meta)
         secret_paths = build_secret_paths(dataclass_, extra_patterns=extra_patterns)
 
-    loaded = load_sources(
-        merge_meta=merge_meta,
-        dataclass_name=dataclass_.__name__,
-        dataclass_=dataclass_,
-        loaders=loaders,
-        secret_paths=secret_paths,
-    )
+    with env_snapshot_scope(), parse_cache_scope():
+        loaded = load_sources(
+            merge_meta=merge_meta,
+            dataclass_name=dataclass_.__name__,
+            dataclass_=dataclass_,
+            loaders=loaders,
+            secret_paths=secret_paths,
+        )
 
-    merge_maps = build_field_merge_map(merge_meta.field_merges, dataclass_)
+    with PhaseTimer("merge", strategy=merge_meta.strategy.value, sources=len(loaded.raw_dicts)) as timer:
+        merge_maps = build_field_merge_map(merge_meta.field_merges, dataclass_)
 
-    field_group_paths: tuple[ResolvedFieldGroup, ...] = ()
-    if merge_meta.field_groups:
-        field_group_paths = build_field_group_paths(merge_meta.field_groups, dataclass_)
+        field_group_paths: tuple[ResolvedFieldGroup, ...] = ()
+        if merge_meta.field_groups:
+            field_group_paths = build_field_group_paths(merge_meta.field_groups, dataclass_)
 
-    if field_group_paths:
-        source_reprs = tuple(repr(merge_meta.sources[entry.index]) for entry in loaded.source_entries)
-        _validate_all_field_groups(
+        if field_group_paths:
+            source_reprs = tuple(repr(merge_meta.sources[entry.index]) for entry in loaded.source_entries)
+            _validate_all_field_groups(
+                raw_dicts=loaded.raw_dicts,
+                field_group_paths=field_group_paths,
+                dataclass_name=dataclass_.__name__,
+                source_reprs=source_reprs,
+            )
+
+        if merge_meta.strategy == MergeStrategy.RAISE_ON_CONFLICT:
+            raise_on_conflict(
+                loaded.raw_dicts,
+                loaded.source_ctxs,
+                dataclass_.__name__,
+                field_merge_map=merge_maps.enum_map or None,
+                callable_merge_paths=merge_maps.callable_paths or None,
+            )
+
+        merged = _merge_raw_dicts(
             raw_dicts=loaded.raw_dicts,
-            field_group_paths=field_group_paths,
+            strategy=merge_meta.strategy,
             dataclass_name=dataclass_.__name__,
-            source_reprs=source_reprs,
-        )
-
-    if merge_meta.strategy == MergeStrategy.RAISE_ON_CONFLICT:
-        raise_on_conflict(
-            loaded.raw_dicts,
-            loaded.source_ctxs,
-            dataclass_.__name__,
             field_merge_map=merge_maps.enum_map or None,
-            callable_merge_paths=merge_maps.callable_paths or None,
+            callable_merge_map=merge_maps.callable_map or None,
+            secret_paths=secret_paths,
         )
-
-    merged = _merge_raw_dicts(
-        raw_dicts=loaded.raw_dicts,
-        strategy=merge_meta.strategy,
-        dataclass_name=dataclass_.__name__,
-        field_merge_map=merge_maps.enum_map or None,
-        callable_merge_map=merge_maps.callable_map or None,
-        secret_paths=secret_paths,
-    )
+        timer.keys = count_keys(merged)
 
     if secret_paths:
         masked_merged = mask_json_value(merged, secret_paths=secret_paths)
@@ -325,20 +361,17 @@ def _load_and_merge[T: DataclassInstance](  # noqa: C901
     )
 
     frozen_entries = tuple(loaded.source_entries)
-    field_origins = compute_field_origins(
+    field_origins = _trace_field_origins(
+        debug=debug,
+        dataclass_name=dataclass_.__name__,
         raw_dicts=loaded.raw_dicts,
-        source_entries=frozen_entries,
         strategy=merge_meta.strategy,
-    )
-
-    _log_field_origins(
-        dataclass_name=dataclass_.__name__,
-        field_origins=field_origins,
+        source_entries=frozen_entries,
         secret_paths=secret_paths,
     )
 
     report: LoadReport | None = None
-    if debug:
+    if debug and field_origins is not None:
         report = _build_merge_report(
             dataclass_name=dataclass_.__name__,
             strategy=merge_meta.strategy,
@@ -348,6 +381,9 @@ def _load_and_merge[T: DataclassInstance](  # noqa: C901
             secret_paths=secret_paths,
         )
 
+    if ensure_conversion_retort is not None:
+        ensure_conversion_retort(loaded.last_loader)
+
     last_error_ctx = loaded.source_ctxs[-1][0]
     try:
         result = handle_load_errors(
@@ -373,6 +409,15 @@ def merge_load_as_function[T: DataclassInstance](
     *,
     debug: bool,
 ) -> T:
+    return merge_load_validated(merge_meta, dataclass_, debug=debug).result
+
+
+def merge_load_validated[T: DataclassInstance](
+    merge_meta: MergeMetadata,
+    dataclass_: type[T],
+    *,
+    debug: bool,
+) -> _MergedData[T]:
     data = _load_and_merge(
         merge_meta=merge_meta,
         dataclass_=dataclass_,
@@ -389,10 +434,11 @@ def merge_load_as_function[T: DataclassInstance](
         secret_paths = build_secret_paths(dataclass_, extra_patterns=extra_patterns)
     last_error_ctx = build_error_ctx(last_meta, dataclass_.__name__, secret_paths=secret_paths)
     try:
-        handle_load_errors(
-            func=lambda: validation_loader(data.merged_raw),
-            ctx=last_error_ctx,
-        )
+        with PhaseTimer("validation"):
+            handle_load_errors(
+                func=lambda: validation_loader(data.merged_raw),
+                ctx=last_error_ctx,
+            )
     except DatureConfigError:
         if debug:
             report = get_load_report(data.result)
@@ -400,7 +446,7 @@ def merge_load_as_function[T: DataclassInstance](
                 attach_load_report(dataclass_, report)
         raise
 
-    return data.result
+    return data
 
 
 class _MergePatchContext:
@@ -412,8 +458,6 @@ class _MergePatchContext:
         cache: bool,
         debug: bool,
     ) -> None:
-        self.loaders = self._prepare_loaders(merge_meta=merge_meta, cls=cls)
-
         self.merge_meta = merge_meta
         self.cls = cls
         self.cache = cache
@@ -422,20 +466,36 @@ class _MergePatchContext:
         self.field_list = fields(cls)
         self.original_init = cls.__init__
         self.original_post_init = getattr(cls, "__post_init__", None)
-        self.loading = False
-        self.validating = False
-
-        last_loader = self.loaders[-1]
-        validating_retort = last_loader.create_validating_retort(cls)
-        self.validation_loader: Callable[[JSONValue], DataclassInstance] = validating_retort.get_loader(cls)
-
-        self.secret_paths: frozenset[str] = frozenset()
-        if _resolve_merge_mask_secrets(merge_meta):
-            extra_patterns = _collect_extra_secret_patterns(merge_meta)
-            self.secret_paths = build_secret_paths(cls, extra_patterns=extra_patterns)
-
-        last_meta = merge_meta.sources[-1]
-        self.error_ctx = build_error_ctx(last_meta, cls.__name__, secret_paths=self.secret_paths)
+        self.validated_values: dict[str, Any] | None = None
+        self.load_stats: LoadStats | None = None
+        self.prepared = False
+
+    def prepare(self) -> None:
+        with prepare_lock:
+            if self.prepared:
+                return
+
+            self.loaders = self._prepare_loaders(merge_meta=self.merge_meta, cls=self.cls)
+
+            last_loader = self.loaders[-1]
+            validating_retort = last_loader.create_validating_retort(self.cls)
+            self.validation_loader: Callable[[JSONValue], DataclassInstance] = validating_retort.get_loader(self.cls)
+            self.override_validator = last_loader.create_override_validator(self.cls, validating_retort)
+
+            self.secret_paths: frozenset[str] = frozenset()
+            if _resolve_merge_mask_secrets(self.merge_meta):
+                extra_patterns = _collect_extra_secret_patterns(self.merge_meta)
+                self.secret_paths = build_secret_paths(self.cls, extra_patterns=extra_patterns)
+
+            last_meta = self.merge_meta.sources[-1]
+            self.error_ctx = build_error_ctx(last_meta, self.cls.__name__, secret_paths=self.secret_paths)
+            self.prepared = True
+
+    def source_error_contexts(self) -> tuple[ErrorContext, ...]:
+        return tuple(
+            build_error_ctx(source_meta, self.cls.__name__, secret_paths=self.secret_paths)
+            for source_meta in self.merge_meta.sources
+        )
 
     @staticmethod
     def _prepare_loaders(
@@ -446,46 +506,76 @@ class _MergePatchContext:
         loaders: list[LoaderProtocol] = []
         for source_meta in merge_meta.sources:
             resolved_expand = resolve_expand_env_vars(source_meta, merge_meta)
-            loader_instance = resolve_loader(source_meta, expand_env_vars=resolved_expand)
-            ensure_retort(loader_instance, cls)
-            loaders.append(loader_instance)
+            loaders.append(resolve_loader(source_meta, expand_env_vars=resolved_expand))
+        # Sources only parse; the merged data is converted by the last loader alone
+        ensure_retort(loaders[-1], cls)
         return tuple(loaders)
 
+    def ensure_conversion_retort(self, loader_instance: LoaderProtocol) -> None:
+        # A skipped broken last source moves the conversion to an earlier loader
+        if self.cls in loader_instance.retorts:
+            return
+        with prepare_lock:
+            ensure_retort(loader_instance, self.cls)
+
 
 def _make_merge_new_init(ctx: _MergePatchContext) -> Callable[..., None]:
     def new_init(self: DataclassInstance, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
-        if ctx.loading:
+        if in_internal_construction(ctx):
             ctx.original_init(self, *args, **kwargs)
             return
 
+        if not ctx.prepared:
+            ctx.prepare()
+
         if ctx.cache and ctx.cached_data is not None:
-            loaded_data = ctx.cached_data
-        else:
-            ctx.loading = True
-            try:
+            with config_span(ctx.cls.__name__, cache_hit=True):
+                init_from_loaded(
+                    ctx,
+                    self,
+                    ctx.cached_data,
+                    args,
+                    kwargs,
+                    attach_report=_make_report_attacher(ctx.cached_data) if ctx.debug else None,
+                )
+            # Instances share the stats of the cached load through the class attribute
+            return
+
+        with load_stats_scope(ctx.cls.__name__) as stats, config_span(ctx.cls.__name__, cache_hit=False):
+            ctx.load_stats = stats
+            attach_load_stats(ctx.cls, stats)
+
+            with internal_construction(ctx):
                 loaded_data = _load_and_merge(
                     merge_meta=ctx.merge_meta,
                     dataclass_=ctx.cls,
                     loaders=ctx.loaders,
                     debug=ctx.debug,
+                    ensure_conversion_retort=ctx.ensure_conversion_retort,
                 ).result
-            finally:
-                ctx.loading = False
             if ctx.cache:
                 ctx.cached_data = loaded_data
 
-        complete_kwargs = merge_fields(loaded_data, ctx.field_list, args, kwargs)
-        ctx.original_init(self, *args, **complete_kwargs)
+            init_from_loaded(
+                ctx,
+                self,
+                loaded_data,
+                args,
+                kwargs,
+                attach_report=_make_report_attacher(loaded_data) if ctx.debug else None,
+            )
+        attach_load_stats(self, stats)
 
-        if ctx.debug:
-            report = get_load_report(loaded_data)
-            if report is not None:
-                attach_load_report(self, report)
+    return new_init
 
-        if ctx.original_post_init is None:
-            self.__post_init__()  # type: ignore[attr-defined]
 
-    return new_init
+def _make_report_attacher(loaded_data: DataclassInstance) -> Callable[[DataclassInstance], None]:
+    def attach(instance: DataclassInstance) -> None:
+        report = get_load_report(loaded_data)
+        if report is not None:
+            attach_load_report(instance, report)
+
+    return attach
 
 
 def merge_make_decorator(
@@ -493,6 +583,7 @@ def merge_make_decorator(
     *,
     cache: bool,
     debug: bool,
+    lazy: bool = False,
 ) -> Callable[[type[DataclassInstance]], type[DataclassInstance]]:
     def decorator(cls: type[DataclassInstance]) -> type[DataclassInstance]:
         if not is_dataclass(cls):
@@ -505,8 +596,11 @@ def merge_make_decorator(
             cache=cache,
             debug=debug,
         )
-        cls.__init__ = _make_merge_new_init(ctx)  # type: ignore[method-assign]
+        if not lazy:
+            ctx.prepare()
+        cls.__init__ = with_original_signature(_make_merge_new_init(ctx), ctx.original_init)  # type: ignore[method-assign]
         cls.__post_init__ = make_validating_post_init(ctx)  # type: ignore[attr-defined]
+        attach_patch_context(cls, ctx)
         return cls
 
     return decorator
@@ -1,10 +1,6 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from dature.sources_loader.docker_secrets import DockerSecretsLoader
-from dature.sources_loader.env_ import EnvFileLoader, EnvLoader
-from dature.sources_loader.ini_ import IniLoader
-from dature.sources_loader.json_ import JsonLoader
 from dature.types import ExpandEnvVarsMode
 
 if TYPE_CHECKING:
@@ -35,14 +31,20 @@ def _resolve_by_extension(extension: str) -> "type[LoaderProtocol]":
 def _resolve_by_extension_inner(extension: str) -> "type[LoaderProtocol]":
     match extension:
         case ".json":
+            from dature.sources_loader.json_ import JsonLoader  # noqa: PLC0415
+
             return JsonLoader
         case ".toml":
             from dature.sources_loader.toml_ import Toml11Loader  # noqa: PLC0415
 
             return Toml11Loader
         case ".ini" | ".cfg":
+            from dature.sources_loader.ini_ import IniLoader  # noqa: PLC0415
+
             return IniLoader
         case ".env":
+            from dature.sources_loader.env_ import EnvFileLoader  # noqa: PLC0415
+
             return EnvFileLoader
         case ".yaml" | ".yml":
             from dature.sources_loader.yaml_ import Yaml12Loader  # noqa: PLC0415
@@ -65,6 +67,10 @@ def resolve_loader_class(
     loader: "type[LoaderProtocol] | None",
     file_: str | None,
 ) -> "type[LoaderProtocol]":
+    # Loader modules pull in adaptix, so they are imported only once a loader is resolved
+    from dature.sources_loader.docker_secrets import DockerSecretsLoader  # noqa: PLC0415
+    from dature.sources_loader.env_ import EnvFileLoader, EnvLoader  # noqa: PLC0415
+
     if loader is not None:
         if file_ is not None and loader is EnvLoader:
             msg = (
@@ -93,6 +99,9 @@ def resolve_loader(
     *,
     expand_env_vars: ExpandEnvVarsMode | None = None,
 ) -> "LoaderProtocol":
+    from dature.sources_loader.docker_secrets import DockerSecretsLoader  # noqa: PLC0415
+    from dature.sources_loader.env_ import EnvLoader  # noqa: PLC0415
+
     loader_class = resolve_loader_class(metadata.loader, metadata.file_)
 
     resolved_expand = expand_env_vars or metadata.expand_env_vars or "default"
@@ -1,19 +1,29 @@
 import logging
+import sys
+from array import array
 from collections.abc import Callable
 from dataclasses import asdict, fields, is_dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 from dature.config import config
 from dature.errors.exceptions import DatureConfigError
 from dature.errors.formatter import enrich_skipped_errors, handle_load_errors
-from dature.load_report import FieldOrigin, LoadReport, SourceEntry, attach_load_report
+from dature.errors.location import ErrorContext
+from dature.hooks import config_span
+from dature.load_report import FieldOriginTable, LoadReport, SourceEntry, attach_load_report
+from dature.load_stats import LoadStats, PhaseTimer, attach_load_stats, load_stats_scope
 from dature.loading.context import (
-    apply_skip_invalid,
+    attach_patch_context,
     build_error_ctx,
     ensure_retort,
+    in_internal_construction,
+    init_from_loaded,
+    internal_construction,
+    load_skipping_invalid,
     make_validating_post_init,
-    merge_fields,
+    prepare_lock,
+    with_original_signature,
 )
 from dature.loading.resolver import resolve_loader_class
 from dature.masking.detection import build_secret_paths
@@ -22,9 +32,6 @@ from dature.metadata import LoadMetadata
 from dature.protocols import DataclassInstance, LoaderProtocol
 from dature.types import JSONValue
 
-if TYPE_CHECKING:
-    from adaptix import Retort
-
 logger = logging.getLogger("dature")
 
 
@@ -66,10 +73,8 @@ def _build_single_source_report(
     file_path: str | None,
     raw_data: JSONValue,
     secret_paths: frozenset[str] = frozenset(),
+    stats: LoadStats | None = None,
 ) -> LoadReport:
-    if secret_paths:
-        raw_data = mask_json_value(raw_data, secret_paths=secret_paths)
-
     source = SourceEntry(
         index=0,
         file_path=file_path,
@@ -77,25 +82,22 @@ def _build_single_source_report(
         raw_data=raw_data,
     )
 
-    origins: list[FieldOrigin] = []
+    keys: list[str] = []
+    values: list[JSONValue] = []
     if isinstance(raw_data, dict):
         for key, value in sorted(raw_data.items()):
-            origins.append(
-                FieldOrigin(
-                    key=key,
-                    value=value,
-                    source_index=0,
-                    source_file=file_path,
-                    source_loader_type=loader_type,
-                ),
-            )
+            keys.append(sys.intern(key))
+            values.append(value)
+    origins = FieldOriginTable(keys=tuple(keys), source_indices=array("I", [0]) * len(keys), values=tuple(values))
 
     return LoadReport(
         dataclass_name=dataclass_name,
         strategy=None,
         sources=(source,),
-        field_origins=tuple(origins),
+        field_origins=origins,
         merged_data=raw_data,
+        secret_paths=secret_paths,
+        stats=stats,
     )
 
 
@@ -110,9 +112,6 @@ class _PatchContext:
         cache: bool,
         debug: bool,
     ) -> None:
-        ensure_retort(loader_instance, cls)
-        validating_retort = loader_instance.create_validating_retort(cls)
-
         self.loader_instance = loader_instance
         self.file_path = file_path
         self.cls = cls
@@ -123,25 +122,33 @@ class _PatchContext:
         self.field_list = fields(cls)
         self.original_init = cls.__init__
         self.original_post_init = getattr(cls, "__post_init__", None)
-        self.validation_loader: Callable[[JSONValue], DataclassInstance] = validating_retort.get_loader(cls)
-        self.validating = False
-        self.loading = False
+        self.validated_values: dict[str, Any] | None = None
+        self.load_stats: LoadStats | None = None
+        self.prepared = False
+
+    def prepare(self) -> None:
+        with prepare_lock:
+            if self.prepared:
+                return
 
-        loader_class = resolve_loader_class(metadata.loader, metadata.file_)
-        self.loader_type = loader_class.display_name
+            ensure_retort(self.loader_instance, self.cls)
+            validating_retort = self.loader_instance.create_validating_retort(self.cls)
+            self.validation_loader: Callable[[JSONValue], DataclassInstance] = validating_retort.get_loader(self.cls)
+            self.override_validator = self.loader_instance.create_override_validator(self.cls, validating_retort)
 
-        self.secret_paths: frozenset[str] = frozenset()
-        if _resolve_single_mask_secrets(metadata):
-            extra_patterns = metadata.secret_field_names or ()
-            self.secret_paths = build_secret_paths(cls, extra_patterns=extra_patterns)
+            loader_class = resolve_loader_class(self.metadata.loader, self.metadata.file_)
+            self.loader_type = loader_class.display_name
 
-        self.error_ctx = build_error_ctx(metadata, cls.__name__, secret_paths=self.secret_paths)
+            self.secret_paths: frozenset[str] = frozenset()
+            if _resolve_single_mask_secrets(self.metadata):
+                extra_patterns = self.metadata.secret_field_names or ()
+                self.secret_paths = build_secret_paths(self.cls, extra_patterns=extra_patterns)
 
-        # probe_retort создаётся заранее, чтобы adaptix увидел оригинальную сигнатуру
-        self.probe_retort: Retort | None = None
-        if metadata.skip_if_invalid:
-            self.probe_retort = loader_instance.create_probe_retort()
-            self.probe_retort.get_loader(cls)
+            self.error_ctx = build_error_ctx(self.metadata, self.cls.__name__, secret_paths=self.secret_paths)
+            self.prepared = True
+
+    def source_error_contexts(self) -> tuple[ErrorContext, ...]:
+        return (self.error_ctx,)
 
 
 def _load_single_source(ctx: _PatchContext) -> DataclassInstance:
@@ -150,14 +157,17 @@ def _load_single_source(ctx: _PatchContext) -> DataclassInstance:
         ctx=ctx.error_ctx,
     )
 
-    filter_result = apply_skip_invalid(
+    optimistic = load_skipping_invalid(
         raw=raw_data,
         skip_if_invalid=ctx.metadata.skip_if_invalid,
         loader_instance=ctx.loader_instance,
         dataclass_=ctx.cls,
         log_prefix=f"[{ctx.cls.__name__}]",
-        probe_retort=ctx.probe_retort,
     )
+    if optimistic.loaded is not None:
+        return optimistic.loaded
+
+    filter_result = optimistic.filter_result
     raw_data = filter_result.cleaned_dict
 
     skipped_fields: dict[str, list[LoadMetadata]] = {}
@@ -182,18 +192,26 @@ def _load_single_source(ctx: _PatchContext) -> DataclassInstance:
 
 def _make_new_init(ctx: _PatchContext) -> Callable[..., None]:
     def new_init(self: DataclassInstance, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
-        if ctx.loading:
+        if in_internal_construction(ctx):
             ctx.original_init(self, *args, **kwargs)
             return
 
+        if not ctx.prepared:
+            ctx.prepare()
+
+        attach_report = _make_report_attacher(ctx) if ctx.debug else None
         if ctx.cache and ctx.cached_data is not None:
-            loaded_data = ctx.cached_data
-        else:
-            ctx.loading = True
-            try:
+            with config_span(ctx.cls.__name__, cache_hit=True):
+                init_from_loaded(ctx, self, ctx.cached_data, args, kwargs, attach_report=attach_report)
+            # Instances share the stats of the cached load through the class attribute
+            return
+
+        with load_stats_scope(ctx.cls.__name__) as stats, config_span(ctx.cls.__name__, cache_hit=False):
+            ctx.load_stats = stats
+            attach_load_stats(ctx.cls, stats)
+
+            with internal_construction(ctx):
                 loaded_data = _load_single_source(ctx)
-            finally:
-                ctx.loading = False
 
             _log_single_source_load(
                 dataclass_name=ctx.cls.__name__,
@@ -206,24 +224,25 @@ def _make_new_init(ctx: _PatchContext) -> Callable[..., None]:
             if ctx.cache:
                 ctx.cached_data = loaded_data
 
-        complete_kwargs = merge_fields(loaded_data, ctx.field_list, args, kwargs)
-        ctx.original_init(self, *args, **complete_kwargs)
+            init_from_loaded(ctx, self, loaded_data, args, kwargs, attach_report=attach_report)
+        attach_load_stats(self, stats)
 
-        if ctx.debug:
-            result_dict = asdict(self)
-            report = _build_single_source_report(
-                dataclass_name=ctx.cls.__name__,
-                loader_type=ctx.loader_type,
-                file_path=str(ctx.file_path) if ctx.metadata.file_ is not None else None,
-                raw_data=result_dict,
-                secret_paths=ctx.secret_paths,
-            )
-            attach_load_report(self, report)
+    return new_init
 
-        if ctx.original_post_init is None:
-            self.__post_init__()  # type: ignore[attr-defined]
 
-    return new_init
+def _make_report_attacher(ctx: _PatchContext) -> Callable[[DataclassInstance], None]:
+    def attach(instance: DataclassInstance) -> None:
+        report = _build_single_source_report(
+            dataclass_name=ctx.cls.__name__,
+            loader_type=ctx.loader_type,
+            file_path=str(ctx.file_path) if ctx.metadata.file_ is not None else None,
+            raw_data=asdict(instance),
+            secret_paths=ctx.secret_paths,
+            stats=ctx.load_stats,
+        )
+        attach_load_report(instance, report)
+
+    return attach
 
 
 def load_as_function(  # noqa: C901
@@ -249,13 +268,14 @@ def load_as_function(  # noqa: C901
         ctx=error_ctx,
     )
 
-    filter_result = apply_skip_invalid(
+    optimistic = load_skipping_invalid(
         raw=raw_data,
         skip_if_invalid=metadata.skip_if_invalid,
         loader_instance=loader_instance,
         dataclass_=dataclass_,
         log_prefix=f"[{dataclass_.__name__}]",
     )
+    filter_result = optimistic.filter_result
     raw_data = filter_result.cleaned_dict
 
     skipped_fields: dict[str, list[LoadMetadata]] = {}
@@ -284,10 +304,11 @@ def load_as_function(  # noqa: C901
     validation_loader = validating_retort.get_loader(dataclass_)
 
     try:
-        handle_load_errors(
-            func=lambda: validation_loader(raw_data),
-            ctx=error_ctx,
-        )
+        with PhaseTimer("validation"):
+            handle_load_errors(
+                func=lambda: validation_loader(raw_data),
+                ctx=error_ctx,
+            )
     except DatureConfigError as exc:
         if report is not None:
             attach_load_report(dataclass_, report)
@@ -295,17 +316,20 @@ def load_as_function(  # noqa: C901
             raise enrich_skipped_errors(exc, skipped_fields) from exc
         raise
 
-    try:
-        result = handle_load_errors(
-            func=lambda: loader_instance.transform_to_dataclass(raw_data, dataclass_),
-            ctx=error_ctx,
-        )
-    except DatureConfigError as exc:
-        if report is not None:
-            attach_load_report(dataclass_, report)
-        if skipped_fields:
-            raise enrich_skipped_errors(exc, skipped_fields) from exc
-        raise
+    if optimistic.loaded is not None:
+        result = optimistic.loaded
+    else:
+        try:
+            result = handle_load_errors(
+                func=lambda: loader_instance.transform_to_dataclass(raw_data, dataclass_),
+                ctx=error_ctx,
+            )
+        except DatureConfigError as exc:
+            if report is not None:
+                attach_load_report(dataclass_, report)
+            if skipped_fields:
+                raise enrich_skipped_errors(exc, skipped_fields) from exc
+            raise
 
     if report is not None:
         attach_load_report(result, report)
@@ -320,6 +344,7 @@ def make_decorator(
     metadata: LoadMetadata,
     cache: bool,
     debug: bool,
+    lazy: bool = False,
 ) -> Callable[[type[DataclassInstance]], type[DataclassInstance]]:
     def decorator(cls: type[DataclassInstance]) -> type[DataclassInstance]:
         if not is_dataclass(cls):
@@ -334,8 +359,11 @@ def make_decorator(
             cache=cache,
             debug=debug,
         )
-        cls.__init__ = _make_new_init(ctx)  # type: ignore[method-assign]
+        if not lazy:
+            ctx.prepare()
+        cls.__init__ = with_original_signature(_make_new_init(ctx), ctx.original_init)  # type: ignore[method-assign]
         cls.__post_init__ = make_validating_post_init(ctx)  # type: ignore[attr-defined]
+        attach_patch_context(cls, ctx)
         return cls
 
     return decorator
@@ -8,6 +8,7 @@ from dature.errors.formatter import handle_load_errors
 from dature.errors.location import ErrorContext, read_file_content
 from dature.field_path import FieldPath
 from dature.load_report import SourceEntry
+from dature.load_stats import stats_source
 from dature.loading.context import apply_skip_invalid, build_error_ctx
 from dature.loading.resolver import resolve_loader, resolve_loader_class
 from dature.masking.masking import mask_json_value
@@ -79,13 +80,14 @@ def apply_merge_skip_invalid(
     if not skip_value:
         return FilterResult(cleaned_dict=raw, skipped_paths=[])
 
-    return apply_skip_invalid(
-        raw=raw,
-        skip_if_invalid=skip_value,
-        loader_instance=loader_instance,
-        dataclass_=dataclass_,
-        log_prefix=f"[{dataclass_.__name__}] Source {source_index}:",
-    )
+    with stats_source(source_index):
+        return apply_skip_invalid(
+            raw=raw,
+            skip_if_invalid=skip_value,
+            loader_instance=loader_instance,
+            dataclass_=dataclass_,
+            log_prefix=f"[{dataclass_.__name__}] Source {source_index}:",
+        )
 
 
 @dataclass(frozen=True, slots=True)
@@ -122,8 +124,9 @@ def load_sources(  # noqa: C901
         file_path = Path(source_meta.file_) if source_meta.file_ else Path()
         error_ctx = build_error_ctx(source_meta, dataclass_name, secret_paths=secret_paths)
 
-        def _load_raw(li: LoaderProtocol = loader_instance, fp: Path = file_path) -> JSONValue:
-            return li.load_raw(fp)
+        def _load_raw(li: LoaderProtocol = loader_instance, fp: Path = file_path, index: int = i) -> JSONValue:
+            with stats_source(index):
+                return li.load_raw(fp)
 
         try:
             raw = handle_load_errors(
@@ -1,13 +1,24 @@
-from collections.abc import Callable
+import gc
+from collections.abc import Callable, Mapping
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, overload
 
 from dature.config import config
+from dature.errors.exceptions import DatureConfigError
+from dature.errors.location import warm_location_cache
+from dature.expansion.env_snapshot import env_snapshot_scope
+from dature.hooks import config_span
+from dature.load_stats import attach_load_stats, load_stats_scope
+from dature.loading.context import PatchContext, get_patch_context
 from dature.loading.multi import merge_load_as_function, merge_make_decorator
-from dature.loading.resolver import resolve_loader
+from dature.loading.resolver import resolve_loader, resolve_loader_class
 from dature.loading.single import load_as_function, make_decorator
 from dature.metadata import LoadMetadata, MergeMetadata
 from dature.protocols import DataclassInstance
+from dature.sources_loader.docker_secrets import DockerSecretsLoader
+from dature.sources_loader.env_ import EnvLoader
+from dature.sources_loader.parse_cache import parse_cache_scope
 
 
 @overload
@@ -28,6 +39,7 @@ def load(
     *,
     cache: bool | None = None,
     debug: bool | None = None,
+    lazy: bool | None = None,
 ) -> Callable[[type[DataclassInstance]], type[DataclassInstance]]: ...
 
 
@@ -38,19 +50,23 @@ def load(
     *,
     cache: bool | None = None,
     debug: bool | None = None,
+    lazy: bool | None = None,
 ) -> Any:
     if cache is None:
         cache = config.loading.cache
     if debug is None:
         debug = config.loading.debug
+    if lazy is None:
+        lazy = config.loading.lazy
 
     if isinstance(metadata, tuple):
         metadata = MergeMetadata(sources=metadata)
 
     if isinstance(metadata, MergeMetadata):
         if dataclass_ is not None:
-            return merge_load_as_function(metadata, dataclass_, debug=debug)
-        return merge_make_decorator(metadata, cache=cache, debug=debug)
+            merge_meta = metadata
+            return _load_with_stats(dataclass_, lambda: merge_load_as_function(merge_meta, dataclass_, debug=debug))
+        return merge_make_decorator(metadata, cache=cache, debug=debug, lazy=lazy)
 
     if metadata is None:
         metadata = LoadMetadata()
@@ -59,12 +75,16 @@ def load(
     file_path = Path(metadata.file_) if metadata.file_ else Path()
 
     if dataclass_ is not None:
-        return load_as_function(
-            loader_instance=loader_instance,
-            file_path=file_path,
-            dataclass_=dataclass_,
-            metadata=metadata,
-            debug=debug,
+        load_meta = metadata
+        return _load_with_stats(
+            dataclass_,
+            lambda: load_as_function(
+                loader_instance=loader_instance,
+                file_path=file_path,
+                dataclass_=dataclass_,
+                metadata=load_meta,
+                debug=debug,
+            ),
         )
 
     return make_decorator(
@@ -73,4 +93,67 @@ def load(
         metadata=metadata,
         cache=cache,
         debug=debug,
+        lazy=lazy,
     )
+
+
+def load_many(
+    metadata: LoadMetadata,
+    sections: Mapping[str, type[Any]],
+    /,
+    *,
+    debug: bool | None = None,
+) -> dict[str, Any]:
+    loader_class = resolve_loader_class(metadata.loader, metadata.file_)
+    # Their prefix is matched against flat names, so a dotted section path would never match
+    if issubclass(loader_class, (EnvLoader, DockerSecretsLoader)):
+        msg = f"load_many needs a source with nested sections, {loader_class.display_name} sources are flat"
+        raise ValueError(msg)  # noqa: TRY004
+
+    with env_snapshot_scope(), parse_cache_scope():
+        return {
+            key: load(
+                replace(metadata, prefix=f"{metadata.prefix}.{key}" if metadata.prefix else key),
+                dataclass_,
+                debug=debug,
+            )
+            for key, dataclass_ in sections.items()
+        }
+
+
+def _load_with_stats[T](dataclass_: type[T], func: Callable[[], T]) -> T:
+    with load_stats_scope(dataclass_.__name__) as stats, config_span(dataclass_.__name__, cache_hit=False):
+        try:
+            result = func()
+        except DatureConfigError:
+            attach_load_stats(dataclass_, stats)
+            raise
+    attach_load_stats(result, stats)
+    return result
+
+
+def _require_patch_context(cls: type[DataclassInstance]) -> PatchContext:
+    ctx = get_patch_context(cls)
+    if ctx is None:
+        msg = f"{cls.__name__} is not decorated with @load"
+        raise TypeError(msg)
+    return ctx
+
+
+def warmup(*classes: type[DataclassInstance]) -> None:
+    for cls in classes:
+        _require_patch_context(cls).prepare()
+
+
+# The collector never traverses frozen objects, so workers forked afterwards keep sharing their pages
+def preload(*classes: type[DataclassInstance]) -> None:
+    with env_snapshot_scope(), parse_cache_scope():
+        for cls in classes:
+            ctx = _require_patch_context(cls)
+            ctx.prepare()
+            # Fills the cache of classes decorated with cache=True
+            cls()
+            for error_ctx in ctx.source_error_contexts():
+                warm_location_cache(error_ctx)
+    gc.collect()
+    gc.freeze()
@@ -1,3 +1,10 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
 from dature.config import config
 from dature.load_report import FieldOrigin, SourceEntry
 from dature.types import JSONValue
@@ -9,50 +16,119 @@ try:
 except ImportError:
     _heuristic_detector = None
 
+_HEURISTIC_CACHE_SIZE = 65536
+
+
+@dataclass(frozen=True, slots=True)
+class _MaskSettings:
+    full_mask: str
+    min_visible_chars: int
+    min_length_for_partial_mask: int
+    min_heuristic_length: int
+
+    @classmethod
+    def current(cls) -> "_MaskSettings":
+        cfg = config.masking
+        return cls(
+            full_mask=cfg.mask_char * cfg.fixed_mask_length,
+            min_visible_chars=cfg.min_visible_chars,
+            min_length_for_partial_mask=cfg.min_length_for_partial_mask,
+            min_heuristic_length=cfg.min_heuristic_length,
+        )
+
+
+def _mask_with(value: str, settings: _MaskSettings) -> str:
+    if len(value) < settings.min_length_for_partial_mask:
+        return settings.full_mask
+    return value[: settings.min_visible_chars] + settings.full_mask + value[-settings.min_visible_chars :]
+
 
 def mask_value(value: str) -> str:
-    cfg = config.masking
-    full_mask = cfg.mask_char * cfg.fixed_mask_length
-    if len(value) < cfg.min_length_for_partial_mask:
-        return full_mask
-    return value[: cfg.min_visible_chars] + full_mask + value[-cfg.min_visible_chars :]
+    return _mask_with(value, _MaskSettings.current())
 
 
-def mask_json_value(
+class _PathNode:
+    __slots__ = ("children", "secret")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PathNode] = {}
+        self.secret = False
+
+
+@lru_cache(maxsize=256)
+def _compile_secret_paths(secret_paths: frozenset[str]) -> _PathNode:
+    root = _PathNode()
+    for path in secret_paths:
+        node = root
+        for part in path.split("."):
+            node = node.children.setdefault(part, _PathNode())
+        node.secret = True
+    return root
+
+
+def _find_node(root: _PathNode, path: str) -> _PathNode | None:
+    node: _PathNode | None = root
+    for part in path.split("."):
+        if node is None:
+            return None
+        node = node.children.get(part)
+    return node
+
+
+def _mask_entry(
+    value: JSONValue,
+    node: _PathNode | None,
+    settings: _MaskSettings,
+    random_values: frozenset[str],
+) -> JSONValue:
+    if node is not None and node.secret:
+        if isinstance(value, str):
+            return _mask_with(value, settings)
+        if isinstance(value, dict):
+            return _mask_tree(value, node, settings, random_values)
+        return _mask_with(str(value), settings)
+    if isinstance(value, (dict, list)):
+        return _mask_tree(value, node, settings, random_values)
+    if isinstance(value, str) and value in random_values:
+        return _mask_with(value, settings)
+    return value
+
+
+def _mask_tree(
     data: JSONValue,
-    *,
-    secret_paths: frozenset[str],
-    _prefix: str = "",
+    node: _PathNode | None,
+    settings: _MaskSettings,
+    random_values: frozenset[str],
 ) -> JSONValue:
+    # Without secrets below and without random-looking strings there is nothing to mask in this subtree
+    if node is None and not random_values:
+        return data
+
     if isinstance(data, dict):
-        masked: dict[str, JSONValue] = {}
-        for key, value in data.items():
-            if _prefix:
-                child_path = f"{_prefix}.{key}"
-            else:
-                child_path = key
-
-            if child_path in secret_paths:
-                if isinstance(value, str):
-                    masked[key] = mask_value(value)
-                elif isinstance(value, dict):
-                    masked[key] = mask_json_value(value, secret_paths=secret_paths, _prefix=child_path)
-                else:
-                    masked[key] = mask_value(str(value))
-            elif isinstance(value, (dict, list)):
-                masked[key] = mask_json_value(value, secret_paths=secret_paths, _prefix=child_path)
-            elif isinstance(value, str) and _is_random_string(value):
-                masked[key] = mask_value(value)
-            else:
-                masked[key] = value
-        return masked
+        children = node.children if node is not None else {}
+        return {key: _mask_entry(value, children.get(key), settings, random_values) for key, value in data.items()}
 
     if isinstance(data, list):
-        return [mask_json_value(item, secret_paths=secret_paths, _prefix=_prefix) for item in data]
+        return [_mask_tree(item, node, settings, random_values) for item in data]
 
     return data
 
 
+# Subtrees without secret paths are returned as-is when the tree holds no random-looking strings
+def mask_json_value(
+    data: JSONValue,
+    *,
+    secret_paths: frozenset[str],
+) -> JSONValue:
+    settings = _MaskSettings.current()
+    return _mask_tree(
+        data,
+        _compile_secret_paths(secret_paths),
+        settings,
+        find_random_strings(data, min_length=settings.min_heuristic_length),
+    )
+
+
 def mask_env_line(line: str) -> str:
     for sep in ("=", ":"):
         if sep in line:
@@ -84,21 +160,25 @@ def mask_field_origins(
     *,
     secret_paths: frozenset[str],
 ) -> tuple[FieldOrigin, ...]:
+    settings = _MaskSettings.current()
+    root = _compile_secret_paths(secret_paths)
+
     result: list[FieldOrigin] = []
     for origin in origins:
-        if origin.key in secret_paths:
-            masked_value: JSONValue = mask_value(str(origin.value))
-            result.append(
-                FieldOrigin(
-                    key=origin.key,
-                    value=masked_value,
-                    source_index=origin.source_index,
-                    source_file=origin.source_file,
-                    source_loader_type=origin.source_loader_type,
-                ),
-            )
-        else:
+        # Only secret paths: origin values are reported as loaded, hashes and IDs included
+        masked_value = _mask_entry(origin.value, _find_node(root, origin.key), settings, frozenset())
+        if masked_value is origin.value:
             result.append(origin)
+            continue
+        result.append(
+            FieldOrigin(
+                key=origin.key,
+                value=masked_value,
+                source_index=origin.source_index,
+                source_file=origin.source_file,
+                source_loader_type=origin.source_loader_type,
+            ),
+        )
     return tuple(result)
 
 
@@ -121,10 +201,20 @@ def mask_source_entries(
     return tuple(result)
 
 
-def _is_random_string(value: str) -> bool:
-    if len(value) < config.masking.min_heuristic_length:
-        return False
+@dataclass(frozen=True, slots=True)
+class HeuristicCacheStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
 
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _detect_random(value: str) -> bool:
     if _heuristic_detector is None:
         return False
 
@@ -134,3 +224,90 @@ def _is_random_string(value: str) -> bool:
         return False
     else:
         return result
+
+
+class _ClassificationCache:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        # Per process, so digests left in memory cannot be matched against guessed values elsewhere
+        self._digest_key = os.urandom(16)
+        self._lock = threading.Lock()
+        self._verdicts: OrderedDict[bytes, bool] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _digest(self, value: str) -> bytes:
+        data = value.encode(errors="surrogatepass")
+        return hashlib.blake2b(data, key=self._digest_key, digest_size=16).digest()
+
+    def classify(self, value: str) -> bool:
+        digest = self._digest(value)
+        with self._lock:
+            verdict = self._verdicts.get(digest)
+            if verdict is not None:
+                self._verdicts.move_to_end(digest)
+                self.hits += 1
+                return verdict
+
+        verdict = _detect_random(value)
+        with self._lock:
+            self.misses += 1
+            self._verdicts[digest] = verdict
+            if len(self._verdicts) > self.maxsize:
+                self._verdicts.popitem(last=False)
+        return verdict
+
+    def size(self) -> int:
+        return len(self._verdicts)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._verdicts.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_classification_cache = _ClassificationCache(_HEURISTIC_CACHE_SIZE)
+
+
+def _classify(value: str) -> bool:
+    return _classification_cache.classify(value)
+
+
+def heuristic_cache_stats() -> HeuristicCacheStats:
+    return HeuristicCacheStats(
+        hits=_classification_cache.hits,
+        misses=_classification_cache.misses,
+        size=_classification_cache.size(),
+        maxsize=_classification_cache.maxsize,
+    )
+
+
+def clear_heuristic_cache() -> None:
+    _classification_cache.clear()
+
+
+def _collect_candidates(data: JSONValue, min_length: int, result: set[str]) -> None:
+    # Mirrors _mask_tree: the heuristic applies to string values of mappings only
+    if isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, str):
+                if len(value) >= min_length:
+                    result.add(value)
+            elif isinstance(value, (dict, list)):
+                _collect_candidates(value, min_length, result)
+    elif isinstance(data, list):
+        for item in data:
+            _collect_candidates(item, min_length, result)
+
+
+def find_random_strings(data: JSONValue, *, min_length: int | None = None) -> frozenset[str]:
+    if _heuristic_detector is None:
+        return frozenset()
+
+    if min_length is None:
+        min_length = config.masking.min_heuristic_length
+
+    candidates: set[str] = set()
+    _collect_candidates(data, min_length, candidates)
+    return frozenset(value for value in candidates if _classify(value))
@@ -2,8 +2,6 @@ from dataclasses import dataclass
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
-from dature.loading.resolver import resolve_loader_class
-
 if TYPE_CHECKING:
     from dature.field_path import FieldPath
     from dature.protocols import LoaderProtocol, ValidatorProtocol
@@ -49,6 +47,8 @@ class LoadMetadata:
     mask_secrets: bool | None = None
 
     def __repr__(self) -> str:
+        from dature.loading.resolver import resolve_loader_class  # noqa: PLC0415
+
         loader_class = resolve_loader_class(self.loader, self.file_)
         display = loader_class.display_name
         if self.file_ is not None:
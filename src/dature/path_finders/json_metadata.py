@@ -1,4 +1,6 @@
 import json
+import re
+from bisect import bisect_left
 from collections.abc import Callable
 from dataclasses import dataclass
 from json.decoder import JSONArray, JSONObject, scanstring  # type: ignore[attr-defined]
@@ -24,9 +26,10 @@ def build_json_line_map(content: str) -> dict[tuple[str, ...], LineRange]:
     path_stack: list[str] = []
 
     decoder = json.JSONDecoder()
+    newline_offsets = [match.start() for match in re.finditer("\n", content)]
 
     def _char_to_line(idx: int) -> int:
-        return content.count("\n", 0, idx) + 1
+        return bisect_left(newline_offsets, idx) + 1
 
     def _wrapping_parse_object(
         s_and_end: tuple[str, int],
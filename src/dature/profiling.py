@@ -0,0 +1,84 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from dature.hooks import LoadHook, PhaseEvent, hooks_scope
+from dature.main import load
+from dature.metadata import LoadMetadata, MergeMetadata
+
+
+def _span_name(event: PhaseEvent) -> str:
+    if event.phase == "config":
+        return f"load {event.dataclass_name}"
+    if event.source_index is not None:
+        return f"{event.phase} [source {event.source_index}]"
+    return event.phase
+
+
+def _json_safe(value: Any) -> Any:  # noqa: ANN401
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+# The output opens in chrome://tracing, Perfetto and speedscope
+class ChromeTraceHook(LoadHook):
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._starts: dict[int, float] = {}
+        self.events: list[dict[str, Any]] = []
+
+    def on_start(self, event: PhaseEvent) -> None:
+        self._starts[event.span_id] = time.perf_counter()
+
+    def on_end(self, event: PhaseEvent) -> None:
+        ended = time.perf_counter()
+        started = self._starts.pop(event.span_id, ended)
+
+        args = {key: _json_safe(value) for key, value in event.attributes.items()}
+        if event.dataclass_name is not None:
+            args["dataclass_name"] = event.dataclass_name
+        if event.source_index is not None:
+            args["source_index"] = event.source_index
+        if event.error is not None:
+            args["error"] = repr(event.error)
+
+        self.events.append(
+            {
+                "name": _span_name(event),
+                "cat": "dature",
+                "ph": "X",
+                "ts": (started - self._origin) * 1_000_000,
+                "dur": (ended - started) * 1_000_000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            },
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        # Parents first when spans start at the same microsecond, so viewers nest them correctly
+        ordered = sorted(self.events, key=lambda span: (span["ts"], -span["dur"]))
+        return {"traceEvents": ordered, "displayTimeUnit": "ms"}
+
+    def write(self, out: str | Path) -> None:
+        Path(out).write_text(json.dumps(self.to_json()))
+
+
+# The file is written even when the load fails
+def profile[T](
+    metadata: LoadMetadata | MergeMetadata | tuple[LoadMetadata, ...] | None,
+    dataclass_: type[T],
+    *,
+    out: str | Path,
+    debug: bool | None = None,
+) -> T:
+    hook = ChromeTraceHook()
+    try:
+        with hooks_scope(hook):
+            return load(metadata, dataclass_, debug=debug)
+    finally:
+        hook.write(out)
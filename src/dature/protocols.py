@@ -1,13 +1,16 @@
 from collections.abc import Callable
 from dataclasses import Field
 from pathlib import Path
-from typing import Any, ClassVar, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, TypeVar
 
-from adaptix import Retort
-
-from dature.path_finders.base import PathFinder
 from dature.types import JSONValue
 
+if TYPE_CHECKING:
+    from adaptix import Retort
+
+    from dature.path_finders.base import PathFinder
+    from dature.validators.override import OverrideValidator
+
 _T = TypeVar("_T")
 
 
@@ -23,8 +26,8 @@ class ValidatorProtocol(Protocol):
 
 class LoaderProtocol(Protocol):
     display_name: ClassVar[str]
-    path_finder_class: type[PathFinder] | None
-    retorts: dict[type, Retort]
+    path_finder_class: "type[PathFinder] | None"
+    retorts: "dict[type, Retort]"
 
     def load_raw(self, path: Path) -> JSONValue: ...
 
@@ -32,8 +35,10 @@ class LoaderProtocol(Protocol):
 
     def transform_to_dataclass(self, data: JSONValue, dataclass_: type[_T]) -> _T: ...
 
-    def create_retort(self) -> Retort: ...
+    def create_retort(self) -> "Retort": ...
+
+    def create_probe_retort(self) -> "Retort": ...
 
-    def create_probe_retort(self) -> Retort: ...
+    def create_validating_retort(self, dataclass_: type[_T]) -> "Retort": ...
 
-    def create_validating_retort(self, dataclass_: type[_T]) -> Retort: ...
+    def create_override_validator(self, dataclass_: type[_T], validating_retort: "Retort") -> "OverrideValidator": ...
@@ -0,0 +1,208 @@
+import json
+import os
+import stat
+import struct
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from types import TracebackType
+from typing import Any, Self, cast
+
+from dature.loading.multi import merge_load_validated
+from dature.metadata import LoadMetadata, MergeMetadata
+from dature.protocols import DataclassInstance
+from dature.sources_loader.socket_ import SocketLoader, encode_data
+
+# Segment layout: sequence counter, payload length, then the merged raw data as canonical JSON.
+# The counter is odd while the master writes, so a reader that sees it change or odd retries.
+_HEADER = struct.Struct("<QQ")
+_MIN_CAPACITY = 64 * 1024
+# Long enough for the master to rewrite any payload, even while it is descheduled
+_READ_TIMEOUT = 1.0
+
+type Metadata = LoadMetadata | MergeMetadata | tuple[LoadMetadata, ...] | None
+
+
+def _to_merge_metadata(metadata: Metadata) -> MergeMetadata:
+    if metadata is None:
+        metadata = LoadMetadata()
+    if isinstance(metadata, LoadMetadata):
+        metadata = (metadata,)
+    if isinstance(metadata, tuple):
+        metadata = MergeMetadata(sources=metadata)
+    return metadata
+
+
+def _dump[T: DataclassInstance](merge_meta: MergeMetadata, dataclass_: type[T]) -> bytes:
+    # Data only, never pickles: a process that can write the segment cannot make workers run code
+    return encode_data(merge_load_validated(merge_meta, dataclass_, debug=False).merged_raw)
+
+
+def _make_converter(merge_meta: MergeMetadata | None) -> SocketLoader:
+    # The master converted with the field names of its last source, so workers map them the same way
+    if merge_meta is None:
+        return SocketLoader()
+    last_meta = merge_meta.sources[-1]
+    return SocketLoader(name_style=last_meta.name_style, field_mapping=last_meta.field_mapping)
+
+
+def _check_segment_owner(segment: shared_memory.SharedMemory) -> None:
+    fd: int = segment._fd  # type: ignore[attr-defined]  # noqa: SLF001
+    if fd < 0:
+        return
+    info = os.fstat(fd)
+    if info.st_uid != os.geteuid():
+        msg = f"Shared config {segment.name} belongs to another user"
+        raise PermissionError(msg)
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        msg = f"Shared config {segment.name} is writable by other users"
+        raise PermissionError(msg)
+
+
+class SharedConfig[T: DataclassInstance]:
+    def __init__(
+        self,
+        segment: shared_memory.SharedMemory,
+        dataclass_: type[T],
+        *,
+        merge_meta: MergeMetadata | None = None,
+        owner: bool = False,
+    ) -> None:
+        self._segment = segment
+        self._dataclass = dataclass_
+        self._merge_meta = merge_meta
+        # The master validated the data; workers only convert it, like ConfigServer clients
+        self._converter = _make_converter(merge_meta)
+        # A worker forked from the master inherits this object, but must not reload or unlink
+        self._owner_pid = os.getpid() if owner else None
+        self._lock = threading.Lock()
+        self._cached: tuple[int, T] | None = None
+
+    # capacity defaults to twice the first payload, so reloads have room to grow
+    @classmethod
+    def create(
+        cls,
+        metadata: Metadata,
+        dataclass_: type[T],
+        *,
+        name: str | None = None,
+        capacity: int | None = None,
+    ) -> Self:
+        merge_meta = _to_merge_metadata(metadata)
+        payload = _dump(merge_meta, dataclass_)
+        size = _HEADER.size + (capacity if capacity is not None else max(2 * len(payload), _MIN_CAPACITY))
+        segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        shared = cls(segment, dataclass_, merge_meta=merge_meta, owner=True)
+        shared._publish(payload)
+        return shared
+
+    # Pass the master's metadata when its sources set name_style or field_mapping
+    @classmethod
+    def attach(cls, name: str, dataclass_: type[T], metadata: Metadata = None) -> Self:
+        # Workers must not let the resource tracker unlink the master's segment when they exit
+        if sys.version_info >= (3, 13):
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            segment = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore[attr-defined]  # noqa: SLF001
+        try:
+            _check_segment_owner(segment)
+        except PermissionError:
+            segment.close()
+            raise
+        return cls(segment, dataclass_, merge_meta=None if metadata is None else _to_merge_metadata(metadata))
+
+    @property
+    def name(self) -> str:
+        return self._segment.name
+
+    @property
+    def _buffer(self) -> memoryview:
+        buf = self._segment.buf
+        if buf is None:
+            msg = f"Shared config {self.name} is closed"
+            raise ValueError(msg)
+        return buf
+
+    # One 8-byte read, cheap enough to check on every request
+    @property
+    def version(self) -> int:
+        sequence, _ = _HEADER.unpack_from(self._buffer)
+        return cast("int", sequence) // 2
+
+    def get(self) -> T:
+        with self._lock:
+            cached = self._cached
+        sequence, _ = _HEADER.unpack_from(self._buffer)
+        if cached is not None and cached[0] == sequence:
+            return cached[1]
+
+        sequence, payload = self._read()
+        instance = self._converter.transform_to_dataclass(json.loads(payload), self._dataclass)
+        with self._lock:
+            self._cached = (sequence, instance)
+        return instance
+
+    def reload(self) -> bool:
+        if self._owner_pid != os.getpid():
+            msg = "Only the process that created the shared config can reload it"
+            raise RuntimeError(msg)
+        payload = _dump(cast("MergeMetadata", self._merge_meta), self._dataclass)
+        _, current = self._read()
+        if payload == current:
+            return False
+        self._publish(payload)
+        return True
+
+    def _publish(self, payload: bytes) -> None:
+        buf = self._buffer
+        capacity = len(buf) - _HEADER.size
+        if len(payload) > capacity:
+            msg = (
+                f"Config needs {len(payload)} bytes, the shared segment holds {capacity}; "
+                "create it with a larger capacity"
+            )
+            raise ValueError(msg)
+
+        sequence, _ = _HEADER.unpack_from(buf)
+        _HEADER.pack_into(buf, 0, sequence + 1, 0)
+        buf[_HEADER.size : _HEADER.size + len(payload)] = payload
+        _HEADER.pack_into(buf, 0, sequence + 2, len(payload))
+
+    def _read(self) -> tuple[int, bytes]:
+        buf = self._buffer
+        deadline = time.monotonic() + _READ_TIMEOUT
+        while True:
+            sequence, length = _HEADER.unpack_from(buf)
+            if not sequence % 2:
+                payload = bytes(buf[_HEADER.size : _HEADER.size + length])
+                if _HEADER.unpack_from(buf)[0] == sequence:
+                    return sequence, payload
+            if time.monotonic() >= deadline:
+                break
+            # Give the writing process a chance to finish instead of spinning through the retries
+            time.sleep(0)
+        msg = f"Shared config {self.name} kept changing while it was read"
+        raise RuntimeError(msg)
+
+    def close(self) -> None:
+        self._cached = None
+        self._segment.close()
+        if self._owner_pid == os.getpid():
+            self._segment.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Passing the handle to a spawned worker attaches to the same segment there
+        return (type(self).attach, (self.name, self._dataclass, self._merge_meta))
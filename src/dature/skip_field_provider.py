@@ -12,7 +12,8 @@ from adaptix._internal.provider.essential import Mediator, Provider, RequestHand
 from adaptix._internal.provider.located_request import LocatedRequest
 from adaptix._internal.provider.request_checkers import AlwaysTrueRequestChecker
 from adaptix._internal.provider.shape_provider import InputShapeRequest, provide_generic_resolved_shape
-from adaptix.load_error import LoadError
+from adaptix.load_error import LoadError, LoadExceptionGroup, NoRequiredFieldsLoadError
+from adaptix.struct_trail import get_trail
 
 from dature.protocols import DataclassInstance
 from dature.types import NOT_LOADED, JSONValue, NotLoaded, ProbeDict
@@ -91,26 +92,44 @@ def _remove_path_from_dict(data: dict[str, JSONValue], path: str) -> None:
     current.pop(parts[-1], None)
 
 
+def _collect_failed_paths(
+    exc: BaseException,
+    parent_trail: list[object],
+    result: list[str],
+) -> None:
+    trail: list[object] = [*parent_trail, *get_trail(exc)]
+
+    if isinstance(exc, LoadExceptionGroup):
+        for sub_exc in exc.exceptions:
+            _collect_failed_paths(sub_exc, trail, result)
+        return
+
+    if isinstance(exc, NoRequiredFieldsLoadError):
+        failed_trails = [[*trail, field_name] for field_name in sorted(exc.fields)]
+    else:
+        failed_trails = [trail]
+
+    # Only paths made of dict keys can be removed; errors inside lists are not skippable
+    result.extend(
+        ".".join(cast("list[str]", failed_trail))
+        for failed_trail in failed_trails
+        if failed_trail and all(isinstance(part, str) for part in failed_trail)
+    )
+
+
 @dataclass(frozen=True, slots=True)
 class FilterResult:
     cleaned_dict: JSONValue
     skipped_paths: list[str]
 
 
-def filter_invalid_fields(
-    raw_dict: JSONValue,
-    probe_retort: Retort,
-    dataclass_: type[DataclassInstance],
+def _drop_paths(
+    raw_dict: dict[str, JSONValue],
+    candidate_paths: list[str],
     allowed_fields: set[str] | None,
 ) -> FilterResult:
-    if not isinstance(raw_dict, dict):
-        return FilterResult(cleaned_dict=raw_dict, skipped_paths=[])
-
-    probed: ProbeDict = probe_retort.load(raw_dict, dataclass_)
-    all_not_loaded = _collect_not_loaded_paths(probed, "")
-
     skipped: list[str] = []
-    for path in all_not_loaded:
+    for path in dict.fromkeys(candidate_paths):
         if allowed_fields is not None and path not in allowed_fields:
             continue
         skipped.append(path)
@@ -123,3 +142,30 @@ def filter_invalid_fields(
         _remove_path_from_dict(cleaned, path)
 
     return FilterResult(cleaned_dict=cleaned, skipped_paths=skipped)
+
+
+def filter_invalid_fields(
+    raw_dict: JSONValue,
+    probe_retort: Retort,
+    dataclass_: type[DataclassInstance],
+    allowed_fields: set[str] | None,
+) -> FilterResult:
+    if not isinstance(raw_dict, dict):
+        return FilterResult(cleaned_dict=raw_dict, skipped_paths=[])
+
+    probed: ProbeDict = probe_retort.load(raw_dict, dataclass_)
+    return _drop_paths(raw_dict, _collect_not_loaded_paths(probed, ""), allowed_fields)
+
+
+# Uses the error trails of the failed load instead of probing again
+def filter_failed_fields(
+    raw_dict: JSONValue,
+    exc: BaseException,
+    allowed_fields: set[str] | None,
+) -> FilterResult:
+    if not isinstance(raw_dict, dict):
+        return FilterResult(cleaned_dict=raw_dict, skipped_paths=[])
+
+    failed_paths: list[str] = []
+    _collect_failed_paths(exc, [], failed_paths)
+    return _drop_paths(raw_dict, failed_paths, allowed_fields)
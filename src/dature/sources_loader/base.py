@@ -12,10 +12,12 @@ from adaptix.provider import Provider
 
 from dature.expansion.alias_provider import AliasProvider, resolve_nested_owner
 from dature.expansion.env_expand import expand_env_vars
+from dature.expansion.env_snapshot import env_snapshot_scope
 from dature.field_path import FieldPath
 from dature.fields.byte_size import ByteSize
 from dature.fields.payment_card import PaymentCardNumber
 from dature.fields.secret_str import SecretStr
+from dature.load_stats import PhaseTimer, count_keys, source_bytes
 from dature.path_finders.base import PathFinder
 from dature.protocols import DataclassInstance, LoaderProtocol, ValidatorProtocol
 from dature.skip_field_provider import ModelToDictProvider, SkipFieldProvider
@@ -30,6 +32,7 @@ from dature.sources_loader.loaders.base import (
     timedelta_from_string,
     url_from_string,
 )
+from dature.sources_loader.parse_cache import cached_parse
 from dature.types import (
     URL,
     Base64UrlBytes,
@@ -48,6 +51,7 @@ from dature.validators.base import (
     create_validator_providers,
     extract_validators_from_type,
 )
+from dature.validators.override import OverrideValidator
 
 T = TypeVar("T")
 
@@ -57,6 +61,9 @@ logger = logging.getLogger("dature")
 class BaseLoader(LoaderProtocol, abc.ABC):
     display_name: ClassVar[str]
     path_finder_class: type[PathFinder] | None = None
+    # Loaders whose _load ignores the prefix and other options can share one parse per file.
+    # Only read from the class's own namespace: a subclass that overrides _load must opt in again
+    shares_parsed_file: ClassVar[bool] = False
 
     def __init__(
         self,
@@ -239,9 +246,39 @@ class BaseLoader(LoaderProtocol, abc.ABC):
             ],
         )
 
+    def _own_field_validators(self, dataclass_: type[T]) -> dict[str, list[ValidatorProtocol]]:
+        result: dict[str, list[ValidatorProtocol]] = {}
+        type_hints = get_type_hints(dataclass_, include_extras=True)
+        for field in fields(cast("type[DataclassInstance]", dataclass_)):
+            validators = extract_validators_from_type(type_hints.get(field.name))
+            if validators:
+                result[field.name] = validators
+
+        for field_path_key, validators_value in self._validators.items():
+            if not isinstance(field_path_key, FieldPath):
+                continue
+            if len(field_path_key.parts) != 1 or field_path_key.owner is not dataclass_:
+                continue
+            normalized = list(validators_value) if isinstance(validators_value, tuple) else [validators_value]
+            result.setdefault(field_path_key.parts[0], []).extend(normalized)
+        return result
+
+    def create_override_validator(self, dataclass_: type[T], validating_retort: Retort) -> OverrideValidator:
+        return OverrideValidator(
+            dataclass_=cast("type[DataclassInstance]", dataclass_),
+            retort=validating_retort,
+            field_validators=self._own_field_validators(dataclass_),
+            root_validators=self._root_validators,
+        )
+
     @abc.abstractmethod
     def _load(self, path: Path) -> JSONValue: ...
 
+    def _parse(self, path: Path) -> JSONValue:
+        if not type(self).__dict__.get("shares_parsed_file", False):
+            return self._load(path)
+        return cached_parse(type(self), path, lambda: self._load(path))
+
     def _apply_prefix(self, data: JSONValue) -> JSONValue:
         if not self._prefix:
             return data
@@ -260,13 +297,27 @@ class BaseLoader(LoaderProtocol, abc.ABC):
         return expand_env_vars(prefixed, mode=self._expand_env_vars_mode)
 
     def transform_to_dataclass(self, data: JSONValue, dataclass_: type[T]) -> T:
-        if dataclass_ not in self.retorts:
-            self.retorts[dataclass_] = self.create_retort()
-        return self.retorts[dataclass_].load(data, dataclass_)
+        with PhaseTimer("conversion", loader=self.display_name, target=dataclass_.__name__) as timer:
+            timer.keys = count_keys(data)
+            if dataclass_ not in self.retorts:
+                self.retorts[dataclass_] = self.create_retort()
+            return self.retorts[dataclass_].load(data, dataclass_)
+
+    def _read(self, path: Path) -> tuple[JSONValue, JSONValue]:
+        with env_snapshot_scope():
+            with PhaseTimer("load", loader=self.display_name, file_path=str(path)) as timer:
+                data = self._parse(path)
+                if timer.observed:
+                    timer.bytes_read = source_bytes(path)
+                    timer.keys = count_keys(data)
+
+            with PhaseTimer("pre_processing", loader=self.display_name, file_path=str(path)) as timer:
+                processed = self._pre_processing(data)
+                timer.keys = count_keys(processed)
+        return data, processed
 
     def load_raw(self, path: Path) -> JSONValue:
-        data = self._load(path)
-        processed = self._pre_processing(data)
+        data, processed = self._read(path)
         logger.debug(
             "[%s] load_raw: path=%s, raw_keys=%s, after_preprocessing_keys=%s",
             type(self).__name__,
@@ -277,8 +328,7 @@ class BaseLoader(LoaderProtocol, abc.ABC):
         return processed
 
     def load(self, path: Path, dataclass_: type[T]) -> T:
-        data = self._load(path)
-        pre_processed_data = self._pre_processing(data)
+        _, pre_processed_data = self._read(path)
 
         logger.debug(
             "[%s] load: path=%s, target=%s, keys=%s",
@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time
 from pathlib import Path
 from typing import cast
@@ -19,6 +21,9 @@ from dature.sources_loader.loaders import (
 )
 from dature.types import DotSeparatedPath, ExpandEnvVarsMode, FieldMapping, FieldValidators, JSONValue, NameStyle
 
+_PARALLEL_READ_THRESHOLD = 32
+_MAX_READ_WORKERS = 16
+
 
 def _set_nested(d: dict[str, JSONValue], keys: list[str], value: str) -> None:
     for key in keys[:-1]:
@@ -26,6 +31,18 @@ def _set_nested(d: dict[str, JSONValue], keys: list[str], value: str) -> None:
     d[keys[-1]] = value
 
 
+def _read_secret(file_path: str) -> str:
+    return Path(file_path).read_text().strip()
+
+
+def read_secret_files(file_paths: list[str]) -> list[str]:
+    if len(file_paths) < _PARALLEL_READ_THRESHOLD:
+        return [_read_secret(file_path) for file_path in file_paths]
+
+    with ThreadPoolExecutor(max_workers=_MAX_READ_WORKERS) as pool:
+        return list(pool.map(_read_secret, file_paths))
+
+
 class DockerSecretsLoader(BaseLoader):
     display_name = "docker_secrets"
 
@@ -61,21 +78,28 @@ class DockerSecretsLoader(BaseLoader):
             loader(bool, bool_loader),
         ]
 
-    def _load(self, path: Path) -> JSONValue:
-        result: dict[str, JSONValue] = {}
+    def _select_entries(self, path: Path) -> list[tuple[str, str, str]]:
+        lower_prefix = self._prefix.lower() if self._prefix else None
+        selected: list[tuple[str, str, str]] = []
 
-        for entry in sorted(path.iterdir()):
-            if not entry.is_file():
-                continue
+        with os.scandir(path) as entries:
+            for entry in entries:
+                key = entry.name.lower()
+                # Filter by name first so non-matching secrets are never stat'ed or read
+                if lower_prefix and not key.startswith(lower_prefix):
+                    continue
+                if not entry.is_file():
+                    continue
+                selected.append((entry.name, key, entry.path))
 
-            key = entry.name.lower()
-            value = entry.read_text().strip()
+        selected.sort()
+        return selected
 
-            if self._prefix and not key.startswith(self._prefix.lower()):
-                continue
+    def _assemble(self, secrets: list[tuple[str, str]]) -> dict[str, JSONValue]:
+        result: dict[str, JSONValue] = {}
 
-            if self._prefix:
-                key = key[len(self._prefix) :]
+        for lower_name, value in secrets:
+            key = lower_name[len(self._prefix) :] if self._prefix else lower_name
 
             parts = key.split(self._split_symbols)
             if len(parts) > 1:
@@ -85,6 +109,11 @@ class DockerSecretsLoader(BaseLoader):
 
         return result
 
+    def _load(self, path: Path) -> JSONValue:
+        selected = self._select_entries(path)
+        values = read_secret_files([file_path for _, _, file_path in selected])
+        return self._assemble([(lower_name, value) for (_, lower_name, _), value in zip(selected, values, strict=True)])
+
     def _pre_processing(self, data: JSONValue) -> JSONValue:
         expanded = expand_env_vars(data, mode=self._expand_env_vars_mode)
         return self._parse_string_values(expanded)
@@ -1,4 +1,3 @@
-import os
 from datetime import date, datetime, time
 from pathlib import Path
 from typing import cast
@@ -7,6 +6,7 @@ from adaptix import loader
 from adaptix.provider import Provider
 
 from dature.expansion.env_expand import expand_env_vars
+from dature.expansion.env_snapshot import current_env_snapshot
 from dature.protocols import ValidatorProtocol
 from dature.sources_loader.base import BaseLoader
 from dature.sources_loader.loaders import (
@@ -63,7 +63,7 @@ class EnvLoader(BaseLoader):
         ]
 
     def _load(self, _: Path) -> JSONValue:
-        return cast("JSONValue", os.environ)
+        return dict(current_env_snapshot().with_prefix(self._prefix))
 
     def _pre_processing(self, data: JSONValue) -> JSONValue:
         data_dict = cast("dict[str, str]", data)
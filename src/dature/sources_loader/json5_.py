@@ -19,6 +19,7 @@ from dature.types import JSONValue
 
 class Json5Loader(BaseLoader):
     display_name = "json5"
+    shares_parsed_file = True
     path_finder_class = Json5PathFinder
 
     def _additional_loaders(self) -> list[Provider]:
@@ -19,6 +19,7 @@ from dature.types import JSONValue
 
 class JsonLoader(BaseLoader):
     display_name = "json"
+    shares_parsed_file = True
     path_finder_class = JsonPathFinder
 
     def _additional_loaders(self) -> list[Provider]:
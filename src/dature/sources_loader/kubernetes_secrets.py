@@ -0,0 +1,130 @@
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dature.sources_loader.docker_secrets import DockerSecretsLoader, read_secret_files
+from dature.types import JSONValue
+
+# kubelet writes every update into a fresh timestamped directory and then swaps this symlink
+_DATA_LINK = "..data"
+
+type VolumeChangeListener = Callable[[Path, str], None]
+
+
+@dataclass(slots=True)
+class _VolumeState:
+    version: str
+    data_dir: Path
+    names: tuple[str, ...]
+    values: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def caches_values(self) -> bool:
+        # A directory mtime misses files rewritten in place, so only link versions pin the values
+        return self.version.startswith("link:")
+
+
+_volumes: dict[Path, _VolumeState] = {}
+_listeners: dict[Path, list[VolumeChangeListener]] = {}
+_lock = threading.Lock()
+
+
+def _read_volume(path: Path) -> tuple[str, Path]:
+    try:
+        target = (path / _DATA_LINK).readlink()
+    except OSError:
+        return f"mtime:{path.stat().st_mtime_ns}", path
+    # The timestamped directory the link pointed at, which kubelet never changes afterwards
+    return f"link:{target}", path / target
+
+
+def read_volume_version(path: Path) -> str:
+    version, _ = _read_volume(path)
+    return version
+
+
+def _list_secret_names(data_dir: Path) -> tuple[str, ...]:
+    with os.scandir(data_dir) as entries:
+        return tuple(sorted(entry.name for entry in entries if not entry.name.startswith("..") and entry.is_file()))
+
+
+def _build_state(version: str, data_dir: Path) -> _VolumeState:
+    return _VolumeState(version=version, data_dir=data_dir, names=_list_secret_names(data_dir))
+
+
+def _notify(path: Path, version: str) -> None:
+    for listener in list(_listeners.get(path, ())):
+        listener(path, version)
+
+
+def _refresh_volume(path: Path) -> _VolumeState:
+    key = path.absolute()
+    # The data is read from the directory this version came from, never from a second look at
+    # the link, which kubelet may have swapped in between
+    version, data_dir = _read_volume(key)
+
+    with _lock:
+        state = _volumes.get(key)
+        if state is not None and state.version == version:
+            return state
+        previous = state
+        state = _build_state(version, data_dir)
+        _volumes[key] = state
+
+    if previous is not None:
+        _notify(key, version)
+    return state
+
+
+# Notifies listeners only when the version flipped
+def poll_volume(path: Path) -> bool:
+    key = path.absolute()
+    with _lock:
+        state = _volumes.get(key)
+    if state is not None and state.version == read_volume_version(key):
+        return False
+    _refresh_volume(key)
+    return state is not None
+
+
+def watch_volume(path: Path, listener: VolumeChangeListener) -> Callable[[], None]:
+    key = path.absolute()
+    with _lock:
+        _listeners.setdefault(key, []).append(listener)
+
+    def unsubscribe() -> None:
+        with _lock:
+            listeners = _listeners.get(key, [])
+            if listener in listeners:
+                listeners.remove(listener)
+
+    return unsubscribe
+
+
+def clear_volume_cache() -> None:
+    with _lock:
+        _volumes.clear()
+
+
+class KubernetesSecretsLoader(DockerSecretsLoader):
+    display_name = "kubernetes_secrets"
+
+    def _load(self, path: Path) -> JSONValue:
+        state = _refresh_volume(path)
+
+        lower_prefix = self._prefix.lower() if self._prefix else None
+        selected = [name for name in state.names if not lower_prefix or name.lower().startswith(lower_prefix)]
+
+        if not state.caches_values:
+            values = read_secret_files([str(state.data_dir / name) for name in selected])
+            return self._assemble([(name.lower(), value) for name, value in zip(selected, values, strict=True)])
+
+        missing = [name for name in selected if name not in state.values]
+        if missing:
+            values = read_secret_files([str(state.data_dir / name) for name in missing])
+            with _lock:
+                state.values.update(zip(missing, values, strict=True))
+
+        return self._assemble([(name.lower(), state.values[name]) for name in selected])
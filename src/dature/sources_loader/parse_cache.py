@@ -0,0 +1,35 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from dature.types import JSONValue
+
+type ParseCache = dict[tuple[type, Path], JSONValue]
+
+_active_cache: ContextVar[ParseCache | None] = ContextVar("dature_parse_cache", default=None)
+
+
+# Files changed while the block runs are not read again
+@contextmanager
+def parse_cache_scope() -> Iterator[None]:
+    if _active_cache.get() is not None:
+        yield
+        return
+
+    token = _active_cache.set({})
+    try:
+        yield
+    finally:
+        _active_cache.reset(token)
+
+
+def cached_parse(loader_class: type, path: Path, parse: Callable[[], JSONValue]) -> JSONValue:
+    cache = _active_cache.get()
+    if cache is None:
+        return parse()
+
+    key = (loader_class, path.absolute())
+    if key not in cache:
+        cache[key] = parse()
+    return cache[key]
@@ -0,0 +1,179 @@
+import json
+import socket
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from adaptix import loader
+from adaptix.provider import Provider
+
+from dature.sources_loader.base import BaseLoader
+from dature.sources_loader.loaders import (
+    bool_loader,
+    bytearray_from_json_string,
+    date_from_string,
+    datetime_from_string,
+    none_from_empty_string,
+    optional_from_empty_string,
+)
+from dature.types import JSONValue
+
+# Newline-delimited JSON: a client sends one request line, the server answers with one
+# snapshot line, and keeps pushing snapshot lines on a "subscribe" connection
+GET_REQUEST = b'{"op": "get"}\n'
+SUBSCRIBE_REQUEST = b'{"op": "subscribe"}\n'
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    version: str
+    data: JSONValue
+
+
+type SnapshotListener = Callable[[Path, str], None]
+
+
+def _encode_value(value: Any) -> str:  # noqa: ANN401
+    # Parsers hand back dates and times for YAML and TOML; they cross the socket as ISO strings
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return str(value)
+    msg = f"Cannot send {type(value).__name__} over the config socket"
+    raise TypeError(msg)
+
+
+def encode_snapshot(snapshot: Snapshot) -> bytes:
+    payload = {"version": snapshot.version, "data": snapshot.data}
+    return json.dumps(payload, default=_encode_value).encode() + b"\n"
+
+
+# The server derives the snapshot version from these bytes
+def encode_data(data: JSONValue) -> bytes:
+    return json.dumps(data, default=_encode_value, sort_keys=True).encode()
+
+
+def _read_snapshot(stream: BinaryIO) -> Snapshot | None:
+    line = stream.readline()
+    if not line:
+        return None
+    payload = json.loads(line)
+    return Snapshot(version=payload["version"], data=payload["data"])
+
+
+def fetch_snapshot(path: Path) -> Snapshot:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(GET_REQUEST)
+        with sock.makefile("rb") as stream:
+            snapshot = _read_snapshot(stream)
+    if snapshot is None:
+        msg = f"Config server at {path} closed the connection without a snapshot"
+        raise ConnectionError(msg)
+    return snapshot
+
+
+@dataclass(slots=True)
+class _Subscription:
+    sock: socket.socket
+    listeners: list[SnapshotListener] = field(default_factory=list)
+    snapshot: Snapshot | None = None
+
+
+_subscriptions: dict[Path, _Subscription] = {}
+_lock = threading.Lock()
+
+
+def _receive_pushes(key: Path, subscription: _Subscription) -> None:
+    with subscription.sock.makefile("rb") as stream:
+        while True:
+            try:
+                snapshot = _read_snapshot(stream)
+            except (OSError, ValueError):
+                snapshot = None
+            if snapshot is None:
+                break
+
+            with _lock:
+                previous = subscription.snapshot
+                subscription.snapshot = snapshot
+                listeners = list(subscription.listeners)
+            if previous is not None and previous.version != snapshot.version:
+                for listener in listeners:
+                    listener(key, snapshot.version)
+
+    with _lock:
+        if _subscriptions.get(key) is subscription:
+            del _subscriptions[key]
+    subscription.sock.close()
+
+
+# While subscribed, loads from path use the last pushed snapshot
+def watch_socket(path: Path, listener: SnapshotListener) -> Callable[[], None]:
+    key = path.absolute()
+    with _lock:
+        subscription = _subscriptions.get(key)
+        if subscription is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(str(key))
+                sock.sendall(SUBSCRIBE_REQUEST)
+            except OSError:
+                sock.close()
+                raise
+            subscription = _Subscription(sock=sock)
+            _subscriptions[key] = subscription
+            threading.Thread(
+                target=_receive_pushes,
+                args=(key, subscription),
+                name=f"dature-socket-{key.name}",
+                daemon=True,
+            ).start()
+        subscription.listeners.append(listener)
+
+    def unsubscribe() -> None:
+        with _lock:
+            if listener in subscription.listeners:
+                subscription.listeners.remove(listener)
+            if subscription.listeners:
+                return
+            if _subscriptions.get(key) is subscription:
+                del _subscriptions[key]
+        # The reader thread sees end of stream and closes the socket
+        subscription.sock.shutdown(socket.SHUT_RDWR)
+
+    return unsubscribe
+
+
+def current_snapshot(path: Path) -> Snapshot:
+    with _lock:
+        subscription = _subscriptions.get(path.absolute())
+        snapshot = subscription.snapshot if subscription is not None else None
+    if snapshot is not None:
+        return snapshot
+    return fetch_snapshot(path)
+
+
+# The server already parsed, expanded and merged the sources; only the prefix is applied here
+class SocketLoader(BaseLoader):
+    display_name = "socket"
+
+    def _additional_loaders(self) -> list[Provider]:
+        return [
+            loader(date, date_from_string),
+            loader(datetime, datetime_from_string),
+            loader(time, time.fromisoformat),
+            loader(bytearray, bytearray_from_json_string),
+            loader(type(None), none_from_empty_string),
+            loader(str | None, optional_from_empty_string),
+            loader(bool, bool_loader),
+        ]
+
+    def _load(self, path: Path) -> JSONValue:
+        return current_snapshot(path).data
+
+    def _pre_processing(self, data: JSONValue) -> JSONValue:
+        return self._apply_prefix(data)
@@ -44,6 +44,7 @@ class BaseTomlLoader(BaseLoader, abc.ABC):
 class Toml10Loader(BaseTomlLoader):
     display_name = "toml1.0"
     path_finder_class = Toml10PathFinder
+    shares_parsed_file = True
 
     def _toml_version(self) -> TomlVersion:
         return "1.0.0"
@@ -52,6 +53,7 @@ class Toml10Loader(BaseTomlLoader):
 class Toml11Loader(BaseTomlLoader):
     display_name = "toml1.1"
     path_finder_class = Toml11PathFinder
+    shares_parsed_file = True
 
     def _toml_version(self) -> TomlVersion:
         return "1.1.0"
@@ -34,6 +34,7 @@ class BaseYamlLoader(BaseLoader, abc.ABC):
 class Yaml11Loader(BaseYamlLoader):
     display_name = "yaml1.1"
     path_finder_class = Yaml11PathFinder
+    shares_parsed_file = True
 
     def _yaml_version(self) -> Version:
         return Version(1, 1)
@@ -50,6 +51,7 @@ class Yaml11Loader(BaseYamlLoader):
 class Yaml12Loader(BaseYamlLoader):
     display_name = "yaml1.2"
     path_finder_class = Yaml12PathFinder
+    shares_parsed_file = True
 
     def _yaml_version(self) -> Version:
         return Version(1, 2)
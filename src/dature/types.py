@@ -65,3 +65,5 @@ type _ValidatorKey = "FieldPath | str | int | float | bool | None"
 type FieldValidators = dict[_ValidatorKey, "ValidatorProtocol | tuple[ValidatorProtocol, ...]"]
 
 type FieldMergeCallable = Callable[[list[JSONValue]], JSONValue]
+
+type LoadPhase = Literal["load", "pre_processing", "skip_invalid", "merge", "conversion", "validation"]
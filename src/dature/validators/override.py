@@ -0,0 +1,72 @@
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import asdict, is_dataclass
+from typing import Any, get_type_hints
+
+from adaptix import Retort
+from adaptix.load_error import AggregateLoadError, LoadError, ValidationLoadError
+from adaptix.struct_trail import extend_trail
+
+from dature.protocols import DataclassInstance, ValidatorProtocol
+
+
+def _to_raw(value: Any) -> Any:  # noqa: ANN401
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if type(value) is list:
+        return [_to_raw(item) for item in value]
+    if type(value) is tuple:
+        return tuple(_to_raw(item) for item in value)
+    if type(value) is dict:
+        return {key: _to_raw(item) for key, item in value.items()}
+    return value
+
+
+# Validators of the top-level fields are bound to the owner class, so they are called directly
+class OverrideValidator:
+    def __init__(
+        self,
+        *,
+        dataclass_: type[DataclassInstance],
+        retort: Retort,
+        field_validators: Mapping[str, list[ValidatorProtocol]],
+        root_validators: tuple[ValidatorProtocol, ...],
+    ) -> None:
+        self._dataclass = dataclass_
+        self._retort = retort
+        self._field_validators = field_validators
+        self._root_validators = root_validators
+        self._type_hints: dict[str, Any] | None = None
+        self._field_loaders: dict[str, Callable[[Any], Any]] = {}
+
+    def _field_loader(self, name: str) -> Callable[[Any], Any]:
+        field_loader = self._field_loaders.get(name)
+        if field_loader is None:
+            if self._type_hints is None:
+                self._type_hints = get_type_hints(self._dataclass, include_extras=True)
+            field_loader = self._retort.get_loader(self._type_hints[name])
+            self._field_loaders[name] = field_loader
+        return field_loader
+
+    def _validate_field(self, instance: DataclassInstance, name: str) -> list[LoadError]:
+        try:
+            value = self._field_loader(name)(_to_raw(getattr(instance, name)))
+        except (AggregateLoadError, LoadError) as exc:
+            return [extend_trail(exc, [name])]
+
+        for field_validator in self._field_validators.get(name, ()):
+            if not field_validator.get_validator_func()(value):
+                return [extend_trail(ValidationLoadError(field_validator.get_error_message(), value), [name])]
+        return []
+
+    def validate(self, instance: DataclassInstance, field_names: Iterable[str]) -> None:
+        errors: list[LoadError] = []
+        for name in field_names:
+            errors.extend(self._validate_field(instance, name))
+
+        if errors:
+            msg = f"while loading model {self._dataclass}"
+            raise AggregateLoadError(msg, tuple(errors))
+
+        for root_validator in self._root_validators:
+            if not root_validator.get_validator_func()(instance):
+                raise ValidationLoadError(root_validator.get_error_message(), instance)
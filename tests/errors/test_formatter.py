@@ -1,9 +1,17 @@
+import json
 from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
 
+import pytest
 from adaptix import Retort
 from adaptix.load_error import AggregateLoadError, LoadError
 
-from dature.errors.formatter import extract_field_errors
+from dature.config import ErrorDisplayConfig, configure
+from dature.errors.exceptions import DatureConfigError, FieldLoadError, OmittedErrorsError
+from dature.errors.formatter import extract_field_errors, handle_load_errors
+from dature.errors.location import ErrorContext
+from dature.path_finders.json_ import JsonPathFinder
 
 
 class TestExtractFieldErrors:
@@ -71,3 +79,42 @@ class TestExtractFieldErrors:
             assert len(errors) == 3
             paths = sorted([e.field_path[0] for e in errors])
             assert paths == ["a", "b", "c"]
+
+
+@pytest.mark.usefixtures("_reset_config")
+class TestHandleLoadErrors:
+    def test_collapses_errors_past_cap(self, tmp_path: Path):
+        @dataclass
+        class Config:
+            a: int
+            b: int
+            c: int
+
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{\n  "a": "x",\n  "b": "y",\n  "c": "z"\n}\n')
+        ctx = ErrorContext(
+            dataclass_name="Config",
+            loader_type="json",
+            file_path=config_file,
+            prefix=None,
+            split_symbols="__",
+            path_finder_class=JsonPathFinder,
+        )
+        configure(error_display=ErrorDisplayConfig(max_located_errors=2))
+
+        with pytest.raises(DatureConfigError) as exc_info:
+            handle_load_errors(
+                func=lambda: Retort(strict_coercion=False).load(json.loads(config_file.read_text()), Config),
+                ctx=ctx,
+            )
+
+        located = cast("list[FieldLoadError]", list(exc_info.value.exceptions[:2]))
+        omitted = exc_info.value.exceptions[2]
+        assert [error.field_path for error in located] == [["a"], ["b"]]
+        assert all(error.location is not None for error in located)
+        assert isinstance(omitted, OmittedErrorsError)
+        assert omitted.count == 1
+        message = str(exc_info.value)
+        assert message.startswith("Config loading errors (3)")
+        assert "  ... and 1 more errors" in message
+        assert "[c]" not in message
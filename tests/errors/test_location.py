@@ -1,7 +1,16 @@
+from collections.abc import Generator
 from pathlib import Path
 
+import pytest
+
+from dature.errors import location
 from dature.errors.exceptions import LineRange
-from dature.errors.location import ErrorContext, resolve_source_location
+from dature.errors.location import (
+    ErrorContext,
+    clear_location_cache,
+    resolve_source_location,
+    warm_location_cache,
+)
 from dature.path_finders.json_ import JsonPathFinder
 from dature.path_finders.toml_ import Toml11PathFinder
 
@@ -132,3 +141,58 @@ class TestResolveSourceLocation:
         )
         loc = resolve_source_location(["timeout"], ctx, file_content=content)
         assert loc.line_content == ['{"password": "se*****23", "timeout": "30"}']
+
+
+class TestWarmLocationCache:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Generator[None]:
+        clear_location_cache()
+        yield
+        clear_location_cache()
+
+    def test_keeps_every_warmed_source(self, tmp_path: Path):
+        built: list[str] = []
+
+        class CountingPathFinder(JsonPathFinder):
+            def __init__(self, content: str) -> None:
+                built.append(content)
+                super().__init__(content)
+
+        contexts = []
+        for i in range(20):
+            json_file = tmp_path / f"config_{i}.json"
+            json_file.write_text(f'{{\n  "port": {i}\n}}')
+            ctx = ErrorContext(
+                dataclass_name="Config",
+                loader_type="json",
+                file_path=json_file,
+                prefix=None,
+                split_symbols="__",
+                path_finder_class=CountingPathFinder,
+            )
+            warm_location_cache(ctx)
+            contexts.append((ctx, json_file.read_text()))
+
+        for ctx, content in contexts:
+            loc = resolve_source_location(["port"], ctx, file_content=content)
+            assert loc.line_range == LineRange(start=2, end=2)
+
+        assert len(built) == 20
+
+    def test_new_version_replaces_warmed_indexes(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        ctx = ErrorContext(
+            dataclass_name="Config",
+            loader_type="json",
+            file_path=json_file,
+            prefix=None,
+            split_symbols="__",
+            path_finder_class=JsonPathFinder,
+        )
+        for i in range(5):
+            json_file.write_text(f'{{"password": "secret-{i}"}}')
+            warm_location_cache(ctx)
+
+        assert len(location._warmed_content_lines) == 1
+        assert len(location._warmed_path_finders) == 1
+        assert all(isinstance(key, bytes) for key in location._warmed_content_lines)
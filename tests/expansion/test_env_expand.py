@@ -1,7 +1,7 @@
 import pytest
 
 from dature.errors.exceptions import EnvVarExpandError
-from dature.expansion.env_expand import expand_env_vars, expand_string
+from dature.expansion.env_expand import _compile_template, expand_env_vars, expand_string
 from dature.types import JSONValue
 
 
@@ -327,3 +327,39 @@ class TestExpandEnvVars:
 
         with pytest.raises(EnvVarExpandError):
             expand_env_vars(data, mode="strict")
+
+
+class TestExpandEnviron:
+    def test_explicit_environ_used_instead_of_os_environ(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DATURE_TEST_VAR", "from-os")
+
+        result = expand_string("$DATURE_TEST_VAR", mode="default", environ={"DATURE_TEST_VAR": "from-snapshot"})
+
+        assert result == "from-snapshot"
+
+    def test_structure_uses_one_snapshot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("DATURE_TEST_VAR", raising=False)
+        data: JSONValue = {"a": "$DATURE_TEST_VAR", "b": ["${DATURE_TEST_VAR:-fallback}"]}
+
+        result = expand_env_vars(data, mode="strict", environ={"DATURE_TEST_VAR": "snap"})
+
+        assert result == {"a": "snap", "b": ["snap"]}
+
+
+class TestCompiledTemplates:
+    def test_plain_strings_are_not_compiled(self) -> None:
+        _compile_template.cache_clear()
+
+        expand_env_vars({"a": "plain", "b": ["also plain"]}, mode="default")
+
+        assert _compile_template.cache_info().currsize == 0
+
+    def test_repeated_string_compiled_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DATURE_TEST_VAR", "hello")
+        _compile_template.cache_clear()
+
+        expand_env_vars(["$DATURE_TEST_VAR"] * 10, mode="default")
+
+        info = _compile_template.cache_info()
+        assert info.misses == 1
+        assert info.hits == 9
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+
+import pytest
+
+from dature import LoadMetadata, MergeMetadata, load
+from dature.expansion.env_snapshot import EnvSnapshot, current_env_snapshot, env_snapshot_scope
+
+
+class TestEnvSnapshot:
+    def test_copy_is_isolated_from_environ(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DATURE_SNAP", "before")
+        snapshot = EnvSnapshot.capture()
+
+        monkeypatch.setenv("DATURE_SNAP", "after")
+
+        assert snapshot["DATURE_SNAP"] == "before"
+
+    def test_with_prefix(self) -> None:
+        snapshot = EnvSnapshot({"APP_HOST": "h", "APP_PORT": "1", "APPX": "x", "DB_HOST": "d"})
+
+        assert snapshot.with_prefix("APP_") == (("APP_HOST", "h"), ("APP_PORT", "1"))
+        assert snapshot.with_prefix("MISSING_") == ()
+
+    def test_with_prefix_none_returns_everything(self) -> None:
+        snapshot = EnvSnapshot({"A": "1", "B": "2"})
+
+        assert dict(snapshot.with_prefix(None)) == {"A": "1", "B": "2"}
+
+    def test_get(self) -> None:
+        snapshot = EnvSnapshot({"A": "1"})
+
+        assert snapshot.get("A") == "1"
+        assert snapshot.get("B") is None
+
+
+class TestEnvSnapshotScope:
+    def test_nested_scope_reuses_outer(self) -> None:
+        with env_snapshot_scope() as outer, env_snapshot_scope() as inner:
+            assert inner is outer
+            assert current_env_snapshot() is outer
+
+    def test_outside_scope_captures_fresh(self) -> None:
+        assert current_env_snapshot() is not current_env_snapshot()
+
+    def test_merge_captures_environment_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("APP_HOST", "localhost")
+        monkeypatch.setenv("DB_PORT", "5432")
+
+        captures: list[EnvSnapshot] = []
+        original_capture = EnvSnapshot.capture.__func__  # type: ignore[attr-defined]
+
+        def _counting_capture(cls: type[EnvSnapshot]) -> EnvSnapshot:
+            snapshot = original_capture(cls)
+            captures.append(snapshot)
+            return snapshot
+
+        monkeypatch.setattr(EnvSnapshot, "capture", classmethod(_counting_capture))
+
+        @dataclass
+        class Config:
+            host: str
+            port: int
+
+        result = load(
+            MergeMetadata(
+                sources=(
+                    LoadMetadata(prefix="APP_"),
+                    LoadMetadata(prefix="DB_"),
+                ),
+            ),
+            Config,
+        )
+
+        assert result == Config(host="localhost", port=5432)
+        assert len(captures) == 1
@@ -8,6 +8,7 @@ import pytest
 
 from dature import LoadMetadata, MergeMetadata, MergeStrategy, load
 from dature.errors.exceptions import DatureConfigError, MergeConflictError
+from dature.loading.context import get_patch_context
 
 
 class TestMergeLoadAsFunction:
@@ -420,6 +421,43 @@ class TestMergeAsDecorator:
         assert config.host == "first-host"
         assert config.port == 1000
 
+    def test_only_last_source_builds_retort(self, tmp_path: Path):
+        sources = []
+        for idx in range(3):
+            source = tmp_path / f"source{idx}.json"
+            source.write_text(f'{{"port": {idx}}}')
+            sources.append(LoadMetadata(file_=str(source)))
+
+        @load(MergeMetadata(sources=tuple(sources)))
+        @dataclass
+        class Config:
+            port: int
+
+        loaders = get_patch_context(Config).loaders
+
+        assert [Config in loader.retorts for loader in loaders] == [False, False, True]
+        assert Config().port == 2
+
+    def test_broken_last_source_converts_with_previous_loader(self, tmp_path: Path):
+        defaults = tmp_path / "defaults.json"
+        defaults.write_text('{"host": "localhost", "port": 3000}')
+
+        meta = MergeMetadata(
+            sources=(
+                LoadMetadata(file_=str(defaults)),
+                LoadMetadata(file_=str(tmp_path / "missing.json")),
+            ),
+            skip_broken_sources=True,
+        )
+
+        @load(meta)
+        @dataclass
+        class Config:
+            host: str
+            port: int
+
+        assert Config() == Config(host="localhost", port=3000)
+
 
 class TestRaiseOnConflict:
     def test_raises_on_scalar_conflict(self, tmp_path: Path):
@@ -1,13 +1,19 @@
 """Tests for loading/single.py."""
 
+import threading
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Annotated
 
 import pytest
 
+from dature.errors.exceptions import DatureConfigError
+from dature.loading import context
 from dature.loading.single import load_as_function, make_decorator
 from dature.metadata import LoadMetadata
 from dature.sources_loader.json_ import JsonLoader
+from dature.types import JSONValue
+from dature.validators.number import Ge
 
 
 class TestMakeDecorator:
@@ -247,6 +253,223 @@ class TestCache:
         assert second.port == 8080
 
 
+class TestInstantiationFastPath:
+    @pytest.fixture
+    def validation_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[int]:
+        calls: list[int] = []
+        original = context.handle_load_errors
+
+        def _counting(**kwargs):
+            calls.append(1)
+            return original(**kwargs)
+
+        monkeypatch.setattr(context, "handle_load_errors", _counting)
+        return calls
+
+    def _decorate(self, json_file: Path, cls: type) -> None:
+        make_decorator(
+            loader_instance=JsonLoader(),
+            file_path=json_file,
+            metadata=LoadMetadata(file_=str(json_file)),
+            cache=True,
+            debug=False,
+        )(cls)
+
+    def test_repeated_instantiation_validates_once(self, tmp_path: Path, validation_calls: list[int]):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        self._decorate(json_file, Config)
+
+        first = Config()
+        second = Config()
+        third = Config()
+
+        assert len(validation_calls) == 1
+        assert first == second == third
+        assert third.port == 8080
+
+    def test_override_still_validated(self, tmp_path: Path, validation_calls: list[int]):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        self._decorate(json_file, Config)
+
+        Config()
+        Config()
+        Config(port=9090)
+
+        assert len(validation_calls) == 2
+
+    def test_post_init_runs_on_fast_path(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+        post_init_calls: list[int] = []
+
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+            def __post_init__(self) -> None:
+                post_init_calls.append(self.port)
+
+        self._decorate(json_file, Config)
+
+        Config()
+        Config()
+
+        assert post_init_calls == [8080, 8080]
+
+    def test_trusted_call_does_not_skip_validation_in_other_threads(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+        started = threading.Event()
+        release = threading.Event()
+
+        @dataclass
+        class Config:
+            name: str
+            port: Annotated[int, Ge(value=1)]
+
+            def __post_init__(self) -> None:
+                if threading.current_thread().name == "trusted":
+                    started.set()
+                    release.wait(timeout=5)
+
+        self._decorate(json_file, Config)
+        Config()
+
+        trusted = threading.Thread(target=Config, name="trusted")
+        trusted.start()
+        try:
+            assert started.wait(timeout=5)
+            with pytest.raises(DatureConfigError):
+                Config(port=0)
+        finally:
+            release.set()
+            trusted.join()
+
+    def test_override_fields_are_kept_per_call(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+        started = {"invalid": threading.Event(), "valid": threading.Event()}
+        release = {"invalid": threading.Event(), "valid": threading.Event()}
+        errors: list[Exception] = []
+
+        @dataclass
+        class Config:
+            name: str
+            port: Annotated[int, Ge(value=1)]
+
+            def __post_init__(self) -> None:
+                name = threading.current_thread().name
+                if name in started:
+                    started[name].set()
+                    release[name].wait(timeout=5)
+
+        self._decorate(json_file, Config)
+        Config()
+
+        def _invalid_override() -> None:
+            try:
+                Config(port=0)
+            except DatureConfigError as exc:
+                errors.append(exc)
+
+        invalid = threading.Thread(target=_invalid_override, name="invalid")
+        valid = threading.Thread(target=lambda: Config(name="other"), name="valid")
+        invalid.start()
+        valid.start()
+        try:
+            assert started["invalid"].wait(timeout=5)
+            assert started["valid"].wait(timeout=5)
+            # The invalid override validates while the valid one is still in flight
+            release["invalid"].set()
+            invalid.join()
+        finally:
+            release["invalid"].set()
+            release["valid"].set()
+            invalid.join()
+            valid.join()
+
+        assert len(errors) == 1
+
+    def test_loading_in_other_thread_does_not_bypass_init(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+        started = threading.Event()
+        release = threading.Event()
+
+        class BlockingLoader(JsonLoader):
+            def _load(self, path: Path) -> JSONValue:
+                if threading.current_thread().name == "loading":
+                    started.set()
+                    release.wait(timeout=5)
+                return super()._load(path)
+
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        make_decorator(
+            loader_instance=BlockingLoader(),
+            file_path=json_file,
+            metadata=LoadMetadata(file_=str(json_file)),
+            cache=False,
+            debug=False,
+        )(Config)
+
+        loading = threading.Thread(target=Config, name="loading")
+        loading.start()
+        try:
+            assert started.wait(timeout=5)
+            config = Config()
+        finally:
+            release.set()
+            loading.join()
+
+        assert config.port == 8080
+
+    def test_validation_does_not_load_again(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+        loads: list[Path] = []
+
+        class CountingLoader(JsonLoader):
+            def _load(self, path: Path) -> JSONValue:
+                loads.append(path)
+                return super()._load(path)
+
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        make_decorator(
+            loader_instance=CountingLoader(),
+            file_path=json_file,
+            metadata=LoadMetadata(file_=str(json_file)),
+            cache=False,
+            debug=False,
+        )(Config)
+
+        Config()
+
+        assert loads == [json_file]
+
+
 class TestLoadAsFunction:
     def test_returns_loaded_dataclass(self, tmp_path: Path):
         json_file = tmp_path / "config.json"
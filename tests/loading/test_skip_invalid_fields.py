@@ -9,6 +9,7 @@ import pytest
 
 from dature import F, LoadMetadata, MergeMetadata, MergeStrategy, load
 from dature.errors.exceptions import DatureConfigError
+from dature.sources_loader.json_ import JsonLoader
 
 
 class TestMergeSkipInvalidFields:
@@ -383,6 +384,28 @@ class TestSingleSourceSkipInvalidFields:
         assert cfg.host == "localhost"
         assert cfg.port == 8080
 
+    def test_valid_data_skips_probe_retort(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+
+        def _fail_probe(_self: object) -> None:
+            msg = "probe retort must not be built for valid data"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(JsonLoader, "create_probe_retort", _fail_probe)
+
+        @dataclass
+        class Config:
+            host: str
+            port: int
+
+        result = load(
+            LoadMetadata(file_=str(json_file), skip_if_invalid=True),
+            Config,
+        )
+
+        assert result == Config(host="localhost", port=8080)
+
     def test_single_source_specific_fields(self, tmp_path: Path):
         json_file = tmp_path / "config.json"
         json_file.write_text('{"host": "localhost", "port": "abc", "timeout": 60}')
@@ -9,7 +9,11 @@ from dature import LoadMetadata, MergeMetadata, get_load_report, load
 from dature.errors.exceptions import DatureConfigError
 from dature.fields.secret_str import SecretStr
 from dature.load_report import FieldOrigin, SourceEntry
+from dature.masking import masking
 from dature.masking.masking import (
+    clear_heuristic_cache,
+    find_random_strings,
+    heuristic_cache_stats,
     mask_env_line,
     mask_field_origins,
     mask_json_value,
@@ -131,6 +135,19 @@ class TestMaskFieldOrigins:
         result = mask_field_origins(origins, secret_paths=frozenset())
         assert result[0].value == "production"
 
+    def test_random_looking_origin_is_not_masked(self):
+        origins = (
+            FieldOrigin(
+                key="commit",
+                value="aK7bQ9xZ2mP4vL8nR3tW6yH1",
+                source_index=0,
+                source_file="config.yaml",
+                source_loader_type="yaml",
+            ),
+        )
+        result = mask_field_origins(origins, secret_paths=frozenset({"password"}))
+        assert result[0].value == "aK7bQ9xZ2mP4vL8nR3tW6yH1"
+
 
 class TestMaskSourceEntries:
     def test_mask_entries(self):
@@ -163,6 +180,64 @@ class TestMaskEnvLine:
         assert mask_env_line(line) == expected
 
 
+class TestMaskingPlan:
+    def test_subtree_without_secrets_is_not_copied(self):
+        with patch("dature.masking.masking._heuristic_detector", None):
+            public = {"host": "localhost", "ports": [80, 443]}
+            data = {"public": public, "db": {"password": "secret123"}}
+
+            result = mask_json_value(data, secret_paths=frozenset({"db.password"}))
+
+        assert result["public"] is public
+        assert result["db"] == {"password": "se*****23"}
+
+    def test_nested_secret_under_list(self):
+        data = {"users": [{"name": "alice", "token": "tok_12345"}]}
+
+        result = mask_json_value(data, secret_paths=frozenset({"users.token"}))
+
+        assert result == {"users": [{"name": "alice", "token": "to*****45"}]}
+
+    def test_dotted_prefix_is_not_secret(self):
+        data = {"db": {"password": "secret123", "passwordless": "yes"}}
+
+        result = mask_json_value(data, secret_paths=frozenset({"db.password"}))
+
+        assert result == {"db": {"password": "se*****23", "passwordless": "yes"}}
+
+
+class TestHeuristicCache:
+    def test_each_distinct_value_classified_once(self):
+        clear_heuristic_cache()
+        data = {"a": "aB3xK9mZ", "b": "aB3xK9mZ", "c": "production_host"}
+
+        mask_json_value(data, secret_paths=frozenset())
+        mask_json_value(data, secret_paths=frozenset())
+
+        stats = heuristic_cache_stats()
+        assert stats.misses == 2
+        assert stats.hits == 2
+        assert stats.hit_rate == 0.5
+
+    def test_cache_does_not_keep_values(self):
+        clear_heuristic_cache()
+
+        mask_json_value({"token": "aB3xK9mZ"}, secret_paths=frozenset())
+
+        verdicts = masking._classification_cache._verdicts
+        assert len(verdicts) == 1
+        assert all(isinstance(key, bytes) and b"aB3xK9mZ" not in key for key in verdicts)
+
+    def test_find_random_strings(self):
+        data = {"token": "aB3xK9mZ", "short": "aB3x", "nested": [{"host": "production_host"}]}
+
+        assert find_random_strings(data, min_length=8) == frozenset({"aB3xK9mZ"})
+
+    def test_find_random_strings_without_detector(self):
+        with patch("dature.masking.masking._heuristic_detector", None):
+            assert find_random_strings({"token": "aB3xK9mZ"}) == frozenset()
+
+
 class TestGracefulDegradation:
     def test_no_masking_without_detector(self):
         with patch("dature.masking.masking._heuristic_detector", None):
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
+
+from dature.sources_loader import docker_secrets
 from dature.sources_loader.docker_secrets import DockerSecretsLoader
 from examples.all_types_dataclass import EXPECTED_ALL_TYPES, AllPythonTypesCompact
 from tests.sources_loader.checker import assert_all_types_equal
@@ -73,3 +76,32 @@ class TestDockerSecretsLoader:
 
         assert result.api_url == "https://api.example.com/v1"
         assert result.base == "https://api.example.com"
+
+    def test_non_matching_prefix_not_read(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        (tmp_path / "APP_name").write_text("myapp")
+        (tmp_path / "OTHER_key").write_text("ignored")
+
+        read_paths: list[str] = []
+        original_read = docker_secrets._read_secret
+
+        def _tracking_read(file_path: str) -> str:
+            read_paths.append(Path(file_path).name)
+            return original_read(file_path)
+
+        monkeypatch.setattr(docker_secrets, "_read_secret", _tracking_read)
+
+        loader = DockerSecretsLoader(prefix="APP_")
+        data = loader._load(tmp_path)
+
+        assert data == {"name": "myapp"}
+        assert read_paths == ["APP_name"]
+
+    def test_many_secrets_read_in_parallel(self, tmp_path: Path):
+        count = docker_secrets._PARALLEL_READ_THRESHOLD * 2
+        for i in range(count):
+            (tmp_path / f"key_{i:03d}").write_text(f"value_{i}\n")
+
+        loader = DockerSecretsLoader()
+        data = loader._load(tmp_path)
+
+        assert data == {f"key_{i:03d}": f"value_{i}" for i in range(count)}
@@ -0,0 +1,152 @@
+from collections.abc import Generator
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from dature import LoadMetadata, load
+from dature.sources_loader import kubernetes_secrets
+from dature.sources_loader.kubernetes_secrets import (
+    KubernetesSecretsLoader,
+    clear_volume_cache,
+    poll_volume,
+    read_volume_version,
+    watch_volume,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_volume_cache() -> Generator[None]:
+    clear_volume_cache()
+    yield
+    clear_volume_cache()
+
+
+def _write_version(volume: Path, version: str, secrets: dict[str, str]) -> None:
+    """Mimic kubelet's atomic writer: new timestamped dir, then swap the ..data symlink."""
+    data_dir = volume / f"..{version}"
+    data_dir.mkdir()
+    for name, value in secrets.items():
+        (data_dir / name).write_text(value)
+
+    tmp_link = volume / "..data_tmp"
+    tmp_link.symlink_to(data_dir.name)
+    tmp_link.replace(volume / "..data")
+
+    for name in secrets:
+        user_link = volume / name
+        if not user_link.is_symlink():
+            user_link.symlink_to(Path("..data") / name)
+
+
+@pytest.fixture
+def volume(tmp_path: Path) -> Path:
+    _write_version(tmp_path, "v1", {"APP_host": "localhost", "APP_port": "8080", "other": "x"})
+    return tmp_path
+
+
+@pytest.fixture
+def read_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+    original = kubernetes_secrets.read_secret_files
+
+    def _tracking(file_paths: list[str]) -> list[str]:
+        calls.append([Path(p).name for p in file_paths])
+        return original(file_paths)
+
+    monkeypatch.setattr(kubernetes_secrets, "read_secret_files", _tracking)
+    return calls
+
+
+class TestKubernetesSecretsLoader:
+    def test_reads_through_data_link(self, volume: Path):
+        loader = KubernetesSecretsLoader(prefix="APP_")
+
+        assert loader._load(volume) == {"host": "localhost", "port": "8080"}
+
+    def test_unchanged_version_skips_reads(self, volume: Path, read_calls: list[list[str]]):
+        loader = KubernetesSecretsLoader(prefix="APP_")
+
+        loader._load(volume)
+        loader._load(volume)
+        KubernetesSecretsLoader(prefix="APP_")._load(volume)
+
+        assert read_calls == [["APP_host", "APP_port"]]
+
+    def test_symlink_flip_rereads(self, volume: Path):
+        loader = KubernetesSecretsLoader(prefix="APP_")
+        loader._load(volume)
+
+        _write_version(volume, "v2", {"APP_host": "db.internal", "APP_port": "9090"})
+
+        assert loader._load(volume) == {"host": "db.internal", "port": "9090"}
+
+    def test_reads_the_version_it_saw(self, volume: Path, monkeypatch: pytest.MonkeyPatch):
+        original = kubernetes_secrets._read_volume
+
+        def _flip_after_read(path: Path) -> tuple[str, Path]:
+            seen = original(path)
+            # kubelet swaps the link right after the version was read
+            _write_version(volume, "v2", {"APP_host": "db.internal", "APP_port": "9090"})
+            return seen
+
+        monkeypatch.setattr(kubernetes_secrets, "_read_volume", _flip_after_read)
+
+        assert KubernetesSecretsLoader(prefix="APP_")._load(volume) == {"host": "localhost", "port": "8080"}
+
+    def test_plain_directory_uses_mtime(self, tmp_path: Path):
+        (tmp_path / "host").write_text("localhost")
+
+        assert read_volume_version(tmp_path).startswith("mtime:")
+        assert KubernetesSecretsLoader()._load(tmp_path) == {"host": "localhost"}
+
+    def test_plain_directory_rereads_files_rewritten_in_place(self, tmp_path: Path):
+        secret = tmp_path / "host"
+        secret.write_text("localhost")
+        loader = KubernetesSecretsLoader()
+        loader._load(tmp_path)
+
+        with secret.open("w") as file_:
+            file_.write("db.internal")
+
+        assert loader._load(tmp_path) == {"host": "db.internal"}
+
+    def test_load_with_metadata(self, volume: Path):
+        @dataclass
+        class Config:
+            host: str
+            port: int
+
+        result = load(LoadMetadata(file_=str(volume), loader=KubernetesSecretsLoader, prefix="APP_"), Config)
+
+        assert result == Config(host="localhost", port=8080)
+
+
+class TestVolumeWatching:
+    def test_listener_called_only_on_flip(self, volume: Path):
+        events: list[str] = []
+        unsubscribe = watch_volume(volume, lambda _path, version: events.append(version))
+
+        KubernetesSecretsLoader()._load(volume)
+        KubernetesSecretsLoader()._load(volume)
+        assert events == []
+
+        _write_version(volume, "v2", {"APP_host": "db.internal"})
+        KubernetesSecretsLoader()._load(volume)
+
+        assert events == [f"link:{(volume / '..data').readlink()}"]
+
+        unsubscribe()
+        _write_version(volume, "v3", {"APP_host": "other"})
+        KubernetesSecretsLoader()._load(volume)
+        assert len(events) == 1
+
+    def test_poll_volume(self, volume: Path):
+        KubernetesSecretsLoader()._load(volume)
+
+        assert poll_volume(volume) is False
+
+        _write_version(volume, "v2", {"APP_host": "db.internal"})
+
+        assert poll_volume(volume) is True
+        assert poll_volume(volume) is False
@@ -1,5 +1,6 @@
 import pytest
 
+from dature import main
 from dature.config import (
     ErrorDisplayConfig,
     LoadingConfig,
@@ -195,3 +196,35 @@ class TestValidation:
         _ConfigProxy.set_instance(None)
         with pytest.raises(DatureConfigError):
             _ = getattr(config, attr)
+
+
+@pytest.mark.usefixtures("_reset_config")
+class TestBootstrap:
+    @staticmethod
+    def test_known_keys_skip_full_loader(monkeypatch: pytest.MonkeyPatch) -> None:
+        def _fail(*_args: object, **_kwargs: object) -> None:
+            pytest.fail("full loader should not run")
+
+        monkeypatch.setattr(main, "load", _fail)
+        monkeypatch.setenv("DATURE_LOADING__DEBUG", "true")
+        monkeypatch.setenv("DATURE_MASKING__MIN_VISIBLE_CHARS", "4")
+        monkeypatch.setenv("DATURE_MASKING__SECRET_FIELD_NAMES", '["token"]')
+        _ConfigProxy.set_instance(None)
+
+        assert config.loading == LoadingConfig(debug=True)
+        assert config.masking == MaskingConfig(min_visible_chars=4, secret_field_names=("token",))
+
+    @staticmethod
+    def test_env_expansion_falls_back_to_full_loader(monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("MASK", "#")
+        monkeypatch.setenv("DATURE_MASKING__MASK_CHAR", "${MASK}")
+        _ConfigProxy.set_instance(None)
+
+        assert config.masking.mask_char == "#"
+
+    @staticmethod
+    def test_other_spellings_fall_back_to_full_loader(monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DATURE_loading__debug", "true")
+        _ConfigProxy.set_instance(None)
+
+        assert config.loading.debug is True
@@ -0,0 +1,142 @@
+import socket
+import stat
+import threading
+import time
+from collections.abc import Generator
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from dature import LoadMetadata, load
+from dature.config_server import ConfigServer
+from dature.errors.exceptions import DatureConfigError
+from dature.sources_loader.socket_ import SUBSCRIBE_REQUEST, SocketLoader, fetch_snapshot, watch_socket
+
+
+@dataclass
+class Database:
+    host: str
+    port: int
+
+
+@dataclass
+class Config:
+    name: str
+    debug: bool
+    released: date
+    database: Database
+
+
+@pytest.fixture
+def sources(tmp_path: Path) -> tuple[LoadMetadata, LoadMetadata]:
+    defaults = tmp_path / "defaults.yaml"
+    defaults.write_text("name: app\ndebug: false\nreleased: 2024-05-01\ndatabase:\n  host: localhost\n  port: 5432\n")
+    overrides = tmp_path / "overrides.yaml"
+    overrides.write_text("database:\n  host: db.internal\n")
+    return LoadMetadata(file_=str(defaults)), LoadMetadata(file_=str(overrides))
+
+
+@pytest.fixture
+def server(tmp_path: Path, sources: tuple[LoadMetadata, LoadMetadata]) -> Generator[ConfigServer[Config]]:
+    with ConfigServer(sources, Config, socket_path=tmp_path / "config.sock") as config_server:
+        yield config_server
+
+
+def test_client_converts_merged_data(server: ConfigServer[Config]) -> None:
+    result = load(LoadMetadata(file_=str(server.socket_path), loader=SocketLoader), Config)
+
+    assert result == Config(
+        name="app",
+        debug=False,
+        released=date(2024, 5, 1),
+        database=Database(host="db.internal", port=5432),
+    )
+
+
+def test_client_prefix(server: ConfigServer[Config]) -> None:
+    result = load(LoadMetadata(file_=str(server.socket_path), loader=SocketLoader, prefix="database"), Database)
+
+    assert result == Database(host="db.internal", port=5432)
+
+
+def test_reload_pushes_only_changes(tmp_path: Path, server: ConfigServer[Config]) -> None:
+    pushed = threading.Event()
+    versions: list[str] = []
+
+    def _listener(_path: Path, version: str) -> None:
+        versions.append(version)
+        pushed.set()
+
+    unsubscribe = watch_socket(server.socket_path, _listener)
+    try:
+        initial = server.version
+        assert server.reload() is False
+
+        (tmp_path / "overrides.yaml").write_text("database:\n  port: 6432\n")
+        assert server.reload() is True
+        assert pushed.wait(timeout=5)
+
+        assert versions == [server.version]
+        assert server.version != initial
+        result = load(LoadMetadata(file_=str(server.socket_path), loader=SocketLoader), Config)
+        assert result.database == Database(host="localhost", port=6432)
+    finally:
+        unsubscribe()
+
+
+def test_stuck_subscriber_is_dropped(
+    tmp_path: Path,
+    server: ConfigServer[Config],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("dature.config_server._SEND_TIMEOUT", 0.2)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stuck:
+        stuck.connect(str(server.socket_path))
+        stuck.sendall(SUBSCRIBE_REQUEST)
+        # A push far larger than the socket buffers, which the client never reads
+        (tmp_path / "overrides.yaml").write_text(f"name: {'x' * 1_000_000}\n")
+
+        reloaded = threading.Thread(target=server.reload)
+        reloaded.start()
+        reloaded.join(timeout=5)
+
+        assert not reloaded.is_alive()
+        deadline = time.monotonic() + 5
+        while server._subscribers and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert server._subscribers == []
+
+
+def test_failed_reload_keeps_snapshot(tmp_path: Path, server: ConfigServer[Config]) -> None:
+    before = server.version
+    (tmp_path / "overrides.yaml").write_text("database:\n  port: not-a-port\n")
+
+    with pytest.raises(DatureConfigError):
+        server.reload()
+
+    assert fetch_snapshot(server.socket_path).version == before
+
+
+def test_live_socket_is_not_taken_over(
+    server: ConfigServer[Config],
+    sources: tuple[LoadMetadata, LoadMetadata],
+) -> None:
+    second = ConfigServer(sources, Config, socket_path=server.socket_path)
+
+    with pytest.raises(FileExistsError):
+        second.start()
+
+
+def test_socket_is_private(tmp_path: Path, server: ConfigServer[Config]) -> None:
+    assert stat.S_IMODE(server.socket_path.stat().st_mode) == 0o600
+    assert [path.name for path in tmp_path.iterdir() if path.name.startswith(".dature-")] == []
+
+
+def test_close_removes_socket(tmp_path: Path, sources: tuple[LoadMetadata, LoadMetadata]) -> None:
+    socket_path = tmp_path / "config.sock"
+    with ConfigServer(sources, Config, socket_path=socket_path):
+        assert socket_path.exists()
+
+    assert not socket_path.exists()
@@ -0,0 +1,142 @@
+from collections.abc import Generator
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from dature import LoadMetadata, MergeMetadata, configure, load
+from dature.hooks import LoadHook, PhaseEvent, registered_hooks
+
+
+class RecordingHook(LoadHook):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, PhaseEvent]] = []
+
+    def on_start(self, event: PhaseEvent) -> None:
+        self.events.append(("start", event))
+
+    def on_end(self, event: PhaseEvent) -> None:
+        self.events.append(("end", event))
+
+    def ended(self) -> list[PhaseEvent]:
+        return [event for kind, event in self.events if kind == "end"]
+
+
+@pytest.fixture
+def hook() -> Generator[RecordingHook]:
+    recording = RecordingHook()
+    configure(hooks=(recording,))
+    yield recording
+    configure(hooks=())
+
+
+@dataclass
+class Config:
+    host: str
+    port: int
+
+
+class TestHooks:
+    def test_single_source_events(self, tmp_path: Path, hook: RecordingHook):
+        json_file = tmp_path / "config.json"
+        content = '{"host": "localhost", "port": 8080}'
+        json_file.write_text(content)
+
+        load(LoadMetadata(file_=str(json_file)), Config)
+
+        assert [(kind, event.phase) for kind, event in hook.events] == [
+            ("start", "config"),
+            ("start", "load"),
+            ("end", "load"),
+            ("start", "pre_processing"),
+            ("end", "pre_processing"),
+            ("start", "validation"),
+            ("end", "validation"),
+            ("start", "conversion"),
+            ("end", "conversion"),
+            ("end", "config"),
+        ]
+        load_end = hook.ended()[0]
+        assert load_end.dataclass_name == "Config"
+        assert load_end.attributes == {
+            "loader": "json",
+            "file_path": str(json_file),
+            "bytes_read": len(content),
+            "keys": 2,
+        }
+        assert load_end.seconds is not None
+        assert load_end.error is None
+
+    def test_start_and_end_share_span_id(self, tmp_path: Path, hook: RecordingHook):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+
+        load(LoadMetadata(file_=str(json_file)), Config)
+
+        starts = [event.span_id for kind, event in hook.events if kind == "start"]
+        ends = [event.span_id for kind, event in hook.events if kind == "end"]
+        assert sorted(starts) == sorted(ends)
+        assert len(set(starts)) == len(starts)
+
+    def test_merge_events_carry_source_index(self, tmp_path: Path, hook: RecordingHook):
+        defaults = tmp_path / "defaults.json"
+        defaults.write_text('{"host": "localhost", "port": 3000}')
+        overrides = tmp_path / "overrides.json"
+        overrides.write_text('{"port": 8080}')
+
+        load(MergeMetadata(sources=(LoadMetadata(file_=str(defaults)), LoadMetadata(file_=str(overrides)))), Config)
+
+        loads = [event for event in hook.ended() if event.phase == "load"]
+        assert [(event.source_index, event.attributes["file_path"]) for event in loads] == [
+            (0, str(defaults)),
+            (1, str(overrides)),
+        ]
+        merge = next(event for event in hook.ended() if event.phase == "merge")
+        assert merge.attributes == {"strategy": "last_wins", "sources": 2, "bytes_read": None, "keys": 2}
+
+    def test_cache_hit(self, tmp_path: Path, hook: RecordingHook):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+
+        @load(LoadMetadata(file_=str(json_file)))
+        @dataclass
+        class Cached:
+            host: str
+            port: int
+
+        Cached()
+        Cached()
+
+        configs = [event.attributes["cache_hit"] for event in hook.ended() if event.phase == "config"]
+        assert configs == [False, True]
+
+    def test_error_reported(self, tmp_path: Path, hook: RecordingHook):
+        json_file = tmp_path / "config.json"
+        json_file.write_text("{broken")
+
+        with pytest.raises(Exception):  # noqa: B017, PT011
+            load(LoadMetadata(file_=str(json_file)), Config)
+
+        load_end = next(event for event in hook.ended() if event.phase == "load")
+        assert load_end.error is not None
+
+    def test_failing_hook_does_not_break_load(self, tmp_path: Path):
+        class Broken(LoadHook):
+            def on_start(self, event: PhaseEvent) -> None:
+                raise RuntimeError(event.phase)
+
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+
+        configure(hooks=(Broken(),))
+        try:
+            result = load(LoadMetadata(file_=str(json_file)), Config)
+        finally:
+            configure(hooks=())
+
+        assert result == Config(host="localhost", port=8080)
+
+    def test_configure_without_hooks_keeps_them(self, hook: RecordingHook):
+        configure()
+
+        assert registered_hooks() == (hook,)
@@ -0,0 +1,53 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_PREFIXES = ("adaptix", "dature.loading", "dature.sources_loader", "dature.masking", "dature.errors")
+
+
+def _imported_modules(statement: str) -> set[str]:
+    env = os.environ.copy()
+    project_root = pathlib.Path(__file__).parent.parent / "src"
+    env["PYTHONPATH"] = str(project_root) + os.pathsep + env.get("PYTHONPATH", "")
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        name = line.rsplit("|", 1)[-1].strip()
+        if name != "imported package":
+            modules.add(name)
+    return modules
+
+
+class TestImportTime:
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import dature",
+            "from dature import LoadMetadata, MergeMetadata, MergeStrategy, F",
+        ],
+    )
+    def test_metadata_import_skips_loading_machinery(self, statement: str):
+        modules = _imported_modules(statement)
+
+        assert "dature" in modules
+        assert sorted(name for name in modules if name.startswith(_HEAVY_PREFIXES)) == []
+
+    def test_load_imports_on_access(self):
+        modules = _imported_modules("from dature import load")
+
+        assert "dature.loading.single" in modules
+        assert "adaptix" in modules
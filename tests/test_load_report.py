@@ -1,8 +1,10 @@
 """Tests for LoadReport and debug logging."""
 
+import copy
 import logging
+import pickle
 import warnings
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
 from typing import Annotated
 
@@ -524,3 +526,117 @@ class TestLoadReportOnError:
             merged_data={"port": -1},
         )
         assert expected == get_load_report(Config)
+
+
+class TestLoadReportMasking:
+    def test_raw_data_kept_and_masked_on_read(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "db", "db": {"password": "hunter2"}}')
+
+        @dataclass
+        class Database:
+            password: str
+
+        @dataclass
+        class Config:
+            host: str
+            db: Database
+
+        result = load(LoadMetadata(file_=str(json_file)), Config, debug=True)
+        report = get_load_report(result)
+
+        assert report is not None
+        assert report._merged_data == {"host": "db", "db": {"password": "hunter2"}}
+        assert report.merged_data == {"host": "db", "db": {"password": "hu*****r2"}}
+        assert report.sources[0].raw_data == {"host": "db", "db": {"password": "hu*****r2"}}
+        assert {origin.key: origin.value for origin in report.field_origins} == {
+            "host": "db",
+            "db": {"password": "hu*****r2"},
+        }
+        assert "hunter2" not in repr(report)
+
+    def test_read_only(self):
+        report = LoadReport(dataclass_name="Config", strategy=None, sources=(), field_origins=(), merged_data={})
+
+        with pytest.raises(AttributeError):
+            report.dataclass_name = "Other"  # type: ignore[misc]
+
+    def test_generic_serialization_stays_masked(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "db", "password": "hunter2"}')
+
+        @dataclass
+        class Config:
+            host: str
+            password: str
+
+        result = load(LoadMetadata(file_=str(json_file)), Config, debug=True)
+        report = get_load_report(result)
+
+        assert report is not None
+        assert [field.name for field in fields(report)] == ["dataclass_name", "strategy", "secret_paths", "stats"]
+        assert "hunter2" not in repr(asdict(report))
+        for copied in (copy.copy(report), copy.deepcopy(report), pickle.loads(pickle.dumps(report))):  # noqa: S301
+            assert copied == report
+            assert "hunter2" not in repr(copied._merged_data)
+            assert "hunter2" not in repr(copied._sources)
+
+
+class TestLoadReportOriginLookup:
+    @pytest.fixture
+    def report(self, tmp_path: Path) -> LoadReport:
+        defaults = tmp_path / "defaults.json"
+        defaults.write_text('{"db": {"host": "localhost", "port": 5432}, "db_name": "app"}')
+
+        overrides = tmp_path / "overrides.json"
+        overrides.write_text('{"db": {"port": 6432}}')
+
+        @dataclass
+        class Database:
+            host: str
+            port: int
+
+        @dataclass
+        class Config:
+            db: Database
+            db_name: str
+
+        result = load(
+            MergeMetadata(sources=(LoadMetadata(file_=str(defaults)), LoadMetadata(file_=str(overrides)))),
+            Config,
+            debug=True,
+        )
+        report = get_load_report(result)
+        assert report is not None
+        return report
+
+    def test_origin_of(self, report: LoadReport, tmp_path: Path):
+        assert report.origin_of("db.port") == FieldOrigin(
+            key="db.port",
+            value=6432,
+            source_index=1,
+            source_file=str(tmp_path / "overrides.json"),
+            source_loader_type="json",
+        )
+        assert report.origin_of("db") is None
+        assert report.origin_of("missing") is None
+
+    def test_origins_under(self, report: LoadReport):
+        assert [origin.key for origin in report.origins_under("db")] == ["db.host", "db.port"]
+        assert [origin.key for origin in report.origins_under("db_name")] == ["db_name"]
+        assert [origin.key for origin in report.origins_under("")] == ["db.host", "db.port", "db_name"]
+
+    def test_secret_masked(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"password": "hunter2"}')
+
+        @dataclass
+        class Config:
+            password: str
+
+        report = get_load_report(load(LoadMetadata(file_=str(json_file)), Config, debug=True))
+
+        assert report is not None
+        origin = report.origin_of("password")
+        assert origin is not None
+        assert origin.value == "hu*****r2"
@@ -0,0 +1,152 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated
+
+import pytest
+
+from dature import LoadMetadata, MergeMetadata, get_load_report, get_load_stats, load
+from dature.errors.exceptions import DatureConfigError
+from dature.load_stats import LoadStats, PhaseTimer, load_stats_scope, stats_source
+from dature.validators.number import Ge
+
+
+@dataclass
+class Config:
+    host: str
+    port: int
+
+
+class TestLoadStats:
+    def test_single_source_phases(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        content = '{"host": "localhost", "port": 8080}'
+        json_file.write_text(content)
+
+        result = load(LoadMetadata(file_=str(json_file)), Config)
+        stats = get_load_stats(result)
+
+        assert stats is not None
+        assert [timing.phase for timing in stats.phases] == ["load", "pre_processing", "validation", "conversion"]
+        load_timing = stats.phases[0]
+        assert load_timing.bytes_read == len(content)
+        assert load_timing.keys == 2
+        assert load_timing.source_index is None
+        assert stats.total_seconds >= stats.phase_seconds("load") > 0
+
+    def test_merge_phases_per_source(self, tmp_path: Path):
+        defaults = tmp_path / "defaults.json"
+        defaults.write_text('{"host": "localhost", "port": 3000}')
+        overrides = tmp_path / "overrides.json"
+        overrides.write_text('{"port": 8080}')
+
+        result = load(
+            MergeMetadata(sources=(LoadMetadata(file_=str(defaults)), LoadMetadata(file_=str(overrides)))),
+            Config,
+        )
+        stats = get_load_stats(result)
+
+        assert stats is not None
+        assert [timing.phase for timing in stats.source_phases(1)] == ["load", "pre_processing"]
+        assert stats.source_phases(1)[0].keys == 1
+        assert [timing.phase for timing in stats.phases if timing.source_index is None] == [
+            "merge",
+            "conversion",
+            "validation",
+        ]
+
+    def test_skip_invalid_recorded(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": "abc"}')
+
+        @dataclass
+        class WithDefault:
+            host: str
+            port: int = 0
+
+        result = load(LoadMetadata(file_=str(json_file), skip_if_invalid=True), WithDefault)
+        stats = get_load_stats(result)
+
+        assert stats is not None
+        assert stats.phase_seconds("skip_invalid") > 0
+
+    def test_attached_to_report(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+
+        result = load(LoadMetadata(file_=str(json_file)), Config, debug=True)
+        report = get_load_report(result)
+
+        assert report is not None
+        assert report.stats is get_load_stats(result)
+
+    def test_attached_to_class_on_error(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"port": 0}')
+
+        @dataclass
+        class Strict:
+            port: Annotated[int, Ge(value=1)]
+
+        with pytest.raises(DatureConfigError):
+            load(LoadMetadata(file_=str(json_file)), Strict)
+
+        stats = get_load_stats(Strict)
+        assert stats is not None
+        assert stats.phase_seconds("validation") > 0
+
+    def test_decorator_reuses_stats_of_cached_load(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+
+        @load(LoadMetadata(file_=str(json_file)))
+        @dataclass
+        class Decorated:
+            host: str
+            port: int
+
+        first = Decorated()
+        second = Decorated()
+
+        assert get_load_stats(first) is get_load_stats(second) is get_load_stats(Decorated)
+
+    def test_slots_dataclass(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+
+        @dataclass(slots=True)
+        class Slotted:
+            host: str
+            port: int
+
+        result = load(LoadMetadata(file_=str(json_file)), Slotted)
+
+        assert result == Slotted(host="localhost", port=8080)
+        assert get_load_stats(result) is None
+
+
+class TestStatsScope:
+    def test_nested_scope_records_into_outer(self):
+        with load_stats_scope("Outer") as outer, load_stats_scope("Inner") as inner, PhaseTimer("merge"):
+            pass
+
+        assert inner is outer
+        assert [timing.phase for timing in outer.phases] == ["merge"]
+
+    def test_source_index(self):
+        with load_stats_scope("Config") as stats:
+            with stats_source(3), PhaseTimer("load"):
+                pass
+            with PhaseTimer("merge"):
+                pass
+
+        assert [timing.source_index for timing in stats.phases] == [3, None]
+
+    def test_timer_outside_scope_is_not_observed(self):
+        with load_stats_scope("Config") as stats:
+            pass
+        with PhaseTimer("load") as timer:
+            observed = timer.observed
+
+        assert observed is False
+        assert stats.phases == ()
+        assert isinstance(stats, LoadStats)
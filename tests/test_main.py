@@ -1,17 +1,28 @@
 """Tests for main.py — public load() API."""
 
-from dataclasses import dataclass, field
+import gc
+import json
+import os
+import threading
+from collections.abc import Generator
+from dataclasses import dataclass, field, make_dataclass
 from pathlib import Path
+from typing import Any
 
 import pytest
+from adaptix import Retort
 
-from dature import LoadMetadata, load
+from dature import LoadMetadata, MergeMetadata, load, load_many, preload, warmup
+from dature.loading.context import get_patch_context
+from dature.loading.single import make_decorator
+from dature.sources_loader.docker_secrets import DockerSecretsLoader
 from dature.sources_loader.env_ import EnvFileLoader
 from dature.sources_loader.ini_ import IniLoader
 from dature.sources_loader.json5_ import Json5Loader
 from dature.sources_loader.json_ import JsonLoader
 from dature.sources_loader.toml_ import Toml10Loader, Toml11Loader
 from dature.sources_loader.yaml_ import Yaml11Loader, Yaml12Loader
+from dature.types import JSONValue
 
 
 def _all_file_loaders() -> list[type]:
@@ -142,6 +153,310 @@ class TestCache:
         assert second.name == "updated"
 
 
+class TestLazy:
+    def test_decoration_builds_nothing(self, tmp_path: Path) -> None:
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+        loader = JsonLoader()
+
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        make_decorator(
+            loader_instance=loader,
+            file_path=json_file,
+            metadata=LoadMetadata(file_=str(json_file)),
+            cache=True,
+            debug=False,
+            lazy=True,
+        )(Config)
+
+        assert loader.retorts == {}
+
+        result = Config()
+
+        assert Config in loader.retorts
+        assert result == Config(name="original", port=8080)
+
+    def test_lazy_merge(self, tmp_path: Path) -> None:
+        defaults = tmp_path / "defaults.json"
+        defaults.write_text('{"name": "default", "port": 8080}')
+        overrides = tmp_path / "overrides.json"
+        overrides.write_text('{"port": 9090}')
+
+        @load(MergeMetadata(sources=(LoadMetadata(file_=str(defaults)), LoadMetadata(file_=str(overrides)))), lazy=True)
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        assert get_patch_context(Config).prepared is False
+
+        assert Config().port == 9090
+
+    def test_lazy_prepare_keeps_patched_init(self, tmp_path: Path) -> None:
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+        preparing = threading.Event()
+        release = threading.Event()
+
+        class SlowLoader(JsonLoader):
+            def create_validating_retort(self, dataclass_: type[Any]) -> Retort:
+                preparing.set()
+                release.wait(timeout=5)
+                return super().create_validating_retort(dataclass_)
+
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        make_decorator(
+            loader_instance=SlowLoader(),
+            file_path=json_file,
+            metadata=LoadMetadata(file_=str(json_file)),
+            cache=True,
+            debug=False,
+            lazy=True,
+        )(Config)
+        patched_init = Config.__init__
+
+        results: list[Config] = []
+        first = threading.Thread(target=lambda: results.append(Config()))
+        first.start()
+        try:
+            assert preparing.wait(timeout=5)
+            assert Config.__init__ is patched_init
+            second = threading.Thread(target=lambda: results.append(Config()))
+            second.start()
+        finally:
+            release.set()
+            first.join()
+        second.join()
+
+        assert results == [Config(name="original", port=8080)] * 2
+
+    def test_warmup(self, tmp_path: Path) -> None:
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+
+        @load(LoadMetadata(file_=str(json_file)), lazy=True)
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        warmup(Config)
+
+        assert get_patch_context(Config).prepared is True
+        assert Config().name == "original"
+
+    def test_warmup_rejects_undecorated_class(self) -> None:
+        @dataclass
+        class Config:
+            name: str
+
+        with pytest.raises(TypeError, match="Config is not decorated with @load"):
+            warmup(Config)
+
+
+def _private_kib() -> int:
+    """USS of the current process: pages that only this process maps."""
+    total = 0
+    with Path("/proc/self/smaps_rollup").open() as smaps:
+        for line in smaps:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+def _child_private_growth_kib(cls: type[Any]) -> int:
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # The child must never return into the parent's pytest run, even when it fails
+        status = 1
+        try:
+            before = _private_kib()
+            for _ in range(5):
+                cls()
+            gc.collect()
+            os.write(write_fd, str(_private_kib() - before).encode())
+            status = 0
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    with os.fdopen(read_fd) as pipe:
+        return int(pipe.read())
+
+
+@pytest.fixture
+def _unfreeze_gc() -> Generator[None]:
+    yield
+    gc.unfreeze()
+
+
+@pytest.mark.usefixtures("_unfreeze_gc")
+class TestPreload:
+    def test_prepares_and_caches(self, tmp_path: Path) -> None:
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+
+        @load(LoadMetadata(file_=str(json_file)), lazy=True)
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        preload(Config)
+        json_file.write_text('{"name": "changed", "port": 9090}')
+
+        assert get_patch_context(Config).prepared is True
+        assert Config().name == "original"
+        assert gc.get_freeze_count() > 0
+
+    def test_rejects_undecorated_class(self) -> None:
+        @dataclass
+        class Config:
+            name: str
+
+        with pytest.raises(TypeError, match="Config is not decorated with @load"):
+            preload(Config)
+
+    @pytest.mark.skipif(not Path("/proc/self/smaps_rollup").exists(), reason="needs Linux smaps_rollup")
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+    def test_forked_children_share_preloaded_pages(self, tmp_path: Path) -> None:
+        json_file = tmp_path / "config.json"
+        json_file.write_text(json.dumps({f"field_{i}": i for i in range(200)}))
+        metadata = LoadMetadata(file_=str(json_file))
+
+        def _wide_config() -> type[Any]:
+            return load(metadata, lazy=True)(make_dataclass("Wide", [(f"field_{i}", int) for i in range(200)]))
+
+        lazy_growth = _child_private_growth_kib(_wide_config())
+
+        preloaded_class = _wide_config()
+        preload(preloaded_class)
+        preloaded_growth = _child_private_growth_kib(preloaded_class)
+
+        assert preloaded_growth * 4 < lazy_growth
+
+
+class TestLoadMany:
+    @pytest.fixture
+    def parse_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        calls: list[Path] = []
+        original = Yaml12Loader._load
+
+        def _counting(loader: Yaml12Loader, path: Path) -> JSONValue:
+            calls.append(path)
+            return original(loader, path)
+
+        monkeypatch.setattr(Yaml12Loader, "_load", _counting)
+        return calls
+
+    def test_parses_file_once(self, tmp_path: Path, parse_calls: list[Path]) -> None:
+        yaml_file = tmp_path / "app.yaml"
+        yaml_file.write_text("app:\n  db:\n    host: localhost\n    port: 5432\n  cache:\n    ttl: 60\n")
+
+        @dataclass
+        class Db:
+            host: str
+            port: int
+
+        @dataclass
+        class Cache:
+            ttl: int
+
+        sections = load_many(LoadMetadata(file_=str(yaml_file), prefix="app"), {"db": Db, "cache": Cache})
+
+        assert sections == {"db": Db(host="localhost", port=5432), "cache": Cache(ttl=60)}
+        assert parse_calls == [yaml_file]
+
+    def test_decorated_classes_share_parse_in_preload(
+        self,
+        tmp_path: Path,
+        parse_calls: list[Path],
+    ) -> None:
+        yaml_file = tmp_path / "app.yaml"
+        yaml_file.write_text("db:\n  host: localhost\ncache:\n  ttl: 60\n")
+
+        @load(LoadMetadata(file_=str(yaml_file), prefix="db"), lazy=True)
+        @dataclass
+        class Db:
+            host: str
+
+        @load(LoadMetadata(file_=str(yaml_file), prefix="cache"), lazy=True)
+        @dataclass
+        class Cache:
+            ttl: int
+
+        try:
+            preload(Db, Cache)
+        finally:
+            gc.unfreeze()
+
+        assert (Db().host, Cache().ttl) == ("localhost", 60)
+        assert parse_calls == [yaml_file]
+
+    def test_subclass_must_opt_in_to_shared_parse(self, tmp_path: Path) -> None:
+        yaml_file = tmp_path / "app.yaml"
+        yaml_file.write_text("db:\n  host: localhost\ncache:\n  ttl: 60\n")
+        loads: list[Path] = []
+
+        class CountingLoader(Yaml12Loader):
+            def _load(self, path: Path) -> JSONValue:
+                loads.append(path)
+                return super()._load(path)
+
+        @dataclass
+        class Db:
+            host: str
+
+        @dataclass
+        class Cache:
+            ttl: int
+
+        load_many(LoadMetadata(file_=str(yaml_file), loader=CountingLoader), {"db": Db, "cache": Cache})
+
+        assert loads == [yaml_file, yaml_file]
+
+    @pytest.mark.parametrize(
+        "metadata",
+        [
+            pytest.param(LoadMetadata(prefix="APP_"), id="env"),
+            pytest.param(LoadMetadata(file_="app.env"), id="envfile"),
+            pytest.param(LoadMetadata(file_="secrets", loader=DockerSecretsLoader), id="docker_secrets"),
+        ],
+    )
+    def test_rejects_flat_sources(self, metadata: LoadMetadata) -> None:
+        @dataclass
+        class Db:
+            host: str
+
+        with pytest.raises(ValueError, match="sources are flat"):
+            load_many(metadata, {"db": Db})
+
+    def test_reparses_outside_batch(self, tmp_path: Path, parse_calls: list[Path]) -> None:
+        yaml_file = tmp_path / "app.yaml"
+        yaml_file.write_text("db:\n  host: localhost\n")
+
+        @dataclass
+        class Db:
+            host: str
+
+        load_many(LoadMetadata(file_=str(yaml_file)), {"db": Db})
+        yaml_file.write_text("db:\n  host: db.internal\n")
+
+        assert load_many(LoadMetadata(file_=str(yaml_file)), {"db": Db}) == {"db": Db(host="db.internal")}
+        assert len(parse_calls) == 2
+
+
 class TestLoadAsFunction:
     def test_loads_from_file(self, tmp_path: Path) -> None:
         json_file = tmp_path / "config.json"
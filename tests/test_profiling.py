@@ -0,0 +1,152 @@
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from dature import F, FieldGroup, LoadMetadata, MergeMetadata, configure, load, profile
+from dature.errors.exceptions import DatureConfigError
+from dature.hooks import LoadHook, PhaseEvent, registered_hooks
+
+
+@dataclass
+class Config:
+    host: str
+    port: int
+
+
+@dataclass
+class Other:
+    host: str
+    port: int
+
+
+def _spans(trace_file: Path) -> list[dict]:
+    trace = json.loads(trace_file.read_text())
+    assert trace["displayTimeUnit"] == "ms"
+    return trace["traceEvents"]
+
+
+class TestProfile:
+    def test_single_source_trace(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+        trace_file = tmp_path / "trace.json"
+
+        result = profile(LoadMetadata(file_=str(json_file)), Config, out=trace_file)
+
+        assert result == Config(host="localhost", port=8080)
+        spans = _spans(trace_file)
+        assert [span["name"] for span in spans] == [
+            "load Config",
+            "load",
+            "pre_processing",
+            "validation",
+            "conversion",
+        ]
+        assert all(span["ph"] == "X" for span in spans)
+        assert spans[1]["args"] == {
+            "loader": "json",
+            "file_path": str(json_file),
+            "bytes_read": len(json_file.read_text()),
+            "keys": 2,
+            "dataclass_name": "Config",
+        }
+
+    def test_spans_nest_inside_config(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+        trace_file = tmp_path / "trace.json"
+
+        profile(LoadMetadata(file_=str(json_file)), Config, out=trace_file)
+
+        root, *children = _spans(trace_file)
+        for span in children:
+            assert root["ts"] <= span["ts"]
+            assert span["ts"] + span["dur"] <= root["ts"] + root["dur"]
+
+    def test_merge_trace(self, tmp_path: Path):
+        defaults = tmp_path / "defaults.json"
+        defaults.write_text('{"host": "localhost", "port": 3000}')
+        overrides = tmp_path / "overrides.json"
+        overrides.write_text('{"host": "db", "port": 8080}')
+        trace_file = tmp_path / "trace.json"
+
+        profile(
+            MergeMetadata(
+                sources=(LoadMetadata(file_=str(defaults)), LoadMetadata(file_=str(overrides))),
+                field_groups=(FieldGroup(F[Config].host, F[Config].port),),
+            ),
+            Config,
+            out=trace_file,
+        )
+
+        names = [span["name"] for span in _spans(trace_file)]
+        assert names == [
+            "load Config",
+            "load [source 0]",
+            "pre_processing [source 0]",
+            "load [source 1]",
+            "pre_processing [source 1]",
+            "merge",
+            "field_groups",
+            "merge_step",
+            "merge_step",
+            "conversion",
+            "validation",
+        ]
+
+    def test_trace_written_on_error(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": "abc"}')
+        trace_file = tmp_path / "trace.json"
+
+        with pytest.raises(DatureConfigError):
+            profile(LoadMetadata(file_=str(json_file)), Config, out=trace_file)
+
+        validation = next(span for span in _spans(trace_file) if span["name"] == "validation")
+        assert "error" in validation["args"]
+        assert registered_hooks() == ()
+
+    def test_keeps_configured_hooks(self, tmp_path: Path):
+        class Recording(LoadHook):
+            def __init__(self) -> None:
+                self.seen: list[tuple[str, tuple[LoadHook, ...]]] = []
+
+            def on_start(self, event: PhaseEvent) -> None:
+                self.seen.append((event.phase, registered_hooks()))
+
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+        hook = Recording()
+
+        configure(hooks=(hook,))
+        try:
+            profile(LoadMetadata(file_=str(json_file)), Config, out=tmp_path / "trace.json")
+            assert registered_hooks() == (hook,)
+        finally:
+            configure(hooks=())
+
+        assert hook.seen[0][0] == "config"
+        assert all(hooks == (hook,) for _, hooks in hook.seen)
+
+    def test_other_threads_are_not_traced(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080}')
+        trace_file = tmp_path / "trace.json"
+
+        class LoadInOtherThread(LoadHook):
+            def on_start(self, event: PhaseEvent) -> None:
+                if event.phase == "config" and event.dataclass_name == "Config":
+                    thread = threading.Thread(target=load, args=(LoadMetadata(file_=str(json_file)), Other))
+                    thread.start()
+                    thread.join()
+
+        configure(hooks=(LoadInOtherThread(),))
+        try:
+            profile(LoadMetadata(file_=str(json_file)), Config, out=trace_file)
+        finally:
+            configure(hooks=())
+
+        assert all(span["args"].get("dataclass_name") == "Config" for span in _spans(trace_file))
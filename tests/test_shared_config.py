@@ -0,0 +1,143 @@
+import multiprocessing
+import os
+import threading
+from collections.abc import Generator
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from dature import LoadMetadata
+from dature.errors.exceptions import DatureConfigError
+from dature.shared_config import _HEADER, SharedConfig
+
+
+@dataclass
+class Config:
+    host: str
+    port: int
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    path = tmp_path / "config.json"
+    path.write_text('{"host": "localhost", "port": 8080}')
+    return path
+
+
+@pytest.fixture
+def shared(config_file: Path) -> Generator[SharedConfig[Config]]:
+    with SharedConfig.create(LoadMetadata(file_=str(config_file)), Config) as shared_config:
+        yield shared_config
+
+
+def _worker_port(name: str) -> int:
+    with SharedConfig.attach(name, Config) as worker:
+        return worker.get().port
+
+
+def test_attach_reads_published_config(shared: SharedConfig[Config]) -> None:
+    with SharedConfig.attach(shared.name, Config) as worker:
+        assert worker.get() == Config(host="localhost", port=8080)
+        assert worker.version == 1
+
+
+def test_get_reuses_instance_until_version_changes(config_file: Path, shared: SharedConfig[Config]) -> None:
+    with SharedConfig.attach(shared.name, Config) as worker:
+        first = worker.get()
+        assert worker.get() is first
+
+        config_file.write_text('{"host": "localhost", "port": 9090}')
+        assert shared.reload() is True
+
+        assert worker.version == 2
+        assert worker.get() == Config(host="localhost", port=9090)
+
+
+def test_reload_without_changes(shared: SharedConfig[Config]) -> None:
+    assert shared.reload() is False
+    assert shared.version == 1
+
+
+def test_failed_reload_keeps_published_version(config_file: Path, shared: SharedConfig[Config]) -> None:
+    config_file.write_text('{"host": "localhost", "port": "not-a-port"}')
+
+    with pytest.raises(DatureConfigError):
+        shared.reload()
+
+    assert shared.get() == Config(host="localhost", port=8080)
+
+
+def test_payload_larger_than_capacity(config_file: Path, shared: SharedConfig[Config]) -> None:
+    config_file.write_text(f'{{"host": "{"x" * 200_000}", "port": 8080}}')
+
+    with pytest.raises(ValueError, match="larger capacity"):
+        shared.reload()
+
+    assert shared.version == 1
+
+
+def test_attached_worker_cannot_reload(shared: SharedConfig[Config]) -> None:
+    with SharedConfig.attach(shared.name, Config) as worker, pytest.raises(RuntimeError):
+        worker.reload()
+
+
+def test_reader_waits_for_a_slow_write(shared: SharedConfig[Config]) -> None:
+    buf = shared._segment.buf
+    sequence, length = _HEADER.unpack_from(buf)
+    _HEADER.pack_into(buf, 0, sequence + 1, 0)
+    finish = threading.Timer(0.05, _HEADER.pack_into, (buf, 0, sequence + 2, length))
+    finish.start()
+    try:
+        with SharedConfig.attach(shared.name, Config) as worker:
+            assert worker.get() == Config(host="localhost", port=8080)
+    finally:
+        finish.join()
+
+
+def test_dates_round_trip(tmp_path: Path) -> None:
+    @dataclass
+    class Release:
+        name: str
+        released: date
+
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("name: dature\nreleased: 2024-05-01\n")
+
+    with (
+        SharedConfig.create(LoadMetadata(file_=str(yaml_file)), Release) as shared,
+        SharedConfig.attach(shared.name, Release) as worker,
+    ):
+        assert worker.get() == Release(name="dature", released=date(2024, 5, 1))
+
+
+@pytest.mark.skipif(not hasattr(os, "fchmod"), reason="needs POSIX shared memory")
+def test_attach_rejects_segment_writable_by_others(shared: SharedConfig[Config]) -> None:
+    os.fchmod(shared._segment._fd, 0o666)
+
+    with pytest.raises(PermissionError, match="writable by other users"):
+        SharedConfig.attach(shared.name, Config)
+
+
+def test_forked_worker(shared: SharedConfig[Config]) -> None:
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        assert pool.apply(_worker_port, (shared.name,)) == 8080
+
+
+def test_worker_maps_field_names_like_the_master(tmp_path: Path) -> None:
+    @dataclass
+    class Server:
+        host_name: str
+        port: int
+
+    json_file = tmp_path / "config.json"
+    json_file.write_text('{"hostName": "localhost", "port": 8080}')
+    metadata = LoadMetadata(file_=str(json_file), name_style="lower_camel")
+
+    with (
+        SharedConfig.create(metadata, Server) as shared,
+        SharedConfig.attach(shared.name, Server, metadata) as worker,
+    ):
+        assert shared.get() == Server(host_name="localhost", port=8080)
+        assert worker.get() == Server(host_name="localhost", port=8080)
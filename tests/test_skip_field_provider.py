@@ -2,11 +2,14 @@
 
 from dataclasses import dataclass
 
+import pytest
 from adaptix import Retort
+from adaptix.load_error import LoadError
 
 from dature.skip_field_provider import (
     ModelToDictProvider,
     SkipFieldProvider,
+    filter_failed_fields,
     filter_invalid_fields,
 )
 
@@ -94,3 +97,80 @@ class TestFilterInvalidFields:
 
         assert result.cleaned_dict == "not a dict"
         assert result.skipped_paths == []
+
+
+def _load_error(retort: Retort, raw: dict, dataclass_: type) -> LoadError:
+    with pytest.raises(LoadError) as exc_info:
+        retort.load(raw, dataclass_)
+    return exc_info.value
+
+
+class TestFilterFailedFields:
+    def test_one_field_invalid(self):
+        @dataclass
+        class Config:
+            host: str
+            port: int
+
+        raw = {"host": "localhost", "port": "abc"}
+        exc = _load_error(Retort(strict_coercion=False), raw, Config)
+        result = filter_failed_fields(raw, exc, None)
+
+        assert result.cleaned_dict == {"host": "localhost"}
+        assert result.skipped_paths == ["port"]
+
+    def test_nested_field_invalid(self):
+        @dataclass
+        class Database:
+            host: str
+            port: int
+
+        @dataclass
+        class Config:
+            db: Database
+
+        raw = {"db": {"host": "localhost", "port": "abc"}}
+        exc = _load_error(Retort(strict_coercion=False), raw, Config)
+        result = filter_failed_fields(raw, exc, None)
+
+        assert result.cleaned_dict == {"db": {"host": "localhost"}}
+        assert result.skipped_paths == ["db.port"]
+
+    def test_missing_required_field_reported(self):
+        @dataclass
+        class Config:
+            host: str
+            port: int
+
+        raw = {"port": "abc"}
+        exc = _load_error(Retort(strict_coercion=False), raw, Config)
+        result = filter_failed_fields(raw, exc, None)
+
+        assert result.cleaned_dict == {}
+        assert sorted(result.skipped_paths) == ["host", "port"]
+
+    def test_list_item_error_not_skipped(self):
+        @dataclass
+        class Config:
+            ports: list[int]
+
+        raw = {"ports": [1, "abc"]}
+        exc = _load_error(Retort(strict_coercion=False), raw, Config)
+        result = filter_failed_fields(raw, exc, None)
+
+        assert result.cleaned_dict == {"ports": [1, "abc"]}
+        assert result.skipped_paths == []
+
+    def test_allowed_fields_restricts_skip(self):
+        @dataclass
+        class Config:
+            host: str
+            port: int
+            timeout: int
+
+        raw = {"host": "localhost", "port": "abc", "timeout": "bad"}
+        exc = _load_error(Retort(strict_coercion=False), raw, Config)
+        result = filter_failed_fields(raw, exc, {"port"})
+
+        assert result.cleaned_dict == {"host": "localhost", "timeout": "bad"}
+        assert result.skipped_paths == ["port"]
@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from pathlib import Path
+from textwrap import dedent
+from typing import Annotated
+
+import pytest
+
+from dature import LoadMetadata, load
+from dature.errors.exceptions import DatureConfigError
+from dature.field_path import F
+from dature.validators.number import Ge, Lt
+from dature.validators.override import OverrideValidator
+from dature.validators.root import RootValidator
+
+
+@pytest.fixture
+def validated_fields(monkeypatch: pytest.MonkeyPatch) -> list[set[str]]:
+    calls: list[set[str]] = []
+    original = OverrideValidator.validate
+
+    def _tracking(self, instance, field_names):
+        calls.append(set(field_names))
+        return original(self, instance, field_names)
+
+    monkeypatch.setattr(OverrideValidator, "validate", _tracking)
+    return calls
+
+
+class TestOverrideValidation:
+    def test_only_overridden_fields_validated(self, tmp_path: Path, validated_fields: list[set[str]]):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"host": "localhost", "port": 8080, "workers": 4}')
+
+        @load(LoadMetadata(file_=str(json_file)))
+        @dataclass
+        class Config:
+            host: str
+            port: Annotated[int, Ge(value=1)]
+            workers: int
+
+        Config()
+        result = Config("db.internal", port=9090)
+
+        assert validated_fields == [{"host", "port"}]
+        assert result == Config(host="db.internal", port=9090, workers=4)
+
+    def test_first_call_with_override_validates_everything(
+        self,
+        tmp_path: Path,
+        validated_fields: list[set[str]],
+    ):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"port": 8080, "workers": 4}')
+
+        @load(LoadMetadata(file_=str(json_file)))
+        @dataclass
+        class Config:
+            port: int
+            workers: int
+
+        Config(port=9090)
+
+        assert validated_fields == []
+
+    def test_annotated_validator(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        content = '{"port": 8080}'
+        json_file.write_text(content)
+
+        @load(LoadMetadata(file_=str(json_file)))
+        @dataclass
+        class Config:
+            port: Annotated[int, Ge(value=1)]
+
+        Config()
+        with pytest.raises(DatureConfigError) as exc_info:
+            Config(port=0)
+
+        assert str(exc_info.value) == dedent(f"""\
+            Config loading errors (1)
+
+              [port]  Value must be greater than or equal to 1
+               └── FILE '{json_file}', line 1
+                   {content}
+            """)
+
+    def test_metadata_validator(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        content = '{"port": 8080}'
+        json_file.write_text(content)
+
+        @dataclass
+        class Config:
+            port: int
+
+        load(LoadMetadata(file_=str(json_file), validators={F[Config].port: Lt(value=65536)}))(Config)
+
+        Config()
+        with pytest.raises(DatureConfigError) as exc_info:
+            Config(port=70000)
+
+        assert str(exc_info.value) == dedent(f"""\
+            Config loading errors (1)
+
+              [port]  Value must be less than 65536
+               └── FILE '{json_file}', line 1
+                   {content}
+            """)
+
+    def test_nested_override(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        content = '{"db": {"port": 5432}}'
+        json_file.write_text(content)
+
+        @dataclass
+        class Database:
+            port: Annotated[int, Ge(value=1)]
+
+        @load(LoadMetadata(file_=str(json_file)))
+        @dataclass
+        class Config:
+            db: Database
+
+        Config()
+        with pytest.raises(DatureConfigError) as exc_info:
+            Config(db=Database(port=0))
+
+        assert str(exc_info.value) == dedent(f"""\
+            Config loading errors (1)
+
+              [db.port]  Value must be greater than or equal to 1
+               └── FILE '{json_file}', line 1
+                   {content}
+            """)
+
+    def test_root_validator_sees_override(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"min_value": 1, "max_value": 10}')
+
+        @dataclass
+        class Config:
+            min_value: int
+            max_value: int
+
+        def _ordered(obj: Config) -> bool:
+            return obj.min_value < obj.max_value
+
+        load(LoadMetadata(file_=str(json_file), root_validators=(RootValidator(func=_ordered),)))(Config)
+
+        Config()
+        with pytest.raises(DatureConfigError) as exc_info:
+            Config(min_value=20)
+
+        assert str(exc_info.value) == dedent(f"""\
+            Config loading errors (1)
+
+              [<root>]  Root validation failed
+               └── FILE '{json_file}'
+            """)